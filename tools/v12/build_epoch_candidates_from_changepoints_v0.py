@@ -24,6 +24,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Tuple
 
+from evidence_io_v0 import evidence_exists, iter_projected, read_jsonl_record
+
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -76,24 +78,15 @@ def _std(xs: List[float]) -> float:
 
 def _read_world_u_from_run_dir(run_dir: Path) -> List[float]:
     p = run_dir / "interaction_impedance.jsonl"
-    if not p.exists():
+    if not evidence_exists(p):
         raise FileNotFoundError(f"missing required file: {p}")
     u: List[float] = []
-    with p.open("r", encoding="utf-8") as f:
-        for line in f:
-            s = line.strip()
-            if not s:
-                continue
-            rec = json.loads(s)
-            if not isinstance(rec, dict):
-                raise ValueError(f"invalid JSONL record in {p}")
-            metrics = rec.get("metrics")
-            if not isinstance(metrics, dict):
+    for ln, (uu,) in iter_projected(p, ("metrics.world_u",)):
+        if not _is_num(uu):
+            if not isinstance(read_jsonl_record(p, ln).get("metrics"), dict):
                 raise ValueError(f"missing metrics in {p}")
-            uu = metrics.get("world_u")
-            if not _is_num(uu):
-                raise ValueError(f"missing/invalid metrics.world_u in {p}")
-            u.append(float(uu))
+            raise ValueError(f"missing/invalid metrics.world_u in {p}")
+        u.append(float(uu))
     if len(u) < 1000:
         raise ValueError(f"N < 1000 (fail-closed): N={len(u)}")
     return u
@@ -20,24 +20,25 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Tuple
 
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
 
 
 def _safe_float(x: Any) -> float:
@@ -93,9 +94,9 @@ def _load_market_lv(market_snapshot_jsonl: Path) -> Dict[str, float]:
 def build(run_dir: Path, output_jsonl: Path) -> int:
     p_market = run_dir / "market_snapshot.jsonl"
     p_dt = run_dir / "decision_trace.jsonl"
-    if not p_market.exists():
+    if not evidence_exists(p_market):
         raise FileNotFoundError(f"missing: {p_market}")
-    if not p_dt.exists():
+    if not evidence_exists(p_dt):
         raise FileNotFoundError(f"missing: {p_dt}")
 
     lv_by_id = _load_market_lv(p_market)
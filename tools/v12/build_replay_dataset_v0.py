@@ -4,6 +4,15 @@ Build a Replay Dataset v0 directory from a Quant run_dir (stdlib only).
 
 This is a packaging tool for offline replay (replay_truth baseline).
 It DOES NOT talk to exchanges. It only copies/verifies local evidence files.
+
+Each source file is read once: the copy, its sha256, the strict-JSONL check,
+the record count, the inst_id / ts_utc range and the sparse ts_utc index
+(market_snapshot.ts_index.json, see replay_dataset_io_v0) all come from the
+same pass (rotated / compressed source segments are packaged as one plain file).
+Optional JSONL files that already carry a strict certificate (evidence_io_v0
+sidecar) are copied kernel-side without being read at all.
+Files are staged under <output_root>/.tmp_build_replay_* and moved into the
+dataset dir only after every check passed.
 """
 
 from __future__ import annotations
@@ -11,97 +20,130 @@ from __future__ import annotations
 import argparse
 import hashlib
 import json
+import os
+import shutil
 import sys
+import tempfile
 from datetime import datetime, timezone
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from evidence_io_v0 import (
+    cache_enabled,
+    copy_file_kernel,
+    evidence_exists,
+    jsonl_segments,
+    read_strict_certificate,
+    tee_jsonl,
+    write_strict_certificate,
+)
+from replay_dataset_io_v0 import DEFAULT_TS_INDEX_STRIDE, TS_INDEX_NAME, compact_ts, ts_index_entry, write_ts_index
 
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _read_json(path: Path) -> Dict[str, Any]:
-    with path.open("r", encoding="utf-8") as f:
-        obj = json.load(f)
+def _loads_object(raw: bytes, name: str) -> Dict[str, Any]:
+    obj = json.loads(raw.decode("utf-8"))
     if not isinstance(obj, dict):
-        raise ValueError(f"{path.name} must be a JSON object")
+        raise ValueError(f"{name} must be a JSON object")
     return obj
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
-def _count_jsonl(path: Path) -> int:
+def _snapshot_summary(
+    stride: int, rows: Iterable[Tuple[int, Dict[str, Any], int]]
+) -> Tuple[int, Optional[str], List[List[Any]]]:
+    # everything build_dataset needs from market_snapshot.jsonl, collected during the copy pass
     n = 0
-    for _ln, _rec in _iter_jsonl(path):
+    inst_id: Optional[str] = None
+    index: List[List[Any]] = []
+    for ln, rec, offset in rows:
+        if n % stride == 0:
+            index.append(ts_index_entry(n, ln, offset, rec.get("ts_utc")))
         n += 1
-    return n
-
-
-def _sha256_file(path: Path) -> str:
-    h = hashlib.sha256()
-    with path.open("rb") as f:
-        for chunk in iter(lambda: f.read(1024 * 1024), b""):
-            h.update(chunk)
-    return h.hexdigest()
-
-
-def _copy_file(src: Path, dst: Path) -> None:
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    # Avoid shutil dependency quirks; do a streaming copy.
-    with src.open("rb") as fsrc, dst.open("wb") as fdst:
-        for chunk in iter(lambda: fsrc.read(1024 * 1024), b""):
-            fdst.write(chunk)
-
-
-def _compact_ts(ts: str) -> str:
-    # Best-effort; keep original if unknown format.
-    s = ts.strip()
-    return (
-        s.replace("-", "")
-        .replace(":", "")
-        .replace(".000", "")
-        .replace(".000000", "")
-        .replace("+00:00", "Z")
-    )
-
-
-def build_dataset(source_run_dir: Path, output_root: Path, dataset_id: str | None, tick_interval_ms: int | None) -> Path:
-    required = ["market_snapshot.jsonl"]
-    for name in required:
-        if not (source_run_dir / name).exists():
-            raise FileNotFoundError(f"missing required source file: {name}")
-
-    # Strict-jsonl + infer inst_id and tick count
-    inst_id: str | None = None
-    for _ln, rec in _iter_jsonl(source_run_dir / "market_snapshot.jsonl"):
         if inst_id is None:
             v = rec.get("inst_id")
             if isinstance(v, str) and v:
                 inst_id = v
-        # We do not fully validate E schema here (verifier does it); only ensure strict JSONL.
+    return n, inst_id, index
+
+
+def _stage_jsonl(src: Path, staged: Path) -> Tuple[int, str]:
+    """(record_count, sha256) of a strict-JSONL source copied to `staged`."""
+    single = cache_enabled() and jsonl_segments(src) == [src]
+    cert = read_strict_certificate(src) if single else None
+    if cert is not None:
+        # already strict-checked and hashed: the copy can stay in the kernel
+        copy_file_kernel(src, staged)
+        return int(cert["records"]), str(cert["source"]["sha256"])
+    st = src.stat() if single else None
+    with staged.open("wb") as sink:
+        rc, digest = tee_jsonl(src, sink=sink)
+    if st is not None:
+        st2 = src.stat()
+        if st2.st_size == st.st_size and st2.st_mtime_ns == st.st_mtime_ns:
+            source = {"path": str(src), "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": digest}
+            write_strict_certificate(src, source, rc)
+    return rc, digest
+
+
+def build_dataset(
+    source_run_dir: Path,
+    output_root: Path,
+    dataset_id: str | None,
+    tick_interval_ms: int | None,
+    ts_index_stride: int = DEFAULT_TS_INDEX_STRIDE,
+) -> Path:
+    required = ["market_snapshot.jsonl"]
+    for name in required:
+        if not evidence_exists(source_run_dir / name):
+            raise FileNotFoundError(f"missing required source file: {name}")
+
+    output_root = output_root.expanduser().resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".tmp_build_replay_", dir=output_root))
+    try:
+        return _build_staged(source_run_dir, output_root, staging, dataset_id, tick_interval_ms, ts_index_stride)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _build_staged(
+    source_run_dir: Path,
+    output_root: Path,
+    staging: Path,
+    dataset_id: str | None,
+    tick_interval_ms: int | None,
+    ts_index_stride: int,
+) -> Path:
+    files: Dict[str, Any] = {}
+
+    # Strict-jsonl + infer inst_id, tick count and ts index (same pass as copy + sha256).
+    # We do not fully validate E schema here (verifier does it); only ensure strict JSONL.
+    with (staging / "market_snapshot.jsonl").open("wb") as sink:
+        summary, digest = tee_jsonl(
+            source_run_dir / "market_snapshot.jsonl", partial(_snapshot_summary, ts_index_stride), sink, offsets=True
+        )
+        size = sink.tell()
+    tick_count, inst_id, ts_index = summary
     if inst_id is None:
         inst_id = "UNKNOWN"
-
-    tick_count = _count_jsonl(source_run_dir / "market_snapshot.jsonl")
     if tick_count <= 0:
         raise ValueError("market_snapshot.jsonl is empty (no records)")
+    files["market_snapshot.jsonl"] = {"path": "market_snapshot.jsonl", "sha256": digest, "record_count": tick_count}
+    files[TS_INDEX_NAME] = {
+        "path": TS_INDEX_NAME,
+        "sha256": write_ts_index(staging / TS_INDEX_NAME, ts_index, ts_index_stride, tick_count, size, digest),
+        "record_count": None,
+    }
 
     source_manifest_path = source_run_dir / "run_manifest.json"
-    source_manifest: Dict[str, Any] = _read_json(source_manifest_path) if source_manifest_path.exists() else {}
+    source_manifest_raw = source_manifest_path.read_bytes() if source_manifest_path.exists() else None
+    source_manifest: Dict[str, Any] = (
+        _loads_object(source_manifest_raw, source_manifest_path.name) if source_manifest_raw is not None else {}
+    )
 
     # Infer tick_interval_ms from manifest when possible
     inferred_tick_ms = None
@@ -124,45 +166,34 @@ def build_dataset(source_run_dir: Path, output_root: Path, dataset_id: str | Non
             end_utc = eu
 
     if dataset_id is None:
-        s0 = _compact_ts(start_utc) if start_utc else "UNKNOWN_START"
-        s1 = _compact_ts(end_utc) if end_utc else "UNKNOWN_END"
+        s0 = compact_ts(start_utc) if start_utc else "UNKNOWN_START"
+        s1 = compact_ts(end_utc) if end_utc else "UNKNOWN_END"
         dataset_id = f"dataset_replay_v0_{inst_id}_{s0}_{s1}_{tick_ms}ms"
 
+    # Optional files (copy + sha256 + strict count in one read; kernel copy when certified)
+    optional = []
+    if evidence_exists(source_run_dir / "okx_api_calls.jsonl"):
+        optional.append("okx_api_calls.jsonl")
+    elif evidence_exists(source_run_dir / "exchange_api_calls.jsonl"):
+        optional.append("exchange_api_calls.jsonl")
+    if evidence_exists(source_run_dir / "errors.jsonl"):
+        optional.append("errors.jsonl")
+    for opt in optional:
+        rc, digest = _stage_jsonl(source_run_dir / opt, staging / opt)
+        files[opt] = {"path": opt, "sha256": digest, "record_count": rc}
+
+    if source_manifest_raw is not None:
+        (staging / "source_run_manifest.json").write_bytes(source_manifest_raw)
+        files["source_run_manifest.json"] = {
+            "path": "source_run_manifest.json",
+            "sha256": hashlib.sha256(source_manifest_raw).hexdigest(),
+            "record_count": None,
+        }
+
     dataset_dir = (output_root / dataset_id).expanduser().resolve()
     dataset_dir.mkdir(parents=True, exist_ok=True)
-
-    # Copy files
-    _copy_file(source_run_dir / "market_snapshot.jsonl", dataset_dir / "market_snapshot.jsonl")
-
-    if (source_run_dir / "okx_api_calls.jsonl").exists():
-        _copy_file(source_run_dir / "okx_api_calls.jsonl", dataset_dir / "okx_api_calls.jsonl")
-    elif (source_run_dir / "exchange_api_calls.jsonl").exists():
-        _copy_file(source_run_dir / "exchange_api_calls.jsonl", dataset_dir / "exchange_api_calls.jsonl")
-
-    if (source_run_dir / "errors.jsonl").exists():
-        _copy_file(source_run_dir / "errors.jsonl", dataset_dir / "errors.jsonl")
-
-    if source_manifest_path.exists():
-        _copy_file(source_manifest_path, dataset_dir / "source_run_manifest.json")
-
-    # Manifest
-    files: Dict[str, Any] = {}
-    ms_path = dataset_dir / "market_snapshot.jsonl"
-    files["market_snapshot.jsonl"] = {
-        "path": "market_snapshot.jsonl",
-        "sha256": _sha256_file(ms_path),
-        "record_count": _count_jsonl(ms_path),
-    }
-
-    for opt in ["okx_api_calls.jsonl", "exchange_api_calls.jsonl", "errors.jsonl", "source_run_manifest.json"]:
-        p = dataset_dir / opt
-        if p.exists():
-            if p.suffix == ".jsonl":
-                # Strict jsonl check by counting
-                rc = _count_jsonl(p)
-            else:
-                rc = None
-            files[opt] = {"path": opt, "sha256": _sha256_file(p), "record_count": rc}
+    for name in files:
+        os.replace(staging / name, dataset_dir / name)
 
     ds_manifest = {
         "dataset_kind": "replay_snapshot_v0",
@@ -195,6 +226,12 @@ def main() -> int:
     ap.add_argument("--output_root", default="./datasets_v12", help="Output root directory (local artifact)")
     ap.add_argument("--dataset_id", default="", help="Optional dataset_id override")
     ap.add_argument("--tick_interval_ms", type=int, default=0, help="Optional override (default from manifest or 1000)")
+    ap.add_argument(
+        "--ts_index_stride",
+        type=int,
+        default=DEFAULT_TS_INDEX_STRIDE,
+        help=f"Ticks between {TS_INDEX_NAME} entries (byte offset + ts_utc)",
+    )
     args = ap.parse_args()
 
     source_run_dir = Path(args.source_run_dir).expanduser().resolve()
@@ -203,6 +240,9 @@ def main() -> int:
     if not source_run_dir.exists():
         print(f"ERROR: source_run_dir not found: {source_run_dir}", file=sys.stderr)
         return 1
+    if args.ts_index_stride <= 0:
+        print(f"ERROR: --ts_index_stride must be > 0, got {args.ts_index_stride}", file=sys.stderr)
+        return 1
 
     try:
         ds_dir = build_dataset(
@@ -210,6 +250,7 @@ def main() -> int:
             output_root=output_root,
             dataset_id=(args.dataset_id.strip() or None),
             tick_interval_ms=(args.tick_interval_ms if args.tick_interval_ms > 0 else None),
+            ts_index_stride=args.ts_index_stride,
         )
     except Exception as e:
         print(f"ERROR: build failed: {e}", file=sys.stderr)
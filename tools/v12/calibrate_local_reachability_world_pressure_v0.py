@@ -23,7 +23,10 @@ import statistics
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+from stats_kernel_v0 import spearman
 
 
 def _ts_utc() -> str:
@@ -31,15 +34,14 @@ def _ts_utc() -> str:
 
 
 def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            obj = json.loads(s)
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        obj = json.loads(s)
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
 
 
 def _is_num(x: Any) -> bool:
@@ -83,48 +85,6 @@ def _stats(xs: List[float]) -> Dict[str, Any]:
     }
 
 
-def _rankdata(xs: List[float]) -> List[float]:
-    """
-    Average ranks for ties, 1..n.
-    """
-    n = len(xs)
-    order = sorted(range(n), key=lambda i: xs[i])
-    ranks = [0.0] * n
-    i = 0
-    while i < n:
-        j = i
-        while j + 1 < n and xs[order[j + 1]] == xs[order[i]]:
-            j += 1
-        # average rank for ties
-        avg = (i + 1 + j + 1) / 2.0
-        for k in range(i, j + 1):
-            ranks[order[k]] = avg
-        i = j + 1
-    return ranks
-
-
-def _pearson(x: List[float], y: List[float]) -> Optional[float]:
-    n = len(x)
-    if n == 0 or n != len(y):
-        return None
-    mx = sum(x) / n
-    my = sum(y) / n
-    vx = sum((a - mx) ** 2 for a in x)
-    vy = sum((b - my) ** 2 for b in y)
-    if vx <= 0 or vy <= 0:
-        return None
-    cov = sum((a - mx) * (b - my) for a, b in zip(x, y))
-    return cov / math.sqrt(vx * vy)
-
-
-def _spearman(x: List[float], y: List[float]) -> Optional[float]:
-    if len(x) != len(y) or not x:
-        return None
-    rx = _rankdata(x)
-    ry = _rankdata(y)
-    return _pearson(rx, ry)
-
-
 def _read_world_u_by_tick(path: Path) -> Dict[int, float]:
     """
     Prefer explicit tick_index if present; otherwise fall back to strict implicit ordering (0..N-1).
@@ -249,7 +209,7 @@ def _windowed_eval(u: List[float], fr: List[float], window: int) -> Dict[str, An
         uu = u[start:end]
         ff = fr[start:end]
         y = [1.0 - x for x in ff]
-        rho = _spearman(uu, y)
+        rho = spearman(uu, y)
         if rho is None or not math.isfinite(rho):
             continue
         qd = _quantile_delta(uu, ff, q=0.10)
@@ -274,9 +234,9 @@ class Thresholds:
 def _evaluate_one(run_dir: Path, thresholds: Thresholds, windows: List[int]) -> Dict[str, Any]:
     p_imp = run_dir / "interaction_impedance.jsonl"
     p_lr = run_dir / "local_reachability.jsonl"
-    if not p_imp.exists():
+    if not evidence_exists(p_imp):
         raise FileNotFoundError(f"missing required file: {p_imp}")
-    if not p_lr.exists():
+    if not evidence_exists(p_lr):
         raise FileNotFoundError(f"missing required file: {p_lr}")
 
     u_by = _read_world_u_by_tick(p_imp)
@@ -284,7 +244,7 @@ def _evaluate_one(run_dir: Path, thresholds: Thresholds, windows: List[int]) ->
     u, fr = _aligned_series(u_by, fr_by)
     y = [1.0 - x for x in fr]
 
-    rho = _spearman(u, y)
+    rho = spearman(u, y)
     if rho is None or not math.isfinite(rho):
         raise ValueError("spearman undefined (fail-closed)")
     qd = _quantile_delta(u, fr, q=0.10)
@@ -8,8 +8,10 @@ Fail-closed:
   - Requires numeric world_u and numeric decision fields
 
 Computes:
-  - action vector a_t = [interaction_intensity, post_gate_intensity, action_allowed]
-  - rolling-window EDoF(t) via correlation-matrix eigenvalues participation ratio
+  - action vector a_t = --action_fields values (default [interaction_intensity,
+    post_gate_intensity, action_allowed]; any number of dotted decision_trace paths)
+  - rolling-window EDoF(t) = participation ratio of the correlation eigenvalues,
+    tr(R)² / ‖R‖_F² (incremental window moments, O(N·d²); see _compute_edof_series)
   - EDoF-CR(t) = -(EDoF(t) - EDoF(t-1))
   - association: spearman(u_t, EDoF-CR(t)) and quantile deltas
 
@@ -28,21 +30,24 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from evidence_columns_v0 import bool_values, load_columns, num_values, str_values
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+from stats_kernel_v0 import spearman
+
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            obj = json.loads(s)
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        obj = json.loads(s)
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
 
 
 def _is_num(x: Any) -> bool:
@@ -82,44 +87,6 @@ def _stats(xs: List[float]) -> Dict[str, Any]:
     }
 
 
-def _rankdata(xs: List[float]) -> List[float]:
-    n = len(xs)
-    order = sorted(range(n), key=lambda i: xs[i])
-    ranks = [0.0] * n
-    i = 0
-    while i < n:
-        j = i
-        while j + 1 < n and xs[order[j + 1]] == xs[order[i]]:
-            j += 1
-        avg = (i + 1 + j + 1) / 2.0
-        for k in range(i, j + 1):
-            ranks[order[k]] = avg
-        i = j + 1
-    return ranks
-
-
-def _pearson(x: List[float], y: List[float]) -> Optional[float]:
-    n = len(x)
-    if n == 0 or n != len(y):
-        return None
-    mx = sum(x) / n
-    my = sum(y) / n
-    vx = sum((a - mx) ** 2 for a in x)
-    vy = sum((b - my) ** 2 for b in y)
-    if vx <= 0 or vy <= 0:
-        return None
-    cov = sum((a - mx) * (b - my) for a, b in zip(x, y))
-    return cov / math.sqrt(vx * vy)
-
-
-def _spearman(x: List[float], y: List[float]) -> Optional[float]:
-    if len(x) != len(y) or not x:
-        return None
-    rx = _rankdata(x)
-    ry = _rankdata(y)
-    return _pearson(rx, ry)
-
-
 def _matmul(A: List[List[float]], B: List[List[float]]) -> List[List[float]]:
     n = len(A)
     m = len(B[0])
@@ -173,84 +140,17 @@ def _corr_matrix(X: List[List[float]]) -> List[List[float]]:
     return [[M[i][j] / denom for j in range(d2)] for i in range(d2)]
 
 
-def _eigvals_sym_3x3(A: List[List[float]]) -> List[float]:
-    """
-    Eigenvalues of symmetric 3x3 via closed-form (robust enough for correlation matrices).
-    Assumes A is symmetric.
-    Returns 3 eigenvalues (non-negative for corr matrix, up to numerical drift).
-    """
-    a11, a12, a13 = A[0][0], A[0][1], A[0][2]
-    a22, a23 = A[1][1], A[1][2]
-    a33 = A[2][2]
-
-    p1 = a12 * a12 + a13 * a13 + a23 * a23
-    if p1 == 0:
-        return [a11, a22, a33]
-
-    q = (a11 + a22 + a33) / 3.0
-    b11 = a11 - q
-    b22 = a22 - q
-    b33 = a33 - q
-    p2 = b11 * b11 + b22 * b22 + b33 * b33 + 2.0 * p1
-    p = math.sqrt(p2 / 6.0)
-
-    # B = (1/p) * (A - qI)
-    b12 = a12 / p
-    b13 = a13 / p
-    b23 = a23 / p
-    B11 = b11 / p
-    B22 = b22 / p
-    B33 = b33 / p
-
-    # det(B)/2
-    detB = (
-        B11 * (B22 * B33 - b23 * b23)
-        - b12 * (b12 * B33 - b23 * b13)
-        + b13 * (b12 * b23 - B22 * b13)
-    )
-    r = detB / 2.0
-    # clamp
-    if r <= -1:
-        phi = math.pi / 3.0
-    elif r >= 1:
-        phi = 0.0
-    else:
-        phi = math.acos(r) / 3.0
-
-    eig1 = q + 2.0 * p * math.cos(phi)
-    eig3 = q + 2.0 * p * math.cos(phi + (2.0 * math.pi / 3.0))
-    eig2 = 3.0 * q - eig1 - eig3
-    return [eig1, eig2, eig3]
-
-
 def _edof_from_corr(R: List[List[float]]) -> float:
     """
-    Participation-ratio EDoF from correlation eigenvalues.
-    Supports d_eff in {1,2,3}. Fail-closed otherwise.
+    Participation-ratio EDoF (Σλ)² / Σλ² over the eigenvalues of R, computed as
+    tr(R)² / ‖R‖_F² (R symmetric: Σλ = tr R, Σλ² = Σ R_jk²), so any d_eff works
+    without an eigen-decomposition. Fail-closed on an all-zero matrix.
     """
-    d = len(R)
-    if d == 1:
-        lam2 = [1.0]
-    elif d == 2:
-        # symmetric 2x2 eigenvalues
-        a, b = R[0][0], R[0][1]
-        c = R[1][1]
-        tr = a + c
-        det = a * c - b * b
-        disc = max(0.0, tr * tr - 4.0 * det)
-        s = math.sqrt(disc)
-        lam2 = [max(0.0, (tr + s) / 2.0), max(0.0, (tr - s) / 2.0)]
-    elif d == 3:
-        lam = _eigvals_sym_3x3(R)
-        lam2 = [max(0.0, float(x)) for x in lam]
-    else:
-        raise ValueError(f"unsupported correlation dimension: {d} (fail-closed)")
-
-    s1 = sum(lam2)
-    s2 = sum(x * x for x in lam2)
-    if s2 <= 0:
-        raise ValueError("invalid eigenvalues (fail-closed)")
-    return (s1 * s1) / s2
+    tr = sum(R[i][i] for i in range(len(R)))
+    fro2 = sum(x * x for row in R for x in row)
+    if not fro2 > 0:
+        raise ValueError("invalid correlation matrix (fail-closed)")
+    return (tr * tr) / fro2
 
 
 def _quantile_delta(u: List[float], x: List[float], q: float = 0.10) -> Dict[str, Any]:
@@ -281,33 +181,83 @@ class Thresholds:
     delta_seg_min: float
 
 
-def _read_series(run_dir: Path) -> Tuple[List[str], List[float], List[List[float]]]:
+# --action_fields default: the original three-dimensional action vector
+DEFAULT_ACTION_FIELDS = "interaction_intensity,post_gate_intensity,action_allowed:bool"
+
+
+def _parse_action_fields(spec: str) -> List[Tuple[str, bool]]:
     """
-    Returns:
-      ts_utc list (length N),
-      world_u list (length N),
-      action vectors list (length N, each length 3)
+    "path,path:bool,..." -> [(dotted decision_trace path, is_bool)]. A plain path must
+    hold a non-bool number in every record, a `:bool` path a JSON boolean (1.0 / 0.0).
     """
-    p_dec = run_dir / "decision_trace.jsonl"
-    p_imp = run_dir / "interaction_impedance.jsonl"
-    if not p_dec.exists():
-        raise FileNotFoundError(f"missing required file: {p_dec}")
-    if not p_imp.exists():
-        raise FileNotFoundError(f"missing required file: {p_imp}")
-
+    fields: List[Tuple[str, bool]] = []
+    for item in spec.split(","):
+        item = item.strip()
+        if not item:
+            continue
+        path, _, kind = item.partition(":")
+        if kind not in ("", "bool") or "" in path.split("."):
+            raise ValueError(f"invalid action field: {item!r} (expected <dotted.path> or <dotted.path>:bool)")
+        if path in (p for p, _b in fields):
+            raise ValueError(f"duplicate action field: {path}")
+        fields.append((path, kind == "bool"))
+    if not fields:
+        raise ValueError("empty action_fields")
+    return fields
+
+
+def _action_field_names(fields: List[Tuple[str, bool]]) -> List[str]:
+    return [f"{path}:bool" if is_bool else path for path, is_bool in fields]
+
+
+def _get_path(rec: Dict[str, Any], keys: List[str]) -> Any:
+    cur: Any = rec
+    for k in keys:
+        if not isinstance(cur, dict):
+            return None
+        cur = cur.get(k)
+    return cur
+
+
+def _read_decision_columns(p_dec: Path, fields: List[Tuple[str, bool]]) -> Tuple[List[str], List[List[float]]]:
+    # Fast path: columnar sidecar cache. Any record that does not fit the
+    # contract sends us to the per-record decoder, which raises the exact error.
+    try:
+        t = load_columns(p_dec)
+        ts = str_values(t, "ts_utc")
+        cols = [bool_values(t, path) if is_bool else num_values(t, path) for path, is_bool in fields]
+    except (OSError, ValueError):
+        ts, cols = None, []
+    if ts is not None and cols and all(c is not None for c in cols):
+        fcols = [[1.0 if v else 0.0 for v in c] if is_bool else c for c, (_p, is_bool) in zip(cols, fields)]
+        return ts, [list(row) for row in zip(*fcols)]  # type: ignore[arg-type]
+
+    keyed = [(path.split("."), is_bool) for path, is_bool in fields]
     dec_ts: List[str] = []
     a: List[List[float]] = []
     for _ln, rec in _iter_jsonl(p_dec):
         ts = rec.get("ts_utc")
         if not isinstance(ts, str) or not ts:
             raise ValueError(f"missing/invalid ts_utc in {p_dec}")
-        x1 = rec.get("interaction_intensity")
-        x2 = rec.get("post_gate_intensity")
-        al = rec.get("action_allowed")
-        if not _is_num(x1) or not _is_num(x2) or not isinstance(al, bool):
-            raise ValueError(f"missing/invalid decision fields in {p_dec} at ts_utc={ts}")
+        row: List[float] = []
+        for keys, is_bool in keyed:
+            v = _get_path(rec, keys)
+            if not (isinstance(v, bool) if is_bool else _is_num(v)):
+                raise ValueError(f"missing/invalid decision fields in {p_dec} at ts_utc={ts}")
+            row.append((1.0 if v else 0.0) if is_bool else float(v))
         dec_ts.append(ts)
-        a.append([float(x1), float(x2), 1.0 if al else 0.0])
+        a.append(row)
+    return dec_ts, a
+
+
+def _read_impedance_columns(p_imp: Path) -> Tuple[List[str], List[float]]:
+    try:
+        t = load_columns(p_imp)
+        cols = (str_values(t, "ts_utc"), num_values(t, "metrics.world_u"))
+    except (OSError, ValueError):
+        cols = (None, None)
+    if all(c is not None for c in cols):
+        return cols  # type: ignore[return-value]
 
     imp_ts: List[str] = []
     u: List[float] = []
@@ -323,6 +273,27 @@ def _read_series(run_dir: Path) -> Tuple[List[str], List[float], List[List[float
             raise ValueError(f"missing/invalid metrics.world_u in {p_imp} at ts_utc={ts}")
         imp_ts.append(ts)
         u.append(float(uu))
+    return imp_ts, u
+
+
+def _read_series(
+    run_dir: Path, action_fields: List[Tuple[str, bool]]
+) -> Tuple[List[str], List[float], List[List[float]]]:
+    """
+    Returns:
+      ts_utc list (length N),
+      world_u list (length N),
+      action vectors list (length N, one value per action field)
+    """
+    p_dec = run_dir / "decision_trace.jsonl"
+    p_imp = run_dir / "interaction_impedance.jsonl"
+    if not evidence_exists(p_dec):
+        raise FileNotFoundError(f"missing required file: {p_dec}")
+    if not evidence_exists(p_imp):
+        raise FileNotFoundError(f"missing required file: {p_imp}")
+
+    dec_ts, a = _read_decision_columns(p_dec, action_fields)
+    imp_ts, u = _read_impedance_columns(p_imp)
 
     if len(dec_ts) != len(imp_ts):
         raise ValueError(f"record count mismatch (fail-closed): decision={len(dec_ts)} impedance={len(imp_ts)}")
@@ -333,14 +304,159 @@ def _read_series(run_dir: Path) -> Tuple[List[str], List[float], List[List[float
     return dec_ts, u, a
 
 
+# Rolling EDoF: rebuild the shifted sums when a kept dimension's centered sum of squares
+# falls below this fraction of the squared deviations rolled through it since the last
+# anchor (bounds the rounding left by cancellation to ~eps / _REANCHOR_RTOL, relative;
+# stationary data keeps the ratio above ~1/3, so this only fires on variance collapses).
+_REANCHOR_RTOL = 1e-4
+
+
+def _window_edof(X: List[List[float]]) -> float:
+    return float(_edof_from_corr(_corr_matrix(X)))
+
+
+def _const_dim_kept(c: float, W: int, memo: Dict[float, bool]) -> bool:
+    """Does _corr_matrix keep a dimension whose W window values all equal c? (its mean can round off c)"""
+    kept = memo.get(c)
+    if kept is None:
+        col = [c] * W
+        mu = sum(col) / W
+        kept = memo[c] = sum((x - mu) ** 2 for x in col) / max(1, W - 1) > 0
+    return kept
+
+
 def _compute_edof_series(a: List[List[float]], W: int) -> List[Optional[float]]:
+    """
+    EDoF(t) of the window a[t-W+1 : t+1] for t >= W-1 (None before), in O(N·d²).
+
+    Rolling engine: per dimension j the shifted sums S_j = Σ(x_j - K_j) and, per pair,
+    P_jk = Σ(x_j - K_j)(x_k - K_k) are updated as ticks enter and leave the window;
+    the centered co-moments C_jk = P_jk - S_j·S_k/W give the correlation
+    r_jk = C_jk / sqrt(C_jj·C_kk), the matrix _corr_matrix builds from z-scores. The
+    anchors K are re-set to the window mean (sums rebuilt two-pass) every W ticks, and
+    early when a kept dimension's C_jj drops below _REANCHOR_RTOL of the squared
+    deviations rolled through it since the last anchor.
+
+    Zero variance is decided exactly, as _corr_matrix decides it, not from the rolled
+    sums: a dimension is dropped when all its window values are equal or any is
+    non-finite (its variance is NaN, not > 0); none left => the same fail-closed
+    ValueError. Windows where _corr_matrix keeps a constant dimension (the two-pass
+    mean of W copies of a non-dyadic value can round off it) or whose rolled moments
+    are unusable run _corr_matrix itself.
+
+    The EDoF of a window is _edof_from_corr's tr(R)² / ‖R‖_F², read off the
+    co-moments without building R, so a tick costs O(d²) for any action dimension.
+
+    Tolerance vs the per-window computation: the re-anchor rule bounds the rolled
+    co-moments' rounding to ~eps / _REANCHOR_RTOL relative, so correlations agree to
+    ~1e-11 and |ΔEDoF| <= 1e-9 (observed ~1e-15). Not covered: windows whose spread
+    is within a few thousand ulps of the values' magnitude, where the two-pass mean
+    itself is off and the rolled co-moments (which correct for it) are the more
+    accurate of the two. With integer-valued data the rolled sums are exact, so a
+    window whose entering and leaving ticks are equal repeats EDoF exactly: EDoF-CR
+    is an exact 0 there where the per-window path left ~1e-16 noise, and spearman
+    ranks treat it as a tie.
+    """
     n = len(a)
     out: List[Optional[float]] = [None] * n
-    for t in range(W - 1, n):
-        X = a[t - W + 1 : t + 1]
-        R = _corr_matrix(X)
-        ed = _edof_from_corr(R)
-        out[t] = float(ed)
+    if W < 2 or n < W:
+        for t in range(W - 1, n):
+            out[t] = _window_edof(a[t - W + 1 : t + 1])
+        return out
+
+    d = len(a[0])
+    dims = range(d)
+    pairs = [(j, k) for j in dims for k in range(j + 1, d)]
+    isfinite = math.isfinite
+    K = [0.0] * d  # anchors
+    S = [0.0] * d  # Σ(x_j - K_j)
+    Q = [0.0] * d  # Σ(x_j - K_j)²
+    P = [0.0] * len(pairs)  # Σ(x_j - K_j)(x_k - K_k), j < k
+    E = [0.0] * d  # squared deviations rolled through Q since the anchor
+    changed = [0] * d  # last tick whose value differs from the previous tick's
+    nonfinite = [-1] * d  # last tick with a non-finite value
+    const_memo: Dict[float, bool] = {}
+    live_pairs: Dict[Tuple[int, ...], List[Tuple[int, int, int]]] = {}  # kept dims -> (p, j, k)
+
+    def _devs(row: List[float]) -> List[float]:
+        # non-finite values contribute nothing: any window holding one drops that dimension
+        return [row[j] - K[j] if isfinite(row[j]) else 0.0 for j in dims]
+
+    def _anchor(s: int, e: int) -> None:
+        rows = a[s:e]
+        for j in dims:
+            vals = [r[j] for r in rows if isfinite(r[j])]
+            K[j] = sum(vals) / len(vals) if vals else 0.0
+        devs = [_devs(r) for r in rows]
+        for j in dims:
+            S[j] = sum(dv[j] for dv in devs)
+            Q[j] = E[j] = sum(dv[j] * dv[j] for dv in devs)
+        for p, (j, k) in enumerate(pairs):
+            P[p] = sum(dv[j] * dv[k] for dv in devs)
+
+    anchored_at = -1
+    for t in range(n):
+        row = a[t]
+        for j in dims:
+            x = row[j]
+            if not isfinite(x):
+                nonfinite[j] = t
+            if t and x != a[t - 1][j]:
+                changed[j] = t
+        if t < W - 1:
+            continue
+        s = t - W + 1
+
+        if t - anchored_at >= W:
+            _anchor(s, t + 1)
+            anchored_at = t
+        else:
+            di = _devs(row)
+            do = _devs(a[t - W])
+            for j in dims:
+                S[j] += di[j] - do[j]
+                sq_in, sq_out = di[j] * di[j], do[j] * do[j]
+                Q[j] += sq_in - sq_out
+                E[j] += sq_in + sq_out
+            for p, (j, k) in enumerate(pairs):
+                P[p] += di[j] * di[k] - do[j] * do[k]
+
+        keep: List[int] = []
+        exact = False
+        for j in dims:
+            if nonfinite[j] >= s:
+                continue
+            if changed[j] <= s:
+                if _const_dim_kept(row[j], W, const_memo):
+                    exact = True
+                continue
+            keep.append(j)
+        if not exact and not keep:
+            raise ValueError("all dimensions have zero variance in window (fail-closed)")
+
+        if not exact:
+            C = [Q[j] - S[j] * S[j] / W for j in dims]
+            if anchored_at != t and any(not (C[j] > _REANCHOR_RTOL * E[j]) for j in keep):
+                _anchor(s, t + 1)
+                anchored_at = t
+                C = [Q[j] - S[j] * S[j] / W for j in dims]
+            exact = not all(C[j] > 0 and isfinite(C[j]) for j in keep)
+        if exact:
+            out[t] = _window_edof(a[s : t + 1])
+            continue
+
+        # _edof_from_corr's tr(R)² / ‖R‖_F² with unit diagonal: m² / (m + 2·Σ_{j<k} r_jk²)
+        key = tuple(keep)
+        live = live_pairs.get(key)
+        if live is None:
+            kept = set(keep)
+            live = live_pairs[key] = [(p, j, k) for p, (j, k) in enumerate(pairs) if j in kept and k in kept]
+        off = 0.0
+        for p, j, k in live:
+            c = P[p] - S[j] * S[k] / W
+            off += c * c / (C[j] * C[k])
+        m = len(keep)
+        out[t] = (m * m) / (m + 2.0 * off)
     return out
 
 
@@ -368,7 +484,7 @@ def _segment_eval(u: List[float], x: List[float], seg: int) -> Dict[str, Any]:
         xx = x[start:end]
         if len(uu) < 10:
             continue
-        rho = _spearman(uu, xx)
+        rho = spearman(uu, xx)
         if rho is None or not math.isfinite(rho):
             continue
         qd = _quantile_delta(uu, xx, q=0.10)
@@ -382,8 +498,10 @@ def _segment_eval(u: List[float], x: List[float], seg: int) -> Dict[str, Any]:
     }
 
 
-def _evaluate_one(run_dir: Path, W: int, thresholds: Thresholds, seg_sizes: List[int]) -> Dict[str, Any]:
-    ts, u_all, a = _read_series(run_dir)
+def _evaluate_one(
+    run_dir: Path, W: int, thresholds: Thresholds, seg_sizes: List[int], action_fields: List[Tuple[str, bool]]
+) -> Dict[str, Any]:
+    ts, u_all, a = _read_series(run_dir, action_fields)
     edof = _compute_edof_series(a, W=W)
     edof_cr = _compute_edof_cr(edof)
 
@@ -398,7 +516,7 @@ def _evaluate_one(run_dir: Path, W: int, thresholds: Thresholds, seg_sizes: List
     if len(u) < 100:
         raise ValueError("too few valid ticks after windowing (fail-closed)")
 
-    rho = _spearman(u, x)
+    rho = spearman(u, x)
     if rho is None or not math.isfinite(rho):
         raise ValueError("spearman undefined (fail-closed)")
     qd = _quantile_delta(u, x, q=0.10)
@@ -445,6 +563,7 @@ def _evaluate_one(run_dir: Path, W: int, thresholds: Thresholds, seg_sizes: List
         "run_dir": str(run_dir),
         "inputs": {
             "W": W,
+            "action_fields": _action_field_names(action_fields),
             "records": len(ts),
             "join": "implicit_ordering_with_ts_utc_equality",
             "decision_trace": str(run_dir / "decision_trace.jsonl"),
@@ -475,6 +594,11 @@ def main() -> int:
     ap.add_argument("--rho_seg_min", type=float, default=0.10)
     ap.add_argument("--delta_seg_min", type=float, default=1e-4)
     ap.add_argument("--segments", default="1000,5000,10000")
+    ap.add_argument(
+        "--action_fields",
+        default=DEFAULT_ACTION_FIELDS,
+        help="Comma-separated decision_trace dotted paths forming a_t; suffix :bool for JSON booleans (1/0)",
+    )
     args = ap.parse_args()
 
     run_dirs: List[str] = []
@@ -489,6 +613,11 @@ def main() -> int:
     if not seg_sizes:
         raise SystemExit("empty segments")
 
+    try:
+        action_fields = _parse_action_fields(args.action_fields)
+    except ValueError as e:
+        raise SystemExit(str(e))
+
     thresholds = Thresholds(
         rho_min=float(args.rho_min),
         delta_min=float(args.delta_min),
@@ -504,7 +633,9 @@ def main() -> int:
     for rd in run_dirs:
         run_dir = Path(rd).expanduser().resolve()
         try:
-            rep = _evaluate_one(run_dir, W=int(args.W), thresholds=thresholds, seg_sizes=seg_sizes)
+            rep = _evaluate_one(
+                run_dir, W=int(args.W), thresholds=thresholds, seg_sizes=seg_sizes, action_fields=action_fields
+            )
             per_run.append(rep)
             (out_dir / f"per_run_{run_dir.name}.json").write_text(
                 json.dumps(rep, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
@@ -520,6 +651,7 @@ def main() -> int:
             "run_dirs_file": str(Path(args.run_dirs_file).expanduser().resolve()),
             "run_dirs_count": len(run_dirs),
             "W": int(args.W),
+            "action_fields": _action_field_names(action_fields),
             "thresholds": {
                 "rho_min": thresholds.rho_min,
                 "delta_min": thresholds.delta_min,
@@ -24,7 +24,11 @@ import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, List, Tuple
+
+from evidence_columns_v0 import load_columns, num_values, str_values
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+from stats_kernel_v0 import spearman
 
 
 def _ts_utc() -> str:
@@ -32,15 +36,14 @@ def _ts_utc() -> str:
 
 
 def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            obj = json.loads(s)
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        obj = json.loads(s)
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
 
 
 def _is_num(x: Any) -> bool:
@@ -80,42 +83,6 @@ def _stats(xs: List[float]) -> Dict[str, Any]:
     }
 
 
-def _rankdata(xs: List[float]) -> List[float]:
-    n = len(xs)
-    order = sorted(range(n), key=lambda i: xs[i])
-    ranks = [0.0] * n
-    i = 0
-    while i < n:
-        j = i
-        while j + 1 < n and xs[order[j + 1]] == xs[order[i]]:
-            j += 1
-        avg = (i + 1 + j + 1) / 2.0
-        for k in range(i, j + 1):
-            ranks[order[k]] = avg
-        i = j + 1
-    return ranks
-
-
-def _pearson(x: List[float], y: List[float]) -> Optional[float]:
-    n = len(x)
-    if n == 0 or n != len(y):
-        return None
-    mx = sum(x) / n
-    my = sum(y) / n
-    vx = sum((a - mx) ** 2 for a in x)
-    vy = sum((b - my) ** 2 for b in y)
-    if vx <= 0 or vy <= 0:
-        return None
-    cov = sum((a - mx) * (b - my) for a, b in zip(x, y))
-    return cov / math.sqrt(vx * vy)
-
-
-def _spearman(x: List[float], y: List[float]) -> Optional[float]:
-    if len(x) != len(y) or not x:
-        return None
-    return _pearson(_rankdata(x), _rankdata(y))
-
-
 def _quantile_delta(u: List[float], x: List[float], q: float = 0.10) -> Dict[str, Any]:
     u_sorted = sorted(u)
     lo_thr = _percentile(u_sorted, q)
@@ -144,19 +111,16 @@ class Thresholds:
     delta_seg_min: float
 
 
-def _read_series(run_dir: Path) -> Tuple[List[float], List[float]]:
-    """
-    Returns:
-      u_t list (for ticks with interaction_intensity>0),
-      suppression_t list
-    Enforces implicit ordering join with ts_utc equality.
-    """
-    p_dec = run_dir / "decision_trace.jsonl"
-    p_imp = run_dir / "interaction_impedance.jsonl"
-    if not p_dec.exists():
-        raise FileNotFoundError(f"missing required file: {p_dec}")
-    if not p_imp.exists():
-        raise FileNotFoundError(f"missing required file: {p_imp}")
+def _read_decision_columns(p_dec: Path) -> Tuple[List[str], List[float], List[float]]:
+    # Fast path: columnar sidecar cache. Any record that does not fit the
+    # contract sends us to the per-record decoder, which raises the exact error.
+    try:
+        t = load_columns(p_dec)
+        cols = (str_values(t, "ts_utc"), num_values(t, "interaction_intensity"), num_values(t, "post_gate_intensity"))
+    except (OSError, ValueError):
+        cols = (None, None, None)
+    if all(c is not None for c in cols):
+        return cols  # type: ignore[return-value]
 
     dec_ts: List[str] = []
     inter: List[float] = []
@@ -172,6 +136,17 @@ def _read_series(run_dir: Path) -> Tuple[List[float], List[float]]:
         dec_ts.append(ts)
         inter.append(float(ii))
         post.append(float(pi))
+    return dec_ts, inter, post
+
+
+def _read_impedance_columns(p_imp: Path) -> Tuple[List[str], List[float]]:
+    try:
+        t = load_columns(p_imp)
+        cols = (str_values(t, "ts_utc"), num_values(t, "metrics.world_u"))
+    except (OSError, ValueError):
+        cols = (None, None)
+    if all(c is not None for c in cols):
+        return cols  # type: ignore[return-value]
 
     imp_ts: List[str] = []
     u_all: List[float] = []
@@ -187,6 +162,25 @@ def _read_series(run_dir: Path) -> Tuple[List[float], List[float]]:
             raise ValueError(f"missing/invalid metrics.world_u in {p_imp} at ts_utc={ts}")
         imp_ts.append(ts)
         u_all.append(float(uu))
+    return imp_ts, u_all
+
+
+def _read_series(run_dir: Path) -> Tuple[List[float], List[float]]:
+    """
+    Returns:
+      u_t list (for ticks with interaction_intensity>0),
+      suppression_t list
+    Enforces implicit ordering join with ts_utc equality.
+    """
+    p_dec = run_dir / "decision_trace.jsonl"
+    p_imp = run_dir / "interaction_impedance.jsonl"
+    if not evidence_exists(p_dec):
+        raise FileNotFoundError(f"missing required file: {p_dec}")
+    if not evidence_exists(p_imp):
+        raise FileNotFoundError(f"missing required file: {p_imp}")
+
+    dec_ts, inter, post = _read_decision_columns(p_dec)
+    imp_ts, u_all = _read_impedance_columns(p_imp)
 
     if len(dec_ts) != len(imp_ts):
         raise ValueError(f"record count mismatch (fail-closed): decision={len(dec_ts)} impedance={len(imp_ts)}")
@@ -220,7 +214,7 @@ def _segment_eval(u: List[float], x: List[float], seg: int) -> Dict[str, Any]:
         xx = x[start:end]
         if len(uu) < 50:
             continue
-        rho = _spearman(uu, xx)
+        rho = spearman(uu, xx)
         if rho is None or not math.isfinite(rho):
             continue
         qd = _quantile_delta(uu, xx, q=0.10)
@@ -231,7 +225,7 @@ def _segment_eval(u: List[float], x: List[float], seg: int) -> Dict[str, Any]:
 
 def _evaluate_one(run_dir: Path, thresholds: Thresholds, seg_sizes: List[int]) -> Dict[str, Any]:
     u, s = _read_series(run_dir)
-    rho = _spearman(u, s)
+    rho = spearman(u, s)
     if rho is None or not math.isfinite(rho):
         raise ValueError("spearman undefined (fail-closed)")
     qd = _quantile_delta(u, s, q=0.10)
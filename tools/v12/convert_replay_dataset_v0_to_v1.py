@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+"""
+Convert a Replay Dataset v0 directory into the chunked v1 layout (stdlib only).
+
+replay_snapshot_v0 keeps every tick in one market_snapshot.jsonl; v1 splits it
+into fixed-size chunks (chunks/market_snapshot.NNNNNN.jsonl) and records each
+chunk's sha256, tick range and ts range in dataset_manifest.json
+(see replay_dataset_io_v1 / docs/v12/V12_SSOT_REPLAY_DATASET_V1_20261017.md).
+
+One streaming read of the v0 market_snapshot.jsonl: strict-JSONL check,
+v0 manifest sha256/record_count check (fail-closed) and chunk writing happen
+together. Records are copied byte-for-byte (stripped line + "\\n"); blank lines
+are dropped so that chunk line n is tick tick_start + n - 1.
+Files are staged under <output_root>/.tmp_convert_replay_* and moved into the
+dataset dir only after every check passed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from evidence_io_v0 import evidence_exists, iter_jsonl_raw, tee_jsonl
+from replay_dataset_io_v1 import CHUNK_DIRNAME, DATASET_KIND_V1, DEFAULT_CHUNK_TICKS, chunk_relpath, read_manifest
+
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+class _ChunkWriter:
+    """Writes consecutive fixed-size chunks and collects their chunk_index entries."""
+
+    def __init__(self, root: Path, chunk_ticks: int) -> None:
+        self.root = root
+        self.chunk_ticks = chunk_ticks
+        self.entries: List[Dict[str, Any]] = []
+        self.whole = hashlib.sha256()  # all chunks concatenated
+        self._f: Any = None
+        self._h: Any = None
+        self._n = 0
+        self._bytes = 0
+        self._ts_first: Optional[str] = None
+        self._ts_last: Optional[str] = None
+
+    def add(self, text: str, ts: Any) -> None:
+        if self._f is None:
+            k = len(self.entries)
+            self._f = (self.root / chunk_relpath(k)).open("wb")
+            self._h = hashlib.sha256()
+            self._n = 0
+            self._bytes = 0
+            self._ts_first = None
+            self._ts_last = None
+        data = text.encode("utf-8") + b"\n"
+        self._f.write(data)
+        self._h.update(data)
+        self.whole.update(data)
+        self._n += 1
+        self._bytes += len(data)
+        if isinstance(ts, str) and ts:
+            if self._ts_first is None:
+                self._ts_first = ts
+            self._ts_last = ts
+        if self._n == self.chunk_ticks:
+            self.close()
+
+    def close(self) -> None:
+        if self._f is None:
+            return
+        self._f.close()
+        k = len(self.entries)
+        start = k * self.chunk_ticks
+        self.entries.append(
+            {
+                "chunk": k,
+                "path": chunk_relpath(k),
+                "tick_start": start,
+                "tick_end": start + self._n,
+                "ts_first_utc": self._ts_first,
+                "ts_last_utc": self._ts_last,
+                "sha256": self._h.hexdigest(),
+                "record_count": self._n,
+                "bytes": self._bytes,
+            }
+        )
+        self._f = None
+
+
+def convert_dataset(
+    dataset_dir: Path, output_root: Path, dataset_id: str | None, chunk_ticks: int = DEFAULT_CHUNK_TICKS
+) -> Path:
+    if not (dataset_dir / "dataset_manifest.json").exists() or not evidence_exists(dataset_dir / "market_snapshot.jsonl"):
+        raise FileNotFoundError("v0 dataset needs dataset_manifest.json and market_snapshot.jsonl")
+    v0 = read_manifest(dataset_dir)
+    if v0.get("dataset_kind") != "replay_snapshot_v0":
+        raise ValueError(f"dataset_kind must be 'replay_snapshot_v0', got {v0.get('dataset_kind')!r}")
+
+    output_root = output_root.expanduser().resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".tmp_convert_replay_", dir=output_root))
+    try:
+        return _convert_staged(dataset_dir, v0, output_root, staging, dataset_id, chunk_ticks)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _convert_staged(
+    dataset_dir: Path, v0: Dict[str, Any], output_root: Path, staging: Path, dataset_id: str | None, chunk_ticks: int
+) -> Path:
+    v0_files = v0.get("files") if isinstance(v0.get("files"), dict) else {}
+    ms_entry = v0_files.get("market_snapshot.jsonl")
+    if not isinstance(ms_entry, dict) or not isinstance(ms_entry.get("sha256"), str):
+        raise ValueError("v0 files['market_snapshot.jsonl'] must carry sha256 + record_count")
+
+    (staging / CHUNK_DIRNAME).mkdir()
+    writer = _ChunkWriter(staging, chunk_ticks)
+    try:
+        for _ln, text, rec in iter_jsonl_raw(dataset_dir / "market_snapshot.jsonl"):
+            writer.add(text, rec.get("ts_utc"))
+    finally:
+        writer.close()
+    if not writer.entries:
+        raise ValueError("market_snapshot.jsonl is empty (no records)")
+
+    # Fail-closed: never convert a v0 file that no longer matches its manifest. The
+    # concatenated chunks are byte-identical to a builder-written v0 file; only a file
+    # with blank lines / padding / CRLF costs a second read to check its sha256.
+    tick_count = writer.entries[-1]["tick_end"]
+    if tick_count != ms_entry.get("record_count"):
+        raise ValueError(f"market_snapshot.jsonl record_count mismatch: v0 manifest {ms_entry.get('record_count')} != actual {tick_count}")
+    source_sha256 = writer.whole.hexdigest()
+    if source_sha256 != ms_entry["sha256"]:
+        _rc, source_sha256 = tee_jsonl(dataset_dir / "market_snapshot.jsonl")
+        if source_sha256 != ms_entry["sha256"]:
+            raise ValueError(f"market_snapshot.jsonl sha256 mismatch: v0 manifest {ms_entry['sha256']} != actual {source_sha256}")
+
+    # Optional files are carried over unchanged (and re-checked against the v0 manifest).
+    files: Dict[str, Any] = {}
+    for name in ["okx_api_calls.jsonl", "exchange_api_calls.jsonl", "errors.jsonl", "source_run_manifest.json"]:
+        entry = v0_files.get(name)
+        if not isinstance(entry, dict) or not evidence_exists(dataset_dir / name):
+            continue
+        if name.endswith(".jsonl"):
+            with (staging / name).open("wb") as sink:
+                rc, digest = tee_jsonl(dataset_dir / name, sink=sink)
+        else:
+            raw = (dataset_dir / name).read_bytes()
+            (staging / name).write_bytes(raw)
+            rc, digest = None, hashlib.sha256(raw).hexdigest()
+        if digest != entry.get("sha256") or rc != entry.get("record_count"):
+            raise ValueError(f"{name} does not match its v0 manifest entry (sha256/record_count)")
+        files[name] = {"path": name, "sha256": digest, "record_count": rc}
+
+    if dataset_id is None:
+        v0_id = str(v0.get("dataset_id") or dataset_dir.name)
+        dataset_id = v0_id.replace("dataset_replay_v0_", "dataset_replay_v1_", 1) if v0_id.startswith("dataset_replay_v0_") else f"{v0_id}_v1"
+
+    source = dict(v0["source"]) if isinstance(v0.get("source"), dict) else {}
+    source.update(
+        {
+            "source_dataset_kind": "replay_snapshot_v0",
+            "source_dataset_id": v0.get("dataset_id"),
+            "source_dataset_dir": str(dataset_dir),
+            "source_market_snapshot_sha256": ms_entry["sha256"],
+        }
+    )
+    ds_manifest = {
+        "dataset_kind": DATASET_KIND_V1,
+        "dataset_id": dataset_id,
+        "created_at_utc": _ts_utc(),
+        "source": source,
+        "world_contract": v0.get("world_contract"),
+        "chunking": {
+            "stream": "market_snapshot",
+            "chunk_ticks": chunk_ticks,
+            "chunk_count": len(writer.entries),
+            "tick_count": tick_count,
+        },
+        "chunk_index": writer.entries,
+        "files": files,
+    }
+
+    out_dir = (output_root / dataset_id).expanduser().resolve()
+    if out_dir == dataset_dir.resolve():
+        raise ValueError(f"convert would overwrite its source dataset {out_dir}; pass a different --dataset_id")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    if (out_dir / CHUNK_DIRNAME).exists():
+        shutil.rmtree(out_dir / CHUNK_DIRNAME)  # a different chunk_ticks must not leave stale chunks
+    os.replace(staging / CHUNK_DIRNAME, out_dir / CHUNK_DIRNAME)
+    for name in files:
+        os.replace(staging / name, out_dir / name)
+    (out_dir / "dataset_manifest.json").write_text(
+        json.dumps(ds_manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    return out_dir
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dataset_dir", required=True, help="Replay dataset v0 directory (contains dataset_manifest.json)")
+    ap.add_argument("--output_root", default="./datasets_v12", help="Output root directory (local artifact)")
+    ap.add_argument("--dataset_id", default="", help="Optional dataset_id override (default: v0 id with v0 -> v1)")
+    ap.add_argument("--chunk_ticks", type=int, default=DEFAULT_CHUNK_TICKS, help="Ticks per chunk (fixed; last chunk may be shorter)")
+    args = ap.parse_args()
+
+    dataset_dir = Path(args.dataset_dir).expanduser().resolve()
+    output_root = Path(args.output_root).expanduser().resolve()
+
+    if not dataset_dir.exists():
+        print(f"ERROR: dataset_dir not found: {dataset_dir}", file=sys.stderr)
+        return 1
+    if args.chunk_ticks <= 0:
+        print(f"ERROR: --chunk_ticks must be > 0, got {args.chunk_ticks}", file=sys.stderr)
+        return 1
+
+    try:
+        out_dir = convert_dataset(dataset_dir, output_root, args.dataset_id.strip() or None, args.chunk_ticks)
+    except Exception as e:
+        print(f"ERROR: convert failed: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps({"tool": "convert_replay_dataset_v0_to_v1", "dataset_dir": str(out_dir)}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
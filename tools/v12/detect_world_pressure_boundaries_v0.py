@@ -28,25 +28,15 @@ import math
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_io_v0 import evidence_exists, iter_projected, read_jsonl_record
 
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            obj = json.loads(s)
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
 def _is_num(x: Any) -> bool:
     return isinstance(x, (int, float)) and not isinstance(x, bool)
 
@@ -87,19 +77,17 @@ def _median(xs: List[float]) -> float:
 
 def _read_world_u(run_dir: Path) -> Tuple[List[str], List[float]]:
     p = run_dir / "interaction_impedance.jsonl"
-    if not p.exists():
+    if not evidence_exists(p):
         raise FileNotFoundError(f"missing required file: {p}")
     ts: List[str] = []
     u: List[float] = []
-    for _ln, rec in _iter_jsonl(p):
-        t = rec.get("ts_utc")
+    # projection: only ts_utc + metrics.world_u are decoded per line
+    for ln, (t, uu) in iter_projected(p, ("ts_utc", "metrics.world_u")):
         if not isinstance(t, str) or not t:
             raise ValueError(f"missing/invalid ts_utc in {p}")
-        metrics = rec.get("metrics")
-        if not isinstance(metrics, dict):
-            raise ValueError(f"missing metrics object in {p} at ts_utc={t}")
-        uu = metrics.get("world_u")
         if not _is_num(uu):
+            if not isinstance(read_jsonl_record(p, ln).get("metrics"), dict):
+                raise ValueError(f"missing metrics object in {p} at ts_utc={t}")
             raise ValueError(f"missing/invalid metrics.world_u in {p} at ts_utc={t}")
         ts.append(t)
         u.append(float(uu))
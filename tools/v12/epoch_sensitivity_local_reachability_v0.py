@@ -13,81 +13,23 @@ from __future__ import annotations
 
 import argparse
 import json
-import math
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Tuple
+from typing import Any, Dict, List
+
+from evidence_io_v0 import evidence_exists, iter_projected
+from stats_kernel_v0 import spearman
 
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
 def _is_num(x: Any) -> bool:
     return isinstance(x, (int, float)) and not isinstance(x, bool)
 
 
-def _rankdata(xs: List[float]) -> List[float]:
-    # average ranks for ties, 1..n
-    n = len(xs)
-    order = sorted(range(n), key=lambda i: xs[i])
-    ranks = [0.0] * n
-    i = 0
-    while i < n:
-        j = i
-        while j + 1 < n and xs[order[j + 1]] == xs[order[i]]:
-            j += 1
-        # average rank in [i..j]
-        avg = (i + 1 + j + 1) / 2.0
-        for t in range(i, j + 1):
-            ranks[order[t]] = avg
-        i = j + 1
-    return ranks
-
-
-def _pearson(x: List[float], y: List[float]) -> float:
-    if len(x) != len(y) or not x:
-        return float("nan")
-    mx = sum(x) / len(x)
-    my = sum(y) / len(y)
-    num = 0.0
-    dx = 0.0
-    dy = 0.0
-    for a, b in zip(x, y):
-        xa = a - mx
-        yb = b - my
-        num += xa * yb
-        dx += xa * xa
-        dy += yb * yb
-    if dx <= 0 or dy <= 0:
-        return float("nan")
-    return num / math.sqrt(dx * dy)
-
-
-def _spearman(x: List[float], y: List[float]) -> float:
-    if len(x) != len(y) or not x:
-        return float("nan")
-    rx = _rankdata(x)
-    ry = _rankdata(y)
-    return _pearson(rx, ry)
-
-
 def _window_means(series: List[float], k: int) -> List[float]:
     if k <= 0:
         raise ValueError("k must be > 0")
@@ -115,14 +57,10 @@ def _align_small_to_big(small_means: List[float], k_small: int, k_big: int) -> L
 
 def _load_feasible_ratio(run_dir: Path) -> List[float]:
     p = run_dir / "local_reachability.jsonl"
-    if not p.exists():
+    if not evidence_exists(p):
         raise FileNotFoundError(f"missing: {p}")
     out: List[float] = []
-    for _ln, rec in _iter_jsonl(p):
-        nb = rec.get("neighborhood")
-        if not isinstance(nb, dict):
-            continue
-        x = nb.get("feasible_ratio")
+    for _ln, (x,) in iter_projected(p, ("neighborhood.feasible_ratio",)):
         if _is_num(x):
             out.append(float(x))
     if not out:
@@ -186,7 +124,9 @@ def main() -> int:
                 L = min(len(aligned_small), len(big))
                 aligned_small = aligned_small[:L]
                 aligned_big = big[:L]
-                rho = _spearman(aligned_small, aligned_big)
+                r = spearman(aligned_small, aligned_big)
+                if r is not None:
+                    rho = r
                 method = "aligned_by_time"
 
             comparisons.append(
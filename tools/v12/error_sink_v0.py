@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+V12 bounded verifier error sink (Research repo, stdlib only).
+
+Verifiers report one message per bad line; on systematically broken evidence
+(every line of a 10M-line file) a plain list makes memory and the report
+O(file). ErrorSink keeps, per stable error code:
+  - the total count
+  - the first K and the last K exemplars (line number + message)
+so both stay O(codes * K) however broken the evidence is. Verdicts keep
+using "any error" (bool(sink)), which counts every error, kept or not.
+
+Report shape:
+  - messages(): exemplars in the order they were added; a code with more than
+    2K errors gets one marker between its first and last K:
+      "<code>: <n> more error(s) omitted (lines <a>..<b>)"
+    With nothing omitted this is exactly the list a verifier used to build.
+  - summary(): {"error_total", "errors_omitted", "errors_by_code":
+    {code: {"count", "first_lines", "last_lines"}}} for the report's stats.
+
+Sinks merge in order (per-slice sinks from range workers, per-check sinks of
+one verifier) and round-trip through JSON (to_state / from_state) for
+gate_engine_v0 checkpoints.
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+
+DEFAULT_KEEP = 20
+
+# (seq, line_no, message); seq orders exemplars across codes
+_Entry = Tuple[int, Optional[int], str]
+
+
+class _Code:
+    __slots__ = ("count", "first", "last", "omitted", "omitted_min", "omitted_max")
+
+    def __init__(self, keep: int) -> None:
+        self.count = 0
+        self.first: List[_Entry] = []
+        self.last: Deque[_Entry] = deque(maxlen=keep)
+        self.omitted = 0
+        self.omitted_min: Optional[int] = None
+        self.omitted_max: Optional[int] = None
+
+    def drop(self, n: int, lo: Optional[int], hi: Optional[int]) -> None:
+        self.omitted += n
+        if lo is not None:
+            self.omitted_min = lo if self.omitted_min is None else min(self.omitted_min, lo)
+        if hi is not None:
+            self.omitted_max = hi if self.omitted_max is None else max(self.omitted_max, hi)
+
+
+class ErrorSink:
+    """Bounded, order-preserving error collector; see the module docstring."""
+
+    def __init__(self, keep: int = DEFAULT_KEEP) -> None:
+        if keep < 1:
+            raise ValueError(f"keep must be >= 1, got {keep}")
+        self.keep = keep
+        self.total = 0
+        self._seq = 0
+        self._codes: Dict[str, _Code] = {}
+
+    def __bool__(self) -> bool:
+        return self.total > 0
+
+    def __len__(self) -> int:
+        return self.total
+
+    def add(self, code: str, message: str, line_no: Optional[int] = None) -> None:
+        c = self._codes.get(code)
+        if c is None:
+            c = self._codes[code] = _Code(self.keep)
+        self.total += 1
+        c.count += 1
+        self._seq += 1
+        entry = (self._seq, line_no, message)
+        if len(c.first) < self.keep:
+            c.first.append(entry)
+            return
+        if len(c.last) == self.keep:
+            evicted = c.last[0][1]
+            c.drop(1, evicted, evicted)
+        c.last.append(entry)
+
+    def merge(self, other: "ErrorSink") -> None:
+        """Append everything `other` collected (kept exemplars and omitted counts), in its order."""
+        for _key, code, item in other._items():
+            if isinstance(item, _Code):
+                # other's omitted block sits between its first and last K of `code`: those
+                # were just added, and other's last K (added next) evict what precedes it
+                c = self._codes[code]
+                c.drop(item.omitted, item.omitted_min, item.omitted_max)
+                c.count += item.omitted
+                self.total += item.omitted
+            else:
+                self.add(code, item[2], item[1])
+
+    def _items(self) -> List[Tuple[float, str, Any]]:
+        # exemplars by seq, each code's omitted block right after its first K
+        out: List[Tuple[float, str, Any]] = []
+        for code, c in self._codes.items():
+            out.extend((e[0], code, e) for e in c.first)
+            out.extend((e[0], code, e) for e in c.last)
+            if c.omitted:
+                out.append((c.first[-1][0] + 0.5, code, c))
+        out.sort(key=lambda t: t[0])
+        return out
+
+    def messages(self) -> List[str]:
+        out: List[str] = []
+        for _key, code, item in self._items():
+            if isinstance(item, _Code):
+                lines = "" if item.omitted_min is None else f" (lines {item.omitted_min}..{item.omitted_max})"
+                out.append(f"{code}: {item.omitted} more error(s) omitted{lines}")
+            else:
+                out.append(item[2])
+        return out
+
+    def counts(self) -> Dict[str, int]:
+        return {code: c.count for code, c in self._codes.items()}
+
+    @property
+    def omitted(self) -> int:
+        return sum(c.omitted for c in self._codes.values())
+
+    def summary(self) -> Dict[str, Any]:
+        return {
+            "error_total": self.total,
+            "errors_omitted": self.omitted,
+            "errors_by_code": {
+                code: {
+                    "count": c.count,
+                    "first_lines": [e[1] for e in c.first],
+                    "last_lines": [e[1] for e in c.last],
+                }
+                for code, c in self._codes.items()
+            },
+        }
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "keep": self.keep,
+            "total": self.total,
+            "seq": self._seq,
+            "codes": {
+                code: {
+                    "count": c.count,
+                    "first": [list(e) for e in c.first],
+                    "last": [list(e) for e in c.last],
+                    "omitted": [c.omitted, c.omitted_min, c.omitted_max],
+                }
+                for code, c in self._codes.items()
+            },
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "ErrorSink":
+        sink = cls(state["keep"])
+        sink.total = state["total"]
+        sink._seq = state["seq"]
+        for code, d in state["codes"].items():
+            c = sink._codes[code] = _Code(sink.keep)
+            c.count = d["count"]
+            c.first = [(e[0], e[1], e[2]) for e in d["first"]]
+            c.last.extend((e[0], e[1], e[2]) for e in d["last"])
+            c.omitted, c.omitted_min, c.omitted_max = d["omitted"]
+        return sink
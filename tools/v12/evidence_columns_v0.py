@@ -0,0 +1,438 @@
+#!/usr/bin/env python3
+"""
+V12 columnar sidecar cache for run_dir evidence JSONL (Research repo, stdlib only).
+
+Purpose:
+  Decode a strict-JSONL evidence file (market_snapshot / decision_trace /
+  interaction_impedance / ...) once, materialize typed per-field columns, and
+  persist them next to the run_dir so later reads are memory-mapped column
+  loads instead of full JSON re-parses.
+
+Column model (one column per dotted scalar path, e.g. `metrics.world_u`):
+  - kind `bool`  -> uint8 values   (array typecode 'B')
+  - kind `int`   -> int64 values   (array typecode 'q')
+  - kind `float` -> float64 values (array typecode 'd'; int+float mixes promote here)
+  - kind `str`   -> int32 dictionary codes (typecode 'i') + dictionary list
+  - kind `null`  -> only null/absent observed (no values)
+  - kind `object` / `unsupported` -> nested object paths, lists, type mixes,
+    out-of-range ints; metadata only, callers must fall back to full decoding
+  Every column carries a per-record state mask: 0=absent, 1=null, 2=value.
+
+Sidecar layout (location rules: evidence_io_v0.cache_dir_for):
+  <run_dir>/../.evidence_cache_v0/<run_dir name>/<file name>/columns/
+    meta.json, line_no.bin, c<k>.state.bin, c<k>.values.bin, c<k>.dict.json
+
+Cache key (fail-closed):
+  - source size + mtime_ns match -> hit
+  - size matches but mtime differs -> sha256 is recomputed and must match
+  - rotated/compressed sources (evidence_io_v0.jsonl_segments): every
+    segment's name + size + mtime_ns must match, no sha256 fallback
+  - anything else (or format/byteorder mismatch) -> rebuild from source
+  A strict-JSONL violation raises ValueError and writes no cache.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import mmap
+import shutil
+import sys
+from array import array
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_io_v0 import (
+    cache_dir_for,
+    cache_enabled,
+    iter_evidence_lines,
+    jsonl_segments,
+    segment_stats,
+    source_matches,
+    write_sidecar_atomic,
+    write_strict_certificate,
+)
+
+
+CACHE_FORMAT = "evidence_columns_v0"
+
+STATE_ABSENT = 0
+STATE_NULL = 1
+STATE_VALUE = 2
+
+_TYPECODES = {"bool": "B", "int": "q", "float": "d", "str": "i"}
+_INT64_MIN = -(2**63)
+_INT64_MAX = 2**63 - 1
+_DICT = object()  # flatten marker: path holds a nested object
+
+
+def columns_dir_for(path: Path, cache_root: Optional[Path] = None) -> Path:
+    return cache_dir_for(path, cache_root) / "columns"
+
+
+class Column:
+    """One typed column; `values`/`state` are arrays or memory-mapped memoryviews."""
+
+    def __init__(
+        self,
+        name: str,
+        kind: str,
+        n: int,
+        state: Any,
+        values: Any = None,
+        dictionary: Optional[List[str]] = None,
+        counts: Optional[Dict[str, int]] = None,
+    ) -> None:
+        self.name = name
+        self.kind = kind
+        self.n = n
+        self.state = state
+        self.values = values
+        self.dictionary = dictionary
+        self.counts = counts or {}
+
+    @property
+    def usable(self) -> bool:
+        return self.kind in ("bool", "int", "float", "str", "null")
+
+    @property
+    def all_values(self) -> bool:
+        """True when every record carries a non-null value for this path."""
+        return self.usable and self.counts.get("value", 0) == self.n
+
+    def get(self, i: int) -> Any:
+        if not self.usable:
+            raise ValueError(f"column {self.name} is {self.kind}; decode the source instead")
+        if self.state[i] != STATE_VALUE:
+            return None
+        v = self.values[i]
+        if self.kind == "bool":
+            return bool(v)
+        if self.kind == "str":
+            return self.dictionary[v]  # type: ignore[index]
+        return v
+
+    def to_list(self) -> List[Any]:
+        if not self.usable:
+            raise ValueError(f"column {self.name} is {self.kind}; decode the source instead")
+        if self.kind == "null":
+            return [None] * self.n
+        raw = self.values.tolist()
+        if self.kind == "str":
+            d = self.dictionary or []
+            raw = [d[c] for c in raw]
+        elif self.kind == "bool":
+            raw = [bool(v) for v in raw]
+        if self.counts.get("value", 0) == self.n:
+            return raw
+        st = self.state
+        return [v if st[i] == STATE_VALUE else None for i, v in enumerate(raw)]
+
+
+class ColumnTable:
+    """All columns of one JSONL file, indexed by record order (blank lines excluded)."""
+
+    def __init__(self, path: Path, n_records: int, line_no: Any, columns: Dict[str, Column], from_cache: bool) -> None:
+        self.path = path
+        self.n_records = n_records
+        self.line_no = line_no
+        self.columns = columns
+        self.from_cache = from_cache
+
+    def column(self, name: str) -> Optional[Column]:
+        """None when the path never occurs in the file (every record absent)."""
+        return self.columns.get(name)
+
+
+# ---------------------------------------------------------------------------
+# Build (single strict pass)
+# ---------------------------------------------------------------------------
+
+
+class _ColumnBuilder:
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.kind = "null"
+        self.state = bytearray()
+        self.values: Optional[array] = None
+        self.dict_index: Dict[str, int] = {}
+
+    def _pad(self, i: int) -> None:
+        gap = i - len(self.state)
+        if gap > 0:
+            self.state.extend(bytes(gap))
+            if self.values is not None:
+                self.values.extend([-1 if self.kind == "str" else 0] * gap)
+
+    def _set_kind(self, kind: str) -> None:
+        self.kind = kind
+        if kind in _TYPECODES:
+            fill = -1 if kind == "str" else 0
+            self.values = array(_TYPECODES[kind], [fill]) * len(self.state)
+        else:
+            self.values = None
+            self.dict_index = {}
+
+    def add(self, i: int, v: Any) -> None:
+        self._pad(i)
+        if v is None:
+            self.state.append(STATE_NULL)
+            if self.values is not None:
+                self.values.append(-1 if self.kind == "str" else 0)
+            return
+        if self.kind in ("unsupported",):
+            self.state.append(STATE_VALUE)
+            return
+        if self.kind == "null":
+            if v is _DICT:
+                self._set_kind("object")
+            elif isinstance(v, bool):
+                self._set_kind("bool")
+            elif isinstance(v, int):
+                self._set_kind("int" if _INT64_MIN <= v <= _INT64_MAX else "unsupported")
+            elif isinstance(v, float):
+                self._set_kind("float")
+            elif isinstance(v, str):
+                self._set_kind("str")
+            else:
+                self._set_kind("unsupported")
+        elif self.kind == "int" and isinstance(v, float):
+            self.values = array("d", self.values)  # type: ignore[arg-type]
+            self.kind = "float"
+
+        ok = False
+        k = self.kind
+        if k == "object":
+            ok = v is _DICT
+        elif k == "bool":
+            ok = isinstance(v, bool)
+        elif k == "int":
+            ok = isinstance(v, int) and not isinstance(v, bool) and _INT64_MIN <= v <= _INT64_MAX
+        elif k == "float":
+            ok = isinstance(v, (int, float)) and not isinstance(v, bool)
+            if ok:
+                v = float(v)
+        elif k == "str":
+            ok = isinstance(v, str)
+            if ok:
+                code = self.dict_index.get(v)
+                if code is None:
+                    code = len(self.dict_index)
+                    self.dict_index[v] = code
+                v = code
+        if not ok:
+            self._set_kind("unsupported")
+            self.state.append(STATE_VALUE)
+            return
+        self.state.append(STATE_VALUE)
+        if self.values is not None:
+            self.values.append(int(v) if k == "bool" else v)
+
+    def finish(self, n: int) -> Column:
+        self._pad(n)
+        counts = {
+            "value": self.state.count(STATE_VALUE),
+            "null": self.state.count(STATE_NULL),
+            "absent": self.state.count(STATE_ABSENT),
+        }
+        dictionary = None
+        if self.kind == "str":
+            dictionary = [""] * len(self.dict_index)
+            for s, c in self.dict_index.items():
+                dictionary[c] = s
+        values = self.values if self.kind in _TYPECODES else None
+        return Column(self.name, self.kind, n, self.state, values, dictionary, counts)
+
+
+def _flatten(obj: Dict[str, Any], prefix: str, out: List[Tuple[str, Any]]) -> None:
+    for k, v in obj.items():
+        p = f"{prefix}{k}"
+        if isinstance(v, dict):
+            out.append((p, _DICT))
+            _flatten(v, p + ".", out)
+        else:
+            out.append((p, v))
+
+
+def _build_table(path: Path) -> Tuple[ColumnTable, str]:
+    builders: Dict[str, _ColumnBuilder] = {}
+    line_nos = array("q")
+    h = hashlib.sha256()
+    n = 0
+    for line_no, raw in enumerate(iter_evidence_lines(path, binary=True), 1):
+        h.update(raw)
+        s = raw.decode("utf-8").strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        flat: List[Tuple[str, Any]] = []
+        _flatten(obj, "", flat)
+        for p, v in flat:
+            b = builders.get(p)
+            if b is None:
+                b = _ColumnBuilder(p)
+                builders[p] = b
+            b.add(n, v)
+        line_nos.append(line_no)
+        n += 1
+    columns = {p: b.finish(n) for p, b in builders.items()}
+    return ColumnTable(path, n, line_nos, columns, from_cache=False), h.hexdigest()
+
+
+# ---------------------------------------------------------------------------
+# Persist / load
+# ---------------------------------------------------------------------------
+
+
+def _write_cache(table: ColumnTable, cache_dir: Path, source: Dict[str, Any]) -> None:
+    files: Dict[str, bytes] = {"line_no.bin": table.line_no.tobytes()}
+    cols_meta: Dict[str, Any] = {}
+    for idx, (name, col) in enumerate(sorted(table.columns.items())):
+        stem = f"c{idx}"
+        files[f"{stem}.state.bin"] = bytes(col.state)
+        if col.values is not None:
+            files[f"{stem}.values.bin"] = col.values.tobytes()
+        if col.dictionary is not None:
+            files[f"{stem}.dict.json"] = json.dumps(col.dictionary, ensure_ascii=False).encode("utf-8")
+        cols_meta[name] = {"kind": col.kind, "stem": stem, "counts": col.counts}
+    meta = {
+        "cache_format": CACHE_FORMAT,
+        "byteorder": sys.byteorder,
+        "source": source,
+        "n_records": table.n_records,
+        "columns": cols_meta,
+    }
+    write_sidecar_atomic(cache_dir, files, meta)
+
+
+def _map(path: Path, typecode: str, n: int) -> Any:
+    if n <= 0:
+        return memoryview(array(typecode))
+    with path.open("rb") as f:
+        mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    mv = memoryview(mm)
+    return mv if typecode == "B" else mv.cast(typecode)
+
+
+def _load_cache(path: Path, cache_dir: Path, meta: Dict[str, Any]) -> ColumnTable:
+    n = int(meta["n_records"])
+    columns: Dict[str, Column] = {}
+    for name, m in meta["columns"].items():
+        stem = m["stem"]
+        kind = m["kind"]
+        state = _map(cache_dir / f"{stem}.state.bin", "B", n)
+        values = _map(cache_dir / f"{stem}.values.bin", _TYPECODES[kind], n) if kind in _TYPECODES else None
+        dictionary = None
+        if kind == "str":
+            dictionary = json.loads((cache_dir / f"{stem}.dict.json").read_text(encoding="utf-8"))
+        columns[name] = Column(name, kind, n, state, values, dictionary, m.get("counts"))
+    line_no = _map(cache_dir / "line_no.bin", "q", n)
+    return ColumnTable(path, n, line_no, columns, from_cache=True)
+
+
+def _cache_is_valid(path: Path, meta: Dict[str, Any], st: Any) -> bool:
+    if meta.get("cache_format") != CACHE_FORMAT or meta.get("byteorder") != sys.byteorder:
+        return False
+    if isinstance(st, list):
+        return (meta.get("source") or {}).get("segments") == st
+    return source_matches(path, meta.get("source") or {}, st)
+
+
+def _source_stat(path: Path, segs: List[Path]) -> Any:
+    """os.stat_result for a plain file, segment_stats(...) for rotated/compressed streams."""
+    return path.stat() if segs == [path] else segment_stats(segs)
+
+
+def _unchanged(before: Any, after: Any) -> bool:
+    if isinstance(before, list):
+        return before == after
+    return after.st_size == before.st_size and after.st_mtime_ns == before.st_mtime_ns
+
+
+def load_columns(path: Path, cache_root: Optional[Path] = None, use_cache: Optional[bool] = None) -> ColumnTable:
+    """
+    Return typed columns for a strict-JSONL file, via the sidecar cache when valid.
+
+    Raises ValueError on strict-JSONL violations (same wording as iter_jsonl).
+    Cache write failures (read-only media, races) are silent: the freshly
+    built in-memory table is returned either way.
+    """
+    path = path.expanduser().resolve()
+    if use_cache is None:
+        use_cache = cache_enabled()
+    cache_dir = columns_dir_for(path, cache_root)
+    segs = jsonl_segments(path)
+    st = _source_stat(path, segs)
+
+    if use_cache:
+        meta_path = cache_dir / "meta.json"
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            if _cache_is_valid(path, meta, st):
+                return _load_cache(path, cache_dir, meta)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    table, sha = _build_table(path)
+
+    if use_cache:
+        # a file still being appended to (or rotated mid-read) is never cached
+        if _unchanged(st, _source_stat(path, segs)):
+            if isinstance(st, list):
+                source = {"path": str(path), "segments": st, "sha256": sha}
+            else:
+                source = {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha}
+            try:
+                _write_cache(table, cache_dir, source)
+            except OSError:
+                pass
+            # the build was a full strict pass: projection reads may take the fast path
+            if not isinstance(st, list):
+                write_strict_certificate(path, source, table.n_records, cache_root)
+    return table
+
+
+def invalidate(path: Path, cache_root: Optional[Path] = None) -> bool:
+    cache_dir = columns_dir_for(path, cache_root)
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir)
+        return True
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Fail-closed extraction helpers
+# Each returns None unless EVERY record satisfies the contract, so callers can
+# fall back to their per-record decoder and report the exact original error.
+# ---------------------------------------------------------------------------
+
+
+def num_values(table: ColumnTable, name: str) -> Optional[List[float]]:
+    """Every record has a non-bool number at `name` -> list of floats."""
+    col = table.column(name)
+    if col is None or col.kind not in ("int", "float") or not col.all_values:
+        return None
+    return [float(x) for x in col.values.tolist()]
+
+
+def str_values(table: ColumnTable, name: str, allow_empty: bool = False) -> Optional[List[str]]:
+    """Every record has a string (non-empty unless allow_empty) at `name`."""
+    col = table.column(name)
+    if col is None or col.kind != "str" or not col.all_values:
+        return None
+    if not allow_empty and "" in (col.dictionary or []):
+        return None
+    return col.to_list()
+
+
+def bool_values(table: ColumnTable, name: str) -> Optional[List[bool]]:
+    """Every record has a JSON boolean at `name`."""
+    col = table.column(name)
+    if col is None or col.kind != "bool" or not col.all_values:
+        return None
+    return col.to_list()
@@ -0,0 +1,1334 @@
+#!/usr/bin/env python3
+"""
+V12 shared evidence I/O helpers (Research repo, stdlib only).
+
+Scope:
+  Importable helpers shared by tools/v12 verifiers and calibration tools
+  (and by tools/verify_step26_evidence.py), so evidence files are located,
+  indexed and read the same way everywhere.
+
+Sidecar layout (never written inside the run_dir; evidence dirs stay frozen):
+  <run_dir>/../.evidence_cache_v0/<run_dir name>/<file name>/...
+  Override the root with PROMETHEUS_EVIDENCE_CACHE_ROOT; disable all sidecar
+  writes/reads with PROMETHEUS_EVIDENCE_CACHE=0.
+
+Line index (`{file, line}` evidence_refs):
+  - one pass over the file records the byte offset of every physical line
+    (array of uint64, typecode 'Q'), persisted as line_offsets.bin
+  - the source is memory-mapped; resolving a 1-based line is one slice
+  - index is reused only while source size + mtime_ns (or sha256) match
+
+Evidence segments (`jsonl_segments`, cold / long-run run_dirs):
+  - a logical file `<name>.jsonl` may be stored as `<name>.jsonl.gz` /
+    `<name>.jsonl.zst` and/or rotated as `<name>.jsonl.N` ... `.1` + live file
+    (logrotate order: highest N is oldest), each segment optionally compressed
+  - readers stream the segments oldest first with continuous line numbers;
+    .gz is stdlib, .zst needs Python >= 3.14 or the optional `zstandard`
+  - two codecs for one segment, or a gap in N, is a hard error (fail-closed)
+  - use `evidence_exists` (not Path.exists) for presence checks
+
+Strict-JSONL (fail-closed, same as every per-tool `_iter_jsonl` copy):
+  - blank lines are skipped (line numbers still count them)
+  - every non-empty line must be one JSON object
+  - the first violation raises ValueError naming the file and 1-based line
+  A complete strict pass over an unchanged file leaves a strict certificate
+  (strict_jsonl/meta.json) in the sidecar dir.
+
+Range-parallel maps (`map_jsonl_ranges`, `--workers N` on verifiers):
+  - files >= 8 MiB are cut into newline-aligned byte ranges; each worker runs
+    fn over its (line_no, record) rows and returns a compact partial
+  - partials are yielded in file order and the first strict violation is
+    raised at the same position (same message) as the serial iterator
+  - fn must be a module-level function (or functools.partial of one)
+
+Live tail (`JsonlTail`, follow modes):
+  - polls a growing plain file; complete new lines only (a partial trailing
+    line waits for its newline), one parse per record, rotation followed
+
+Tee pass (`tee_jsonl`, packaging):
+  - one serial read feeds the strict parser, a sha256 and an optional copy
+    sink, so "validate + hash + copy" costs a single read of the source
+  - a file that needs no validation (valid strict certificate: sha256 and
+    record count already known) is copied with `copy_file_kernel` instead
+
+Projection reads (`iter_projected`, dotted field paths):
+  - the shape of a fully decoded line (keys, nesting, separators) becomes a
+    line template; scalar values are token classes, projected paths are
+    captured, so lines matching it never build a dict
+  - without a strict certificate the template's token classes follow the
+    json.loads grammar exactly (a match is itself the strict check); with one,
+    they only track token boundaries
+  - lines that match no template (new shape, blank, invalid) are fully decoded
+    and raise exactly like the strict iterator
+
+Timestamps (`ts_epoch_us_tz` / `ts_epoch_us_list` / `check_ts_tz` / `delta_ms`):
+  - ts_utc strings become integer epoch time once (in the range workers, for
+    verifiers), so ordering, interval and jitter checks are integer
+    arithmetic (no timedelta / float rounding)
+  - each parsed value keeps its offset-awareness: a naive ts_utc (no offset)
+    still orders against naive ones, but next to an offset-carrying one the
+    checks fail closed with datetime's TypeError text (`check_ts_tz`)
+
+This module is not a CLI; tools import it as a sibling module
+(`python3 tools/v12/<tool>.py` puts tools/v12 on sys.path).
+"""
+
+from __future__ import annotations
+
+import gzip
+import hashlib
+import io
+import json
+import mmap
+import os
+import re
+import shutil
+import sys
+import threading
+from array import array
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from datetime import datetime, timezone
+from functools import partial
+from itertools import repeat
+from operator import attrgetter, mul
+from pathlib import Path
+from typing import IO, Any, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+
+CACHE_DIRNAME = ".evidence_cache_v0"
+ENV_CACHE_ROOT = "PROMETHEUS_EVIDENCE_CACHE_ROOT"
+ENV_CACHE_ENABLE = "PROMETHEUS_EVIDENCE_CACHE"
+
+LINE_INDEX_FORMAT = "evidence_line_index_v0"
+STRICT_CERT_FORMAT = "evidence_strict_jsonl_v0"
+
+
+def cache_enabled() -> bool:
+    return os.environ.get(ENV_CACHE_ENABLE, "1").strip().lower() not in ("0", "off", "false", "no")
+
+
+def cache_dir_for(path: Path, cache_root: Optional[Path] = None) -> Path:
+    src_dir = path.expanduser().resolve().parent
+    root = cache_root
+    if root is None and os.environ.get(ENV_CACHE_ROOT):
+        root = Path(os.environ[ENV_CACHE_ROOT])
+    if root is None:
+        return src_dir.parent / CACHE_DIRNAME / src_dir.name / path.name
+    # shared root: disambiguate run_dirs that share a basename
+    tag = hashlib.sha256(str(src_dir).encode("utf-8")).hexdigest()[:12]
+    return root.expanduser().resolve() / f"{src_dir.name}_{tag}" / path.name
+
+
+def sha256_file(path: Path) -> str:
+    h = hashlib.sha256()
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+    return h.hexdigest()
+
+
+def source_matches(path: Path, source: Dict[str, Any], st: os.stat_result) -> bool:
+    """Sidecar key check: size must match; mtime_ns match is a hit, otherwise sha256 decides."""
+    if source.get("size") != st.st_size:
+        return False
+    if source.get("mtime_ns") == st.st_mtime_ns:
+        return True
+    return source.get("sha256") == sha256_file(path)
+
+
+def write_sidecar_atomic(cache_dir: Path, files: Dict[str, bytes], meta: Dict[str, Any]) -> None:
+    """Write `files` + meta.json into a temp dir, then swap it in (meta.json last)."""
+    tmp = cache_dir.parent / f".tmp_{cache_dir.name}.{os.getpid()}"
+    if tmp.exists():
+        shutil.rmtree(tmp)
+    tmp.mkdir(parents=True)
+    for name, data in files.items():
+        (tmp / name).write_bytes(data)
+    (tmp / "meta.json").write_text(json.dumps(meta, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    if cache_dir.exists():
+        shutil.rmtree(cache_dir)
+    os.replace(tmp, cache_dir)
+
+
+# ---------------------------------------------------------------------------
+# Byte-offset line index
+# ---------------------------------------------------------------------------
+
+
+def _scan_line_offsets(path: Path) -> "tuple[array, str]":
+    """Offsets of every physical line start, plus a final entry == file size."""
+    offsets = array("Q", [0])
+    h = hashlib.sha256()
+    base = 0
+    with path.open("rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            h.update(chunk)
+            i = chunk.find(b"\n")
+            while i != -1:
+                offsets.append(base + i + 1)
+                i = chunk.find(b"\n", i + 1)
+            base += len(chunk)
+    if offsets[-1] != base:
+        offsets.append(base)  # last line without trailing newline
+    return offsets, h.hexdigest()
+
+
+class LineIndex:
+    """
+    Random access to physical lines (1-based, like `enumerate(f, 1)`).
+
+    Use as a context manager, or call close().
+    """
+
+    def __init__(self, path: Path, offsets: Any) -> None:
+        self.path = path
+        self.offsets = offsets
+        self._f = path.open("rb")
+        self._mm: Optional[mmap.mmap] = None
+        if self.offsets[-1] > 0:
+            self._mm = mmap.mmap(self._f.fileno(), 0, access=mmap.ACCESS_READ)
+
+    @property
+    def line_count(self) -> int:
+        return len(self.offsets) - 1
+
+    def line(self, line_1based: int) -> bytes:
+        if line_1based <= 0 or line_1based > self.line_count or self._mm is None:
+            raise IndexError(f"line out of range: {self.path.name}:{line_1based}")
+        return self._mm[self.offsets[line_1based - 1] : self.offsets[line_1based]]
+
+    def close(self) -> None:
+        if self._mm is not None:
+            self._mm.close()
+            self._mm = None
+        self._f.close()
+
+    def __enter__(self) -> "LineIndex":
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        self.close()
+
+
+def open_line_index(path: Path, cache_root: Optional[Path] = None, use_cache: Optional[bool] = None) -> LineIndex:
+    """Load the persisted offsets when the source is unchanged, else rebuild (and persist best-effort)."""
+    path = path.expanduser().resolve()
+    if use_cache is None:
+        use_cache = cache_enabled()
+    cache_dir = cache_dir_for(path, cache_root) / "line_index"
+    st = path.stat()
+
+    if use_cache:
+        try:
+            meta = json.loads((cache_dir / "meta.json").read_text(encoding="utf-8"))
+            if (
+                meta.get("format") == LINE_INDEX_FORMAT
+                and meta.get("byteorder") == sys.byteorder
+                and source_matches(path, meta.get("source") or {}, st)
+            ):
+                offsets = array("Q")
+                with (cache_dir / "line_offsets.bin").open("rb") as f:
+                    offsets.frombytes(f.read())
+                if len(offsets) == int(meta["entries"]):
+                    return LineIndex(path, offsets)
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+    offsets, sha = _scan_line_offsets(path)
+    if use_cache:
+        st2 = path.stat()
+        if st2.st_size == st.st_size and st2.st_mtime_ns == st.st_mtime_ns:
+            meta = {
+                "format": LINE_INDEX_FORMAT,
+                "byteorder": sys.byteorder,
+                "source": {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": sha},
+                "entries": len(offsets),
+            }
+            try:
+                write_sidecar_atomic(cache_dir, {"line_offsets.bin": offsets.tobytes()}, meta)
+            except OSError:
+                pass
+    return LineIndex(path, offsets)
+
+
+# ---------------------------------------------------------------------------
+# Evidence segments (rotation + compression)
+# ---------------------------------------------------------------------------
+
+
+SEGMENT_CODECS = (".gz", ".zst")
+
+
+def jsonl_segments(path: Path) -> List[Path]:
+    """
+    Physical files behind the logical evidence stream `path`, oldest first.
+
+    logrotate numbering: `<name>.N` ... `<name>.1`, then the live `<name>`;
+    each may carry a .gz/.zst suffix. Falls back to [path] when nothing
+    matches, so readers raise the usual FileNotFoundError.
+    """
+    rx = re.compile(re.escape(path.name) + r"(?:\.([1-9][0-9]*))?(\.gz|\.zst)?")
+    try:
+        entries = os.listdir(path.parent)
+    except OSError:
+        return [path]
+    by_index: Dict[int, List[str]] = {}
+    for entry in entries:
+        m = rx.fullmatch(entry)
+        if m is not None:
+            by_index.setdefault(int(m.group(1) or 0), []).append(entry)
+    if not by_index:
+        return [path]
+    for names in by_index.values():
+        if len(names) > 1:
+            raise ValueError(f"ambiguous evidence segments for {path}: {sorted(names)}")
+    rotated = sorted((k for k in by_index if k), reverse=True)
+    if rotated and rotated[0] != len(rotated):
+        gap = min(set(range(1, rotated[0] + 1)) - set(rotated))
+        raise ValueError(f"rotated evidence segments for {path} are not contiguous: missing {path.name}.{gap}")
+    order = rotated + ([0] if 0 in by_index else [])
+    return [path.parent / by_index[k][0] for k in order]
+
+
+def evidence_exists(path: Path) -> bool:
+    """Path.exists() that also accepts a .jsonl stored compressed and/or rotated."""
+    if not path.name.endswith(".jsonl"):
+        return path.exists()
+    try:
+        return any(seg.exists() for seg in jsonl_segments(path))
+    except ValueError:
+        return True  # present but ambiguous: the reader fails closed with the reason
+
+
+def is_compressed(seg: Path) -> bool:
+    return seg.name.endswith(SEGMENT_CODECS)
+
+
+def segment_stats(segs: Sequence[Path]) -> List[Dict[str, Any]]:
+    """Sidecar key for a multi-segment stream (no sha256 fallback: any change rebuilds)."""
+    out: List[Dict[str, Any]] = []
+    for seg in segs:
+        st = seg.stat()
+        out.append({"name": seg.name, "size": st.st_size, "mtime_ns": st.st_mtime_ns})
+    return out
+
+
+def _open_zstd(seg: Path) -> IO[bytes]:
+    try:
+        from compression import zstd  # Python >= 3.14
+    except ImportError:
+        zstd = None
+    if zstd is not None:
+        return zstd.open(seg, "rb")
+    try:
+        import zstandard
+    except ImportError:
+        raise RuntimeError(f"cannot read {seg}: .zst evidence needs Python >= 3.14 or the optional 'zstandard' package") from None
+    reader = zstandard.ZstdDecompressor().stream_reader(seg.open("rb"), read_across_frames=True, closefd=True)
+    return io.BufferedReader(reader)
+
+
+def open_jsonl_segment(seg: Path, binary: bool = True) -> IO[Any]:
+    """Open one segment for streaming reads; .gz/.zst are decompressed on the fly."""
+    if seg.name.endswith(".gz"):
+        f: IO[Any] = gzip.open(seg, "rb")
+    elif seg.name.endswith(".zst"):
+        f = _open_zstd(seg)
+    elif binary:
+        return seg.open("rb")
+    else:
+        return seg.open("r", encoding="utf-8")
+    return f if binary else io.TextIOWrapper(f, encoding="utf-8")
+
+
+def iter_evidence_lines(path: Path, binary: bool = False) -> Iterator[Any]:
+    """
+    Physical lines of the logical stream, segment after segment, so that
+    enumerate(..., 1) numbers lines continuously across rotations. Text mode
+    splits like open(path, "r") (universal newlines); binary mode on b"\n".
+    """
+    for seg in jsonl_segments(path):
+        with open_jsonl_segment(seg, binary) as f:
+            yield from f
+
+
+# ---------------------------------------------------------------------------
+# Strict JSONL iteration (serial + process-parallel)
+# ---------------------------------------------------------------------------
+
+
+PARALLEL_MIN_BYTES = 8 * 1024 * 1024
+_RANGE_MIN_BYTES = 4 * 1024 * 1024
+
+
+def iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
+
+
+def iter_jsonl_raw(path: Path) -> Iterable[Tuple[int, str, Dict[str, Any]]]:
+    """iter_jsonl that also yields the stripped line text (for re-packaging records byte-for-byte)."""
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, s, obj
+
+
+def resolve_workers(workers: int) -> int:
+    """CLI convention: 1 = serial (default), 0 = one worker per CPU."""
+    if workers < 0:
+        raise ValueError(f"workers must be >= 0, got {workers}")
+    return workers or (os.cpu_count() or 1)
+
+
+def _split_ranges(path: Path, size: int, n: int, start: int = 0) -> List[Tuple[int, int]]:
+    """Byte ranges [start, end) that each begin right after a b"\\n" (or at `start`)."""
+    step = max(_RANGE_MIN_BYTES, -(-(size - start) // n))
+    out: List[Tuple[int, int]] = []
+    with path.open("rb") as f:
+        while start < size:
+            cut = start + step
+            if cut >= size:
+                out.append((start, size))
+                break
+            f.seek(cut)
+            cut += len(f.readline())
+            out.append((start, cut))
+            start = cut
+    return out
+
+
+def _read_range(path: str, start: int, end: int) -> bytes:
+    with open(path, "rb") as f:
+        f.seek(start)
+        return f.read(end - start)
+
+
+def _count_range_lines(path: str, start: int, end: int) -> int:
+    """Lines as text mode sees them (universal newlines: \\n, \\r\\n, \\r)."""
+    data = _read_range(path, start, end)
+    n = data.count(b"\n") + data.count(b"\r") - data.count(b"\r\n")
+    if data and data[-1:] not in (b"\n", b"\r"):
+        n += 1
+    return n
+
+
+class _StrictRows:
+    """
+    One-shot iter_jsonl over an open text stream; the first violation ends
+    iteration (instead of raising) and is kept in `error` for the caller.
+    """
+
+    def __init__(self, lines: Iterable[str], path: str, first_line_no: int) -> None:
+        self.path = path
+        self.error: Optional[Tuple[str, Any]] = None
+        self._it = self._rows(lines, first_line_no)
+
+    def __iter__(self) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        return self._it
+
+    def _rows(self, lines: Iterable[str], first_line_no: int) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        try:
+            for line_no, raw in enumerate(lines, first_line_no):
+                s = raw.strip()
+                if not s:
+                    continue
+                try:
+                    obj = json.loads(s)
+                except json.JSONDecodeError as e:
+                    self.error = ("value", f"Invalid JSONL at {self.path} line {line_no}: {e}")
+                    return
+                if not isinstance(obj, dict):
+                    self.error = ("value", f"JSONL record must be an object at {self.path} line {line_no}")
+                    return
+                yield line_no, obj
+        except (UnicodeDecodeError, EOFError, OSError) as e:
+            self.error = ("stream", e)  # bad bytes, truncated/corrupt compressed segment
+
+    def drain(self) -> None:
+        for _ in self._it:  # fn may stop early; the slice must still be fully checked
+            pass
+
+    def raise_error(self) -> None:
+        if self.error is None:
+            return
+        if self.error[0] == "value":
+            raise ValueError(self.error[1])
+        raise self.error[1]
+
+
+class _StrictRowsAt(_StrictRows):
+    """_StrictRows over (byte_offset, line) pairs; rows are (line_no, record, byte_offset)."""
+
+    def _rows(self, lines: Iterable[Any], first_line_no: int) -> Iterator[Any]:
+        try:
+            for line_no, (offset, raw) in enumerate(lines, first_line_no):
+                s = raw.strip()
+                if not s:
+                    continue
+                try:
+                    obj = json.loads(s)
+                except json.JSONDecodeError as e:
+                    self.error = ("value", f"Invalid JSONL at {self.path} line {line_no}: {e}")
+                    return
+                if not isinstance(obj, dict):
+                    self.error = ("value", f"JSONL record must be an object at {self.path} line {line_no}")
+                    return
+                yield line_no, obj, offset
+        except (UnicodeDecodeError, EOFError, OSError) as e:
+            self.error = ("stream", e)
+
+
+def _line_offsets(lines: Iterable[str]) -> Iterator[Tuple[int, str]]:
+    # lines must be untranslated (newline=""), so that they re-encode to their exact bytes
+    offset = 0
+    for raw in lines:
+        yield offset, raw
+        offset += len(raw) if raw.isascii() else len(raw.encode("utf-8"))
+
+
+def _map_range(
+    seg: str, start: int, end: int, first_line_no: int, fn: Callable[[Iterable[Any]], Any], label: str
+) -> Tuple[Any, Any]:
+    """Worker: run fn over one byte range of a plain segment; returns (partial, error) with error ("value", msg) | ("decode", None)."""
+    data = _read_range(seg, start, end)
+    rows = _StrictRows(io.TextIOWrapper(io.BytesIO(data), encoding="utf-8"), label, first_line_no)
+    partial = fn(rows)
+    rows.drain()
+    err = rows.error
+    if err is not None and err[0] == "value":
+        try:
+            data.decode("utf-8")  # a later bad byte would surface first in the serial reader
+        except UnicodeDecodeError:
+            err = ("decode", None)
+    elif err is not None:
+        err = ("decode", None)  # positions in the decoder's message are range-relative; not reusable
+    return partial, err
+
+
+def _map_serial(
+    path: Path,
+    fn: Callable[[Iterable[Any]], Any],
+    after_line: int = 0,
+    h: Any = None,
+    sink: Optional[IO[bytes]] = None,
+    offsets: bool = False,
+) -> Iterable[Any]:
+    if offsets:
+        lines: Any = _tee_lines(path, h, sink, newline="")
+        rows: _StrictRows = _StrictRowsAt(_line_offsets(lines), str(path), 1)
+    else:
+        lines = _tee_lines(path, h, sink) if h is not None else iter_evidence_lines(path)
+        rows = _StrictRows(lines, str(path), 1)
+    try:
+        partial = fn((ln, rec) for ln, rec in rows if ln > after_line) if after_line else fn(rows)
+        rows.drain()
+    finally:
+        lines.close()
+    yield partial
+    rows.raise_error()
+
+
+def _hash_segments(segs: Sequence[Path], h: Any, stop: threading.Event) -> None:
+    for seg in segs:
+        with open_jsonl_segment(seg) as f:
+            for chunk in iter(lambda: f.read(_TEE_BUFFER), b""):
+                if stop.is_set():
+                    return
+                h.update(chunk)  # hashlib releases the GIL on large buffers
+
+
+def map_jsonl_ranges(path: Path, fn: Callable[[Iterable[Any]], Any], workers: int = 1, h: Any = None) -> Iterable[Any]:
+    """
+    Run `fn` over consecutive slices of a strict-JSONL file and yield its partial results in file order.
+
+    `fn(rows)` receives an iterable of (line_no, record) -- absolute line
+    numbers, strict parsing exactly as iter_jsonl -- and returns a partial
+    result that the caller merges in order. With workers > 1 (and files of at
+    least PARALLEL_MIN_BYTES) slices are byte ranges parsed in a process pool,
+    so `fn` must be picklable (module-level function or functools.partial) and
+    should return compact results, not records. A strict-JSONL violation ends
+    its slice and is raised right after that slice's partial is yielded: the
+    same point at which the serial iterator raises. `fn` itself must not raise.
+
+    Rotated plain segments are split like one file; streams with a compressed
+    segment are always read serially (no random access into .gz/.zst).
+
+    `h` (a hashlib object) is fed every byte of the logical stream: from the
+    same read on the serial path, by a parent thread next to the workers on
+    the parallel one. It is complete once the generator is exhausted.
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1:
+        yield from _map_serial(path, fn, h=h)
+        return
+    segs = jsonl_segments(path)
+    sizes = [seg.stat().st_size for seg in segs] if not any(is_compressed(seg) for seg in segs) else []
+    if sum(sizes) < PARALLEL_MIN_BYTES:
+        yield from _map_serial(path, fn, h=h)
+        return
+
+    ranges = [(str(seg), a, b) for seg, size in zip(segs, sizes) for a, b in _split_ranges(seg, size, workers * 4)]
+    yield from _map_parallel(
+        str(path),
+        ranges,
+        1,
+        fn,
+        workers,
+        lambda k, after_line: _map_serial(path, fn, after_line=after_line),
+        partial(_hash_segments, segs, h) if h is not None else None,
+    )
+
+
+def _map_parallel(
+    label: str,
+    ranges: List[Tuple[str, int, int]],
+    first_line_no: int,
+    fn: Callable[[Iterable[Any]], Any],
+    workers: int,
+    serial_from: Callable[[int, int], Iterable[Any]],
+    hash_job: Optional[Callable[[threading.Event], None]],
+) -> Iterable[Any]:
+    """
+    Range workers for map_jsonl_ranges / map_jsonl_span. `serial_from(k, line_no)`
+    re-reads serially from range k (line_no: the last line before it) when a range
+    hits undecodable bytes; `hash_job(stop)` runs next to the workers.
+    """
+    stop = threading.Event()
+    with ThreadPoolExecutor(max_workers=1) as hasher, ProcessPoolExecutor(max_workers=workers) as pool:
+        hashed = hasher.submit(hash_job, stop) if hash_job is not None else None
+        counts = list(pool.map(_count_range_lines, *zip(*ranges)))
+        firsts = [first_line_no]
+        for n in counts[:-1]:
+            firsts.append(firsts[-1] + n)
+        futures = [pool.submit(_map_range, r[0], r[1], r[2], first, fn, label) for r, first in zip(ranges, firsts)]
+        try:
+            for k, fut in enumerate(futures):
+                part, err = fut.result()
+                # one range of lookahead: the serial text reader fails on undecodable
+                # bytes a little before reaching them, so such a failure must be seen
+                # before the preceding range is handed out
+                nxt = futures[k + 1].result()[1] if k + 1 < len(futures) else None
+                if (err is not None and err[0] == "decode") or (nxt is not None and nxt[0] == "decode"):
+                    yield from serial_from(k, firsts[k] - 1)
+                    break
+                yield part
+                if err is not None:
+                    raise ValueError(err[1])
+            if hashed is not None:
+                hashed.result()
+        finally:
+            stop.set()
+            for fut in futures:
+                fut.cancel()
+
+
+# TextIOWrapper's read size: undecodable bytes fail their whole 8 KiB chunk, so
+# which records precede such a failure depends on where the chunks start
+_TEXT_CHUNK = 8192
+
+
+class _SpanReader(io.RawIOBase):
+    """
+    Raw stream over bytes [start, end) of an open binary file. The first read
+    stops at the next multiple of _TEXT_CHUNK, so a text reader over the span
+    decodes the same chunks (and fails at the same record) as one from byte 0.
+    """
+
+    def __init__(self, raw: IO[bytes], start: int, end: int) -> None:
+        raw.seek(start)
+        self._raw = raw
+        self._left = end - start
+        self._align = -start % _TEXT_CHUNK
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        if self._left <= 0:
+            return 0
+        view = memoryview(b)[: min(self._left, self._align or self._left)]
+        self._align = 0
+        n = self._raw.readinto(view) or 0
+        self._left -= n
+        return n
+
+
+def _map_span_serial(
+    path: Path, fn: Callable[[Iterable[Any]], Any], start: int, end: int, first_line_no: int
+) -> Iterable[Any]:
+    with path.open("rb") as raw:
+        lines = io.TextIOWrapper(io.BufferedReader(_SpanReader(raw, start, end), _TEE_BUFFER), encoding="utf-8")
+        rows = _StrictRows(lines, str(path), first_line_no)
+        part = fn(rows)
+        rows.drain()
+    yield part
+    rows.raise_error()
+
+
+def map_jsonl_span(
+    path: Path, fn: Callable[[Iterable[Any]], Any], start: int, end: int, first_line_no: int = 1, workers: int = 1
+) -> Iterable[Any]:
+    """
+    map_jsonl_ranges over bytes [start, end) of one plain file: `start` must be
+    a line start (0, or just past a b"\\n") and `first_line_no` the 1-based line
+    number there. Nothing past `end` is read, so a file that is still being
+    appended to is verified up to a fixed size (resumable / incremental passes).
+    """
+    workers = resolve_workers(workers)
+    if workers <= 1 or end - start < PARALLEL_MIN_BYTES:
+        yield from _map_span_serial(path, fn, start, end, first_line_no)
+        return
+    ranges = [(str(path), a, b) for a, b in _split_ranges(path, end, workers * 4, start)]
+    yield from _map_parallel(
+        str(path),
+        ranges,
+        first_line_no,
+        fn,
+        workers,
+        lambda k, after_line: _map_span_serial(path, fn, ranges[k][1], end, after_line + 1),
+        None,
+    )
+
+
+def digest_span(path: Path, start: int, end: int, h: Any) -> int:
+    """Feed bytes [start, end) of `path` to `h`; returns their line count (universal newlines, as text mode splits)."""
+    n = 0
+    cr = False  # previous chunk ended with b"\\r": a leading b"\\n" completes that line ending
+    with path.open("rb") as f:
+        f.seek(start)
+        left = end - start
+        while left > 0:
+            chunk = f.read(min(left, _TEE_BUFFER))
+            if not chunk:
+                break
+            left -= len(chunk)
+            h.update(chunk)
+            n += chunk.count(b"\n") + chunk.count(b"\r") - chunk.count(b"\r\n") - (1 if cr and chunk[:1] == b"\n" else 0)
+            cr = chunk[-1:] == b"\r"
+    return n
+
+
+def _count_rows(rows: Iterable[Any]) -> int:
+    n = 0
+    for _ in rows:
+        n += 1
+    return n
+
+
+def count_jsonl(path: Path, workers: int = 1) -> int:
+    return sum(map_jsonl_ranges(path, _count_rows, workers))
+
+
+# ---------------------------------------------------------------------------
+# Live tail (a file that is still being written)
+# ---------------------------------------------------------------------------
+
+
+_TAIL_READ = 1024 * 1024
+
+
+class JsonlTail:
+    """
+    Strict-JSONL reader for a plain file that is still being appended to.
+
+    poll(fn) returns fn(rows) over the (line_no, record) rows of the lines
+    completed since the previous call (at most _TAIL_READ bytes per call), or
+    None when there are none; a trailing line without b"\\n" is held back until
+    its newline arrives, or until finish(fn), which reads it as the last line
+    (as a full read would). fn follows the map_jsonl_ranges slice contract;
+    rows are parsed as it consumes them, once per line, so the cost per record
+    does not grow with what was read before.
+
+    A file that does not exist yet reads as empty. When the writer rotates it
+    (renamed to `<name>.1`, a new `<name>` created) the old file is drained
+    through the open handle and line numbers continue in the new one, as
+    jsonl_segments numbers rotated segments.
+
+    The first strict violation (iter_jsonl's ValueError), bytes that are not
+    UTF-8 (UnicodeDecodeError), or a file that shrank below what was already
+    read (ValueError: not append-only) is raised by the call after the one that
+    handed fn the rows before it. Unlike the text-mode readers, which lose the
+    rest of an 8 KiB decode chunk, rows stop right before a non-UTF-8 line.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.line_no = 0  # physical lines handed out so far (blank ones included)
+        self._f: Optional[IO[bytes]] = None
+        self._read_to = 0  # bytes read from the current physical file
+        self._pending = b""
+        self._error: Optional[Exception] = None
+
+    def poll(self, fn: Callable[[Iterable[Any]], Any] = list) -> Any:
+        if self._error is not None:
+            raise self._error
+        if self._f is None:
+            try:
+                self._f = self.path.open("rb")
+            except FileNotFoundError:
+                return None
+        blocks: List[bytes] = []
+        caught_up = self._read(blocks)
+        if caught_up and self._error is None and self._rotated():
+            while not self._read(blocks) and self._error is None:  # what the writer added before it switched files
+                pass
+            if self._error is None:
+                blocks += self._take_last()
+        return self._map(fn, blocks)
+
+    def finish(self, fn: Callable[[Iterable[Any]], Any] = list) -> Any:
+        """fn(rows) of the unterminated last line, None if there is none; closes the file (a later poll() reopens `path`)."""
+        if self._error is not None:
+            raise self._error
+        out = self._map(fn, self._take_last())
+        if self._error is not None:
+            raise self._error
+        return out
+
+    def close(self) -> None:
+        if self._f is not None:
+            self._f.close()
+            self._f = None
+            self._read_to = 0
+
+    def _take_last(self) -> List[bytes]:
+        pending, self._pending = self._pending, b""
+        self.close()
+        return [pending] if pending else []
+
+    def _read(self, blocks: List[bytes]) -> bool:
+        """Append the next complete lines to `blocks`; True once the file is read to its current size."""
+        assert self._f is not None
+        size = os.fstat(self._f.fileno()).st_size
+        if size < self._read_to:
+            self._error = ValueError(f"{self.path} shrank to {size} bytes after {self._read_to} were read: not append-only")
+            return True
+        chunk = self._f.read(min(size - self._read_to, _TAIL_READ))
+        self._read_to += len(chunk)
+        data = self._pending + chunk
+        cut = data.rfind(b"\n") + 1
+        self._pending = data[cut:]
+        if cut:
+            blocks.append(data[:cut])
+        return self._read_to >= size
+
+    def _rotated(self) -> bool:
+        assert self._f is not None
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return False  # renamed, successor not created yet: keep reading the old file
+        own = os.fstat(self._f.fileno())
+        return (st.st_ino, st.st_dev) != (own.st_ino, own.st_dev)
+
+    def _map(self, fn: Callable[[Iterable[Any]], Any], blocks: List[bytes]) -> Any:
+        if not blocks:
+            return None
+        rows = self._rows(blocks)
+        out = fn(rows)
+        for _ in rows:  # fn may stop early; the lines must still be checked
+            pass
+        return out
+
+    def _rows(self, blocks: List[bytes]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        for block in blocks:
+            # whole lines (b"\n"-terminated, but for the last line of a file); one decode for all of them
+            lines: List[Any]
+            try:
+                lines = block.decode("utf-8").split("\n")
+            except UnicodeDecodeError:
+                lines = block.split(b"\n")  # decoded one by one below, up to the bad line
+            if block.endswith(b"\n"):
+                lines.pop()
+            for raw in lines:
+                self.line_no += 1
+                if isinstance(raw, bytes):
+                    try:
+                        raw = raw.decode("utf-8")
+                    except UnicodeDecodeError as e:
+                        self._error = e
+                        return
+                s = raw.strip()
+                if not s:
+                    continue
+                try:
+                    obj = json.loads(s)
+                except json.JSONDecodeError as e:
+                    self._error = ValueError(f"Invalid JSONL at {self.path} line {self.line_no}: {e}")
+                    return
+                if not isinstance(obj, dict):
+                    self._error = ValueError(f"JSONL record must be an object at {self.path} line {self.line_no}")
+                    return
+                yield self.line_no, obj
+
+
+# ---------------------------------------------------------------------------
+# Tee pass (strict parse + sha256 + copy in one read)
+# ---------------------------------------------------------------------------
+
+
+_TEE_BUFFER = 1024 * 1024
+
+
+class _TeeReader(io.RawIOBase):
+    """Raw stream that feeds every byte it hands out to `h` and, if given, `sink`."""
+
+    def __init__(self, raw: IO[bytes], h: Any, sink: Optional[IO[bytes]]) -> None:
+        self._raw = raw
+        self._h = h
+        self._sink = sink
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b: Any) -> int:
+        n = self._raw.readinto(b)
+        if n:
+            view = memoryview(b)[:n]
+            self._h.update(view)
+            if self._sink is not None:
+                self._sink.write(view)
+        return n
+
+
+def _tee_lines(path: Path, h: Any, sink: Optional[IO[bytes]], newline: Optional[str] = None) -> Iterator[str]:
+    # per segment, exactly like iter_evidence_lines(path) (text mode, universal newlines;
+    # newline="" splits the same lines but keeps their line endings untranslated)
+    for seg in jsonl_segments(path):
+        with open_jsonl_segment(seg) as raw:
+            buffered = io.BufferedReader(_TeeReader(raw, h, sink), _TEE_BUFFER)
+            yield from io.TextIOWrapper(buffered, encoding="utf-8", newline=newline)
+
+
+def tee_jsonl(
+    path: Path,
+    fn: Callable[[Iterable[Any]], Any] = _count_rows,
+    sink: Optional[IO[bytes]] = None,
+    offsets: bool = False,
+) -> Tuple[Any, str]:
+    """
+    One serial strict pass of `fn` over the logical stream `path` that also
+    returns the sha256 of its (decompressed, concatenated) bytes and copies
+    them to `sink`; returns (fn result, sha256 hex). Default fn counts records.
+
+    Same rows and first error as map_jsonl_ranges(path, fn, 1). The stream is
+    always read to the end, so the digest covers the whole file even when fn
+    stops early; nothing is returned when a strict violation is raised.
+
+    offsets=True: rows are (line_no, record, byte_offset), byte_offset being
+    where the record's line starts in the stream (== in the `sink` copy).
+    """
+    h = hashlib.sha256()
+    (partial,) = _map_serial(path, fn, h=h, sink=sink, offsets=offsets)
+    return partial, h.hexdigest()
+
+
+def copy_file_kernel(src: Path, dst: Path) -> None:
+    """
+    Byte copy that stays in the kernel: os.copy_file_range (may reflink), else
+    os.sendfile, else a buffered read/write when neither applies (e.g. EXDEV).
+    """
+    with src.open("rb") as fsrc, dst.open("wb") as fdst:
+        infd, outfd = fsrc.fileno(), fdst.fileno()
+        for name in ("copy_file_range", "sendfile"):
+            call = getattr(os, name, None)
+            if call is None:
+                continue
+            try:
+                while True:
+                    if name == "copy_file_range":
+                        n = call(infd, outfd, _TEE_BUFFER * 64)
+                    else:
+                        n = call(outfd, infd, None, _TEE_BUFFER * 64)
+                    if n == 0:
+                        return
+            except OSError:
+                if os.lseek(outfd, 0, os.SEEK_CUR):
+                    raise  # failed mid-copy, not an unsupported-fd case
+        shutil.copyfileobj(fsrc, fdst, _TEE_BUFFER)
+
+
+# ---------------------------------------------------------------------------
+# Strict-JSONL certificate
+# ---------------------------------------------------------------------------
+
+
+def _strict_cert_dir(path: Path, cache_root: Optional[Path] = None) -> Path:
+    return cache_dir_for(path, cache_root) / "strict_jsonl"
+
+
+def read_strict_certificate(path: Path, cache_root: Optional[Path] = None) -> Optional[Dict[str, Any]]:
+    """Certificate meta ({source: {size, mtime_ns, sha256}, records}) while it still matches path, else None."""
+    try:
+        meta = json.loads((_strict_cert_dir(path, cache_root) / "meta.json").read_text(encoding="utf-8"))
+        if meta.get("format") != STRICT_CERT_FORMAT:
+            return None
+        return meta if source_matches(path, meta.get("source") or {}, path.stat()) else None
+    except (OSError, ValueError, TypeError, AttributeError):
+        return None
+
+
+def has_strict_certificate(path: Path, cache_root: Optional[Path] = None) -> bool:
+    return read_strict_certificate(path, cache_root) is not None
+
+
+def write_strict_certificate(path: Path, source: Dict[str, Any], records: int, cache_root: Optional[Path] = None) -> None:
+    """Record that `source` (size/mtime_ns/sha256) passed a complete strict-JSONL pass. Best-effort."""
+    meta = {"format": STRICT_CERT_FORMAT, "source": source, "records": records}
+    try:
+        write_sidecar_atomic(_strict_cert_dir(path, cache_root), {}, meta)
+    except OSError:
+        pass
+
+
+# ---------------------------------------------------------------------------
+# Projection reads
+# ---------------------------------------------------------------------------
+
+
+# JSON token classes. "strict" mirrors json.loads exactly (so a template match is
+# a strict-JSONL validation); "loose" only tracks token boundaries and is used on
+# files that already hold a strict certificate.
+_RX_STR = r'"[^"\\\x00-\x1f]*(?:\\(?:["\\/bfnrt]|u[0-9a-fA-F]{4})[^"\\\x00-\x1f]*)*"'
+_RX_STR_LOOSE = r'"[^"\\\n]*(?:\\.[^"\\\n]*)*"'
+_RX_INT = r"-?(?:0|[1-9][0-9]*)"
+_RX_FLOAT = r"-?(?:0|[1-9][0-9]*)(?:\.[0-9]+(?:[eE][-+]?[0-9]+)?|[eE][-+]?[0-9]+)|NaN|-?Infinity"
+_RX_SCALAR = r"(?:%s|-?(?:0|[1-9][0-9]*)(?:\.[0-9]+)?(?:[eE][-+]?[0-9]+)?|NaN|-?Infinity|true|false|null)" % _RX_STR
+_RX_SCALAR_LOOSE = r'(?:%s|[^\s,\]}"\[{]+)' % _RX_STR_LOOSE
+
+_CHUNK_SIZE = 1024 * 1024
+_TEMPLATE_MAX = 8
+_TEMPLATE_MAX_PATTERN = 64 * 1024
+_SEPARATORS = ((", ", ": "), (",", ":"))
+
+# projected value kinds (fixed per template position)
+_K_NONE, _K_STR, _K_INT, _K_FLOAT, _K_BOOL, _K_JSON = range(6)
+
+
+def _iter_raw_chunks(path: Path, h: Any = None) -> Iterable[Tuple[int, bytes, bytes]]:
+    """
+    (first_line_no, complete_lines, b"") per chunk read, then (line_no, b"", tail) for
+    an unterminated last line of each segment. Feeds every byte to `h` if given.
+    """
+    line_no = 1
+    for seg in jsonl_segments(path):
+        tail = b""
+        with open_jsonl_segment(seg) as f:
+            for chunk in iter(lambda: f.read(_CHUNK_SIZE), b""):
+                if h is not None:
+                    h.update(chunk)
+                buf = tail + chunk
+                cut = buf.rfind(b"\n") + 1
+                tail = buf[cut:]
+                if cut:
+                    yield line_no, buf[:cut], b""
+                    line_no += buf.count(b"\n", 0, cut)
+        if tail:
+            yield line_no, b"", tail
+            line_no += 1
+
+
+def _descend(v: Any, rest: Sequence[str]) -> Any:
+    for k in rest:
+        if not isinstance(v, dict):
+            return None
+        v = v.get(k)
+    return v
+
+
+def _project_record(rec: Dict[str, Any], paths: List[List[str]]) -> Tuple[Any, ...]:
+    return tuple(_descend(rec.get(p[0]), p[1:]) for p in paths)
+
+
+class _Template:
+    """
+    Line shape learned from one decoded record: keys, nesting and separators are
+    literal, scalar values are token classes, projected positions are captured.
+
+    A line matching the template has exactly the sample's structure, so captured
+    values are the values json.loads would return at those paths.
+    """
+
+    def __init__(self, obj: Dict[str, Any], paths: List[List[str]], seps: Tuple[str, str], ensure_ascii: bool, strict: bool):
+        self.item_sep, self.key_sep = (re.escape(x) for x in seps)
+        self.ensure_ascii = ensure_ascii
+        self.scalar = _RX_SCALAR if strict else _RX_SCALAR_LOOSE
+        self.string = _RX_STR if strict else _RX_STR_LOOSE
+        self.wanted = {tuple(p) for p in paths}
+        self.groups: Dict[Tuple[str, ...], Tuple[int, int]] = {}  # path -> (group index, kind)
+        body = self._render(obj, ())
+        self.kinds = [self._kind_of(tuple(p)) for p in paths]
+        self.slots = [self.groups[tuple(p)][0] if tuple(p) in self.groups else -1 for p in paths]
+        self.body = body
+        self.line_rx = re.compile(body)
+        self.bulk_rx = re.compile("^" + body + "\n", re.M)
+
+    def _kind_of(self, path: Tuple[str, ...]) -> int:
+        return self.groups[path][1] if path in self.groups else _K_NONE
+
+    def _capture(self, path: Any, pattern: str, kind: int, index: Optional[int] = None) -> str:
+        self.groups[path] = (len(self.groups) if index is None else index, kind)
+        return "(" + pattern + ")"
+
+    def _render(self, v: Any, path: Optional[Tuple[str, ...]]) -> str:
+        wanted = path is not None and path in self.wanted
+        if isinstance(v, (dict, list)):
+            # regex groups number by opening paren: reserve ours before the children's
+            index = None
+            if wanted:
+                index = len(self.groups)
+                self.groups[path] = (index, _K_JSON)  # type: ignore[index]
+            if isinstance(v, dict):
+                items = []
+                for k, x in v.items():
+                    key = re.escape(json.dumps(k, ensure_ascii=self.ensure_ascii))
+                    items.append(key + self.key_sep + self._render(x, None if path is None else path + (k,)))
+                out = r"\{" + self.item_sep.join(items) + r"\}"
+            elif all(not isinstance(x, (dict, list)) for x in v):
+                out = r"\[(?:%s(?:%s%s)*)?\]" % (self.scalar, self.item_sep, self.scalar)
+            else:
+                out = r"\[" + self.item_sep.join(self._render(x, None) for x in v) + r"\]"
+            return self._capture(path, out, _K_JSON, index) if wanted else out
+        if not wanted:
+            return self.scalar
+        if v is None:
+            return "null"  # constant: no capture
+        if isinstance(v, bool):
+            return self._capture(path, "true|false", _K_BOOL)
+        if isinstance(v, int):
+            return self._capture(path, _RX_INT, _K_INT)
+        if isinstance(v, float):
+            return self._capture(path, _RX_FLOAT, _K_FLOAT)
+        return self._capture(path, self.string, _K_STR)
+
+    def values(self, m: "re.Match[str]") -> Tuple[Any, ...]:
+        out = []
+        for slot, kind in zip(self.slots, self.kinds):
+            out.append(None if slot < 0 else _convert(kind, m.group(slot + 1)))
+        return tuple(out)
+
+    def columns(self, found: List[Any]) -> List[Any]:
+        n_groups = len(self.groups)
+        cols: List[Any] = []
+        for slot, kind in zip(self.slots, self.kinds):
+            if slot < 0:
+                cols.append([None] * len(found))
+                continue
+            col = found if n_groups == 1 else [t[slot] for t in found]
+            if kind == _K_FLOAT:
+                cols.append(list(map(float, col)))
+            elif kind == _K_INT:
+                cols.append(list(map(int, col)))
+            elif kind == _K_STR:
+                cols.append([x[1:-1] if "\\" not in x else json.loads(x) for x in col])
+            else:
+                cols.append([_convert(kind, x) for x in col])
+        return cols
+
+
+def _convert(kind: int, text: str) -> Any:
+    if kind == _K_FLOAT:
+        return float(text)
+    if kind == _K_INT:
+        return int(text)
+    if kind == _K_STR:
+        return text[1:-1] if "\\" not in text else json.loads(text)
+    if kind == _K_BOOL:
+        return text == "true"
+    return json.loads(text)
+
+
+def _learn_template(line: str, obj: Dict[str, Any], paths: List[List[str]], strict: bool) -> Optional[_Template]:
+    for seps in _SEPARATORS:
+        for ensure_ascii in (True, False):
+            t = _Template(obj, paths, seps, ensure_ascii, strict)
+            if len(t.body) > _TEMPLATE_MAX_PATTERN:
+                return None
+            if t.line_rx.fullmatch(line):
+                return t
+    return None
+
+
+def read_jsonl_record(path: Path, line_no: int) -> Dict[str, Any]:
+    """Full decode of one already-validated line (error paths that need the whole record)."""
+    lines = iter_evidence_lines(path, binary=True)
+    try:
+        for i, raw in enumerate(lines, 1):
+            if i == line_no:
+                return json.loads(raw)
+    finally:
+        lines.close()
+    raise IndexError(f"line out of range: {path.name}:{line_no}")
+
+
+def iter_projected(
+    path: Path, fields: Sequence[str], cache_root: Optional[Path] = None, use_cache: Optional[bool] = None
+) -> Iterable[Tuple[int, Tuple[Any, ...]]]:
+    """
+    Yield (line_no, values) with one value per dotted field path.
+
+    Absent keys (or non-object parents) yield None, exactly like chained
+    dict.get(). Strict-JSONL violations raise ValueError as in iter_jsonl.
+    """
+    path = path.expanduser().resolve()
+    if use_cache is None:
+        use_cache = cache_enabled()
+    paths = [f.split(".") for f in fields]
+    # certificates key on one plain file; rotated/compressed streams always run strict
+    single = jsonl_segments(path) == [path]
+    use_cache = use_cache and single
+    certified = use_cache and has_strict_certificate(path, cache_root)
+    strict = not certified
+    templates: List[_Template] = []
+
+    def decode_line(line_no: int, s: str) -> Optional[Tuple[Any, ...]]:
+        for i, t in enumerate(templates):
+            m = t.line_rx.fullmatch(s)
+            if m is not None:
+                if i:
+                    templates.insert(0, templates.pop(i))
+                return t.values(m)
+        s = s.strip()
+        if not s:
+            return None
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        if len(templates) < _TEMPLATE_MAX:
+            t = _learn_template(s, obj, paths, strict)
+            if t is not None:
+                templates.insert(0, t)
+        return _project_record(obj, paths)
+
+    st = path.stat() if single else None
+    h = hashlib.sha256() if (use_cache and not certified) else None
+    records = 0
+    for first, buf, tail in _iter_raw_chunks(path, h):
+        if tail:
+            vals = decode_line(first, tail.decode("utf-8"))
+            if vals is not None:
+                records += 1
+                yield first, vals
+            continue
+        try:
+            text = buf.decode("utf-8")
+        except UnicodeDecodeError:
+            text = None
+        if text is not None and templates:
+            t = templates[0]
+            found = t.bulk_rx.findall(text)
+            if len(found) == text.count("\n"):
+                # every line matched the primary template
+                records += len(found)
+                rows = zip(*t.columns(found)) if paths else repeat((), len(found))
+                yield from zip(range(first, first + len(found)), rows)
+                continue
+        for i, raw in enumerate(buf.split(b"\n")[:-1]):
+            vals = decode_line(first + i, raw.decode("utf-8"))
+            if vals is not None:
+                records += 1
+                yield first + i, vals
+
+    if h is not None:
+        st2 = path.stat()
+        if st2.st_size == st.st_size and st2.st_mtime_ns == st.st_mtime_ns:
+            source = {"path": str(path), "size": st.st_size, "mtime_ns": st.st_mtime_ns, "sha256": h.hexdigest()}
+            write_strict_certificate(path, source, records, cache_root)
+
+
+# ---------------------------------------------------------------------------
+# Timestamps (ts_utc -> integer epoch time)
+# ---------------------------------------------------------------------------
+
+
+_fromisoformat = datetime.fromisoformat
+_tzinfo = attrgetter("tzinfo")
+
+
+def _parse_iso_general(ts: str) -> datetime:
+    # Accept both 'Z' and '+00:00' (and surrounding whitespace) on any Python 3
+    s = ts.strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    return _fromisoformat(s)
+
+
+def ts_epoch_us_tz(ts: str) -> Tuple[int, bool]:
+    """
+    (epoch microseconds, offset-aware) of an ISO8601 ts_utc ('Z' / '+00:00' /
+    any offset). A value without an offset is read as UTC wall-clock time and
+    flagged naive (False): naive values only order / subtract against naive
+    ones, as datetimes do (see check_ts_tz). Raises ValueError when
+    unparseable, like datetime.fromisoformat.
+
+    The canonical form goes straight to the C parser (which takes a trailing
+    'Z' on Python >= 3.11); anything else is normalized first. The result is
+    exact: timestamp() is the true microsecond count / 1e6, correctly rounded.
+    """
+    try:
+        dt = _fromisoformat(ts)
+    except ValueError:
+        dt = _parse_iso_general(ts)
+    if dt.tzinfo is None:
+        return round(dt.replace(tzinfo=timezone.utc).timestamp() * 1_000_000), False
+    return round(dt.timestamp() * 1_000_000), True
+
+
+def try_ts_epoch_us_tz(ts: Any) -> Optional[Tuple[int, bool]]:
+    """ts_epoch_us_tz(ts), or None when ts is not a non-empty, parseable string."""
+    if not isinstance(ts, str) or not ts:
+        return None
+    try:
+        return ts_epoch_us_tz(ts)
+    except (ValueError, OverflowError):
+        return None
+
+
+def ts_epoch_us_list(values: Sequence[Any]) -> Tuple[List[Optional[int]], List[bool]]:
+    """
+    try_ts_epoch_us_tz(v) for a whole slice of ts_utc values at once, as two
+    lists: epoch microseconds (None where unparseable) and offset-awareness
+    (False where naive or unparseable). When every value is an offset-carrying
+    ISO8601 string the parse and the conversion run as C-level maps; otherwise
+    it falls back per value.
+    """
+    try:
+        dts = list(map(_fromisoformat, values))
+        if None not in map(_tzinfo, dts):
+            return list(map(round, map(mul, map(datetime.timestamp, dts), repeat(1_000_000.0)))), [True] * len(dts)
+    except (TypeError, ValueError, OverflowError):
+        pass
+    parsed = [try_ts_epoch_us_tz(v) for v in values]
+    return [None if r is None else r[0] for r in parsed], [r is not None and r[1] for r in parsed]
+
+
+def check_ts_tz(aware: bool, other_aware: bool, op: str = "subtract") -> None:
+    """TypeError, worded like datetime's, when exactly one of two parsed ts_utc values carries an offset."""
+    if aware is not other_aware:
+        raise TypeError(f"can't {op} offset-naive and offset-aware datetimes")
+
+
+def delta_ms(cur_us: int, prev_us: int) -> int:
+    """cur - prev in whole milliseconds, truncated toward zero (int(timedelta.total_seconds() * 1000) without float error)."""
+    d = cur_us - prev_us
+    return d // 1000 if d >= 0 else -(-d // 1000)
@@ -0,0 +1,613 @@
+#!/usr/bin/env python3
+"""
+V12 single-pass verifier gate engine (Research repo, stdlib only).
+
+A gate is one verifier's checks (verify_scanner_e_schema_v0,
+verify_tick_loop_v0, verify_base_dimensions_eim_v0,
+verify_world_structure_gate_v0, verify_e_liquidity_measurability_gate_v0
+each define one) split from its file reading:
+  - `files`: the run_dir-relative evidence files it consumes
+  - `reader(name)`: a slice function for `name` (evidence_io_v0.map_jsonl_ranges
+    contract: picklable, (line_no, record) rows -> compact partial holding
+    only the fields the gate reads), or None when the gate no longer needs it
+  - `update(name, part)`: merge one partial, in file order
+  - `fail(name, exc)`: the file broke strict-JSONL (after its partials)
+  - `finalize()`: the verifier's own result; `report(result)`: its report JSON
+
+`run_gates` streams every file that any registered gate consumes exactly
+once, in STREAM_ORDER (auxiliary files first, market_snapshot.jsonl last, so
+gates that cross-check it -- e.g. source_endpoints against okx_api_calls --
+have seen the others), and feeds each record to every gate that reads that
+file: N verifiers over one run_dir cost one parse per file, not N.
+With several gates on one file, each range is handed to their slice
+functions in batches of FAN_OUT_BATCH rows (partials must merge in order).
+
+A standalone verifier is the same engine with one gate, so verdicts, errors
+and reports do not depend on how many gates shared the pass.
+
+Report cache (`run_gate_reports`; verifier CLIs: --no_report_cache,
+--refresh_report_cache; PROMETHEUS_EVIDENCE_CACHE=0 disables it):
+  <run_dir>/../.evidence_cache_v0/<run_dir name>/verifier_reports/<tool>.<key>.json
+  - key: tool name, sha256 of the tool's source (gate module + the sibling
+    modules it imports from, e.g. error_sink_v0 / id_set_v0 + this module +
+    evidence_io_v0), the gate's params() and the run_dir path
+  - stored with the signature of every file in the gate's `inputs` (missing,
+    or per segment name/size/mtime_ns, plus sha256 for a single plain file)
+  - a stored report is returned while every input still matches: size equal,
+    then mtime_ns equal or the sha256 equal (evidence_io_v0.source_matches);
+    its exit code is recomputed from the verdict, generated_at_utc is the
+    original run's
+  - gates that crash are never cached
+
+Checkpoints (`resume=True`; verifier CLIs: --resume), for append-only evidence:
+  <run_dir>/../.evidence_cache_v0/<run_dir name>/verifier_checkpoints/<tool>.<key>.json
+  - a resumable gate (`resumable`, `checkpoint_state()` / `restore_state()`)
+    streams each of its files as the byte span [offset, size) fixed when the
+    pass starts (evidence_io_v0.map_jsonl_span), so bytes appended meanwhile
+    wait for the next pass
+  - the checkpoint holds, per file, the verified offset, its line count and the
+    sha256 of bytes [0, offset), plus the gate's carry-over state (same key as
+    the report cache; non-streamed inputs such as run_manifest.json must match)
+  - the next pass re-hashes the prefix (a sequential read, no parsing), fails
+    closed when it changed (the gate's fail(), so the verdict is FAIL or
+    ERROR; --refresh_report_cache re-baselines), and parses only the tail
+  - written only after a pass in which every file was read without a strict
+    violation and ends with b"\\n" (an unterminated last line is verified,
+    but not checkpointed)
+  - rotated / compressed evidence is verified with a full pass, as without
+    --resume; a resumed report equals the full pass's report
+
+Follow (`follow_gate`; verify_tick_loop_v0 --follow), while the run is written:
+  - every file is tailed (evidence_io_v0.JsonlTail); each completed line is
+    parsed once and handed to the gate, so per-record cost stays constant
+  - a callback gets the gate at a fixed interval for a rolling report; on idle
+    timeout or SIGINT / SIGTERM the unterminated last lines are read and the
+    gate finalizes as after a full pass over the same bytes
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import signal
+import sys
+import threading
+import time
+import types
+from dataclasses import dataclass
+from functools import lru_cache, partial
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Sequence, Tuple
+
+import evidence_io_v0
+from evidence_io_v0 import (
+    JsonlTail,
+    cache_dir_for,
+    cache_enabled,
+    digest_span,
+    evidence_exists,
+    is_compressed,
+    jsonl_segments,
+    map_jsonl_ranges,
+    map_jsonl_span,
+    segment_stats,
+    sha256_file,
+)
+
+
+STREAM_ORDER = (
+    "okx_api_calls.jsonl",
+    "exchange_api_calls.jsonl",
+    "errors.jsonl",
+    "position_snapshots.jsonl",
+    "interaction_impedance.jsonl",
+    "market_snapshot.jsonl",
+)
+FAN_OUT_BATCH = 4096
+
+REPORT_CACHE_FORMAT = "verifier_report_cache_v0"
+REPORT_CACHE_NAME = "verifier_reports"
+CHECKPOINT_FORMAT = "verifier_checkpoint_v0"
+CHECKPOINT_NAME = "verifier_checkpoints"
+
+
+class Gate:
+    """Base class; see the module docstring for the protocol."""
+
+    tool = ""
+    # stderr line a standalone run prints for NOT_MEASURABLE (None: it prints none)
+    not_measurable_warning: Optional[str] = None
+    # run_dir-relative files whose presence or content can change the report (report cache key)
+    inputs: Tuple[str, ...] = ()
+    # implements checkpoint_state / restore_state (resume=True)
+    resumable = False
+
+    def __init__(self) -> None:
+        self.files: Tuple[str, ...] = ()
+
+    def params(self) -> Dict[str, Any]:
+        """Parameters that can change the report (report cache key; workers never do)."""
+        return {}
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        raise NotImplementedError
+
+    def update(self, name: str, part: Any) -> None:
+        raise NotImplementedError
+
+    def fail(self, name: str, exc: Exception) -> None:
+        raise NotImplementedError
+
+    def finalize(self) -> Any:
+        raise NotImplementedError
+
+    def report(self, result: Any) -> Dict[str, Any]:
+        raise NotImplementedError
+
+    def checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        """JSON-able carry-over state after a pass (before finalize), or None when this point cannot be resumed from."""
+        return None
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        """Load checkpoint_state() output into a freshly constructed gate (same run_dir and params)."""
+        raise NotImplementedError
+
+
+def count_rows(rows: Iterable[Any]) -> int:
+    """Slice function for files a gate only strict-checks and counts (count_jsonl as a gate read)."""
+    n = 0
+    for _ in rows:
+        n += 1
+    return n
+
+
+def exit_code_for(verdict: str) -> int:
+    """Frozen verifier convention: FAIL -> 2; PASS / NOT_MEASURABLE -> 0."""
+    return 2 if verdict == "FAIL" else 0
+
+
+def stream_order(names: Iterable[str]) -> List[str]:
+    wanted = list(dict.fromkeys(names))
+    known = [n for n in STREAM_ORDER if n in wanted]
+    others = [n for n in wanted if n not in STREAM_ORDER]
+    return [n for n in known if n != "market_snapshot.jsonl"] + others + [n for n in known if n == "market_snapshot.jsonl"]
+
+
+def _fan_out(fns: Sequence[Callable[[Iterable[Any]], Any]], rows: Iterable[Any]) -> List[List[Any]]:
+    """Slice function over several gates' slice functions: one partial list per function."""
+    if len(fns) == 1:
+        return [[fns[0](rows)]]
+    parts: List[List[Any]] = [[] for _ in fns]
+    it = iter(rows)
+    while True:
+        batch = list(islice(it, FAN_OUT_BATCH))
+        for out, fn in zip(parts, fns):
+            out.append(fn(batch))
+        if len(batch) < FAN_OUT_BATCH:
+            break
+    return parts
+
+
+def run_gates(
+    run_dir: Path, gates: Sequence[Gate], workers: int = 1, hashes: Optional[Dict[str, str]] = None
+) -> None:
+    """
+    One strict pass per evidence file, shared by all `gates`. Files that do not
+    exist are skipped (gates check presence themselves). Call each gate's
+    finalize() afterwards.
+
+    With `hashes`, the sha256 of every file streamed to the end is recorded
+    there by name (from the same read).
+    """
+    for name in stream_order(n for g in gates for n in g.files):
+        path = run_dir / name
+        if not evidence_exists(path):
+            continue
+        fans = [(g, fn) for g in gates if name in g.files for fn in [g.reader(name)] if fn is not None]
+        if not fans:
+            continue
+        h = hashlib.sha256() if hashes is not None else None
+        parts_iter = iter(map_jsonl_ranges(path, partial(_fan_out, tuple(fn for _g, fn in fans)), workers, h=h))
+        while True:
+            try:
+                parts = next(parts_iter)
+            except StopIteration:
+                if h is not None:
+                    hashes[name] = h.hexdigest()
+                break
+            except Exception as e:
+                for g, _fn in fans:
+                    g.fail(name, e)
+                break
+            for (g, _fn), gate_parts in zip(fans, parts):
+                for part in gate_parts:
+                    g.update(name, part)
+
+
+# ---------------------------------------------------------------------------
+# Report cache
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class GateRun:
+    """One gate's outcome: its report + exit code, or the exception it crashed with."""
+
+    gate: Gate
+    report: Optional[Dict[str, Any]] = None
+    exit_code: int = 1
+    error: Optional[Exception] = None
+    cached: bool = False
+
+
+@lru_cache(maxsize=None)
+def _source_sha256(paths: Tuple[str, ...]) -> str:
+    h = hashlib.sha256()
+    for p in paths:
+        h.update(Path(p).name.encode("utf-8") + b"\0")
+        h.update(Path(p).read_bytes())
+    return h.hexdigest()
+
+
+def _sibling_sources(module: Any) -> List[str]:
+    """Source files of the tools/v12 modules `module` imports from, transitively."""
+    here = Path(__file__).resolve().parent
+    seen: Dict[str, Any] = {}
+    todo = [module]
+    while todo:
+        mod = todo.pop()
+        for obj in list(vars(mod).values()):
+            dep = obj if isinstance(obj, types.ModuleType) else sys.modules.get(getattr(obj, "__module__", None) or "")
+            path = getattr(dep, "__file__", None)
+            if not isinstance(path, str) or Path(path).resolve().parent != here:
+                continue
+            path = str(Path(path).resolve())
+            if path not in seen:
+                seen[path] = dep
+                todo.append(dep)
+    return list(seen)
+
+
+def tool_source_sha256(gate: Gate) -> str:
+    """sha256 over the code that produces `gate`'s report: its module and the sibling modules it imports from."""
+    module = sys.modules[type(gate).__module__]
+    paths = [getattr(module, "__file__", None), __file__, evidence_io_v0.__file__, *_sibling_sources(module)]
+    return _source_sha256(tuple(sorted({str(Path(p).resolve()) for p in paths if p})))
+
+
+def _input_segments(path: Path) -> List[Path]:
+    if not path.name.endswith(".jsonl"):
+        return [path] if path.exists() else []
+    return [seg for seg in jsonl_segments(path) if seg.exists()]
+
+
+def _input_signature(path: Path) -> Optional[Dict[str, Any]]:
+    segs = _input_segments(path)
+    if not segs:
+        return None
+    sig: Dict[str, Any] = {"segments": segment_stats(segs)}
+    if not path.name.endswith(".jsonl"):
+        sig["sha256"] = sha256_file(path)  # small JSON inputs: cheap, read before the gate runs
+    return sig
+
+
+def _input_matches(path: Path, sig: Any) -> Tuple[bool, Any]:
+    """(still matches, current signature)."""
+    segs = _input_segments(path)
+    if sig is None or not segs:
+        return sig is None and not segs, None
+    stored = sig.get("segments") or []
+    now = segment_stats(segs)
+    if [(s["name"], s["size"]) for s in now] != [(s.get("name"), s.get("size")) for s in stored]:
+        return False, None
+    if all(a["mtime_ns"] == b.get("mtime_ns") for a, b in zip(now, stored)):
+        return True, sig
+    # touched / copied: a single plain file is compared by content
+    if len(segs) != 1 or is_compressed(segs[0]) or not sig.get("sha256"):
+        return False, None
+    return sha256_file(segs[0]) == sig["sha256"], {"segments": now, "sha256": sig["sha256"]}
+
+
+def _sidecar_path(run_dir: Path, gate: Gate, kind: str) -> Tuple[Path, Dict[str, Any]]:
+    key = {
+        "tool": gate.tool,
+        "tool_sha256": tool_source_sha256(gate),
+        "params": gate.params(),
+        "run_dir": str(run_dir),
+    }
+    tag = hashlib.sha256(json.dumps(key, sort_keys=True).encode("utf-8")).hexdigest()[:16]
+    return cache_dir_for(run_dir / kind) / f"{gate.tool}.{tag}.json", key
+
+
+def _read_cached_report(path: Path, key: Dict[str, Any], run_dir: Path) -> Optional[Dict[str, Any]]:
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+        if doc.get("format") != REPORT_CACHE_FORMAT or doc.get("key") != key:
+            return None
+        inputs = doc["inputs"]
+        current: Dict[str, Any] = {}
+        for name, sig in inputs.items():
+            ok, current[name] = _input_matches(run_dir / name, sig)
+            if not ok:
+                return None
+        report = doc["report"]
+        if not (isinstance(report, dict) and isinstance(report.get("verdict"), str)):
+            return None
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+    if current != inputs:
+        _write_cached_report(path, key, current, report)  # matched by sha256: re-stamp so the next hit is a stat
+    return report
+
+
+def _write_cached_report(path: Path, key: Dict[str, Any], inputs: Dict[str, Any], report: Dict[str, Any]) -> None:
+    _write_sidecar_json(path, {"format": REPORT_CACHE_FORMAT, "key": key, "inputs": inputs, "report": report})
+
+
+def _write_sidecar_json(path: Path, doc: Dict[str, Any]) -> None:
+    """Best-effort (a read-only cache root only costs the next run a re-verification)."""
+    tmp = path.parent / f".tmp_{path.name}.{os.getpid()}"
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp.write_text(json.dumps(doc, ensure_ascii=False) + "\n", encoding="utf-8")
+        os.replace(tmp, path)
+    except OSError:
+        pass
+
+
+def run_gate_reports(
+    run_dir: Path,
+    gates: Sequence[Gate],
+    workers: int = 1,
+    use_cache: Optional[bool] = None,
+    refresh_cache: bool = False,
+    resume: bool = False,
+) -> List[GateRun]:
+    """
+    run_gates + finalize + report for every gate, through the report cache:
+    gates whose stored report still matches their inputs are not run at all,
+    the rest share one pass and are stored afterwards. `use_cache` defaults to
+    evidence_io_v0.cache_enabled(); `refresh_cache` ignores stored reports and
+    checkpoints (and overwrites them). With `resume` (and sidecars enabled),
+    resumable gates run from their checkpoints instead of the shared pass.
+    One GateRun per gate, in order.
+    """
+    if use_cache is None:
+        use_cache = cache_enabled()
+    use_cache = use_cache and run_dir.is_dir()
+    runs = [GateRun(g) for g in gates]
+    entries: Dict[int, Tuple[Path, Dict[str, Any], Dict[str, Any]]] = {}
+    for k, run in enumerate(runs):
+        if not use_cache:
+            break
+        try:
+            path, key = _sidecar_path(run_dir, run.gate, REPORT_CACHE_NAME)
+            inputs = {name: _input_signature(run_dir / name) for name in run.gate.inputs}
+        except (OSError, ValueError):
+            continue  # e.g. ambiguous segments: verified uncached, failing the usual way
+        entries[k] = (path, key, inputs)
+        report = None if refresh_cache else _read_cached_report(path, key, run_dir)
+        if report is not None:
+            run.report, run.exit_code, run.cached = report, exit_code_for(report["verdict"]), True
+
+    todo = [run for run in runs if not run.cached]
+    hashes: Dict[str, str] = {}
+    if resume and cache_enabled() and run_dir.is_dir():
+        resumed = [run for run in todo if run.gate.resumable and _resume_pass(run_dir, run.gate, workers, refresh_cache)]
+        todo = [run for run in todo if run not in resumed]
+    run_gates(run_dir, [run.gate for run in todo], workers, hashes if entries else None)
+    for k, run in enumerate(runs):
+        if run.cached:
+            continue
+        try:
+            run.report = run.gate.report(run.gate.finalize())
+        except Exception as e:
+            run.error = e
+            continue
+        run.exit_code = exit_code_for(run.report["verdict"])
+        if k in entries:
+            path, key, inputs = entries[k]
+            for name, sig in inputs.items():
+                # the pass's own sha256, for a single plain file (what _input_matches can re-hash)
+                segs = sig["segments"] if sig is not None else []
+                if name in hashes and len(segs) == 1 and not is_compressed(Path(segs[0]["name"])):
+                    sig["sha256"] = hashes[name]
+            _write_cached_report(path, key, inputs, run.report)
+    return runs
+
+
+def gate_report(
+    run_dir: Path,
+    gate: Gate,
+    workers: int = 1,
+    use_cache: Optional[bool] = None,
+    refresh_cache: bool = False,
+    resume: bool = False,
+) -> Tuple[Dict[str, Any], int]:
+    """One gate through run_gate_reports: (report, exit_code); re-raises the gate's crash."""
+    run = run_gate_reports(run_dir, [gate], workers, use_cache, refresh_cache, resume)[0]
+    if run.error is not None:
+        raise run.error
+    assert run.report is not None
+    return run.report, run.exit_code
+
+
+# ---------------------------------------------------------------------------
+# Checkpoints
+# ---------------------------------------------------------------------------
+
+
+def _read_checkpoint(path: Path, key: Dict[str, Any], gate: Gate, run_dir: Path) -> Optional[Dict[str, Any]]:
+    try:
+        doc = json.loads(path.read_text(encoding="utf-8"))
+        if doc.get("format") != CHECKPOINT_FORMAT or doc.get("key") != key:
+            return None
+        files = doc["files"]
+        if sorted(files) != sorted(gate.files) or not isinstance(doc["state"], dict):
+            return None
+        if not all(_input_matches(run_dir / name, sig)[0] for name, sig in doc["inputs"].items()):
+            return None
+        for f in files.values():
+            if not (isinstance(f["offset"], int) and isinstance(f["lines"], int) and isinstance(f["sha256"], str)):
+                return None
+        return doc
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        return None
+
+
+def _resume_pass(run_dir: Path, gate: Gate, workers: int, refresh: bool) -> bool:
+    """
+    Verify `gate` from its checkpoint (or from byte 0) and write the next one.
+    False: the gate needs the ordinary full pass (nothing to stream, or rotated /
+    compressed evidence), and nothing was read.
+    """
+    if not gate.files or any(_input_segments(run_dir / name) != [run_dir / name] for name in gate.files):
+        return False
+    path, key = _sidecar_path(run_dir, gate, CHECKPOINT_NAME)
+    inputs = {name: _input_signature(run_dir / name) for name in gate.inputs if name not in gate.files}
+    ckpt = None if refresh else _read_checkpoint(path, key, gate, run_dir)
+
+    spans: Dict[str, Tuple[int, int, int]] = {}
+    marks: Dict[str, Optional[Dict[str, Any]]] = {}
+    changed: List[Tuple[str, int]] = []
+    for name in gate.files:
+        p = run_dir / name
+        size = p.stat().st_size
+        h = hashlib.sha256()
+        start, lines = 0, 0
+        if ckpt is not None:
+            c = ckpt["files"][name]
+            if size >= c["offset"]:
+                digest_span(p, 0, c["offset"], h)
+            if size < c["offset"] or h.hexdigest() != c["sha256"]:
+                changed.append((name, c["offset"]))
+                continue
+            start, lines = c["offset"], c["lines"]
+        spans[name] = (start, size, lines + 1)
+        lines += digest_span(p, start, size, h)
+        with p.open("rb") as f:
+            f.seek(max(0, size - 1))
+            complete = size == 0 or f.read(1) == b"\n"
+        marks[name] = {"offset": size, "lines": lines, "sha256": h.hexdigest()} if complete else None
+
+    if changed:
+        # fail closed: a full pass for the report, plus the rewritten prefix as a failure; the
+        # checkpoint is kept, so every later --resume fails too until it is re-baselined
+        run_gates(run_dir, [gate], workers)
+        for name, offset in changed:
+            gate.fail(
+                name,
+                ValueError(f"{name} changed before the verified offset {offset} (sha256 mismatch vs checkpoint): not append-only"),
+            )
+        return True
+
+    if ckpt is not None:
+        gate.restore_state(ckpt["state"])
+    clean = all(m is not None for m in marks.values())
+    for name in stream_order(gate.files):
+        fn = gate.reader(name)
+        if fn is None:
+            clean = False
+            continue
+        start, end, first = spans[name]
+        try:
+            for part in map_jsonl_span(run_dir / name, fn, start, end, first, workers):
+                gate.update(name, part)
+        except Exception as e:
+            gate.fail(name, e)
+            clean = False
+    state = gate.checkpoint_state() if clean else None
+    if state is not None:
+        _write_sidecar_json(path, {"format": CHECKPOINT_FORMAT, "key": key, "inputs": inputs, "files": marks, "state": state})
+    return True
+
+
+# ---------------------------------------------------------------------------
+# Follow (live pass over a run_dir that is still being written)
+# ---------------------------------------------------------------------------
+
+
+def follow_gate(
+    run_dir: Path,
+    gate: Gate,
+    on_interval: Callable[[Gate, Dict[str, int]], None],
+    interval: float = 5.0,
+    idle_timeout: float = 0.0,
+    poll: float = 0.5,
+) -> Dict[str, int]:
+    """
+    Tail every file in gate.files (evidence_io_v0.JsonlTail) and feed each
+    newly completed line to the gate as it is written; every `interval`
+    seconds call on_interval(gate, lines read per file) for a rolling view
+    (it must not finalize the gate itself). Runs until no file has grown for
+    `idle_timeout` seconds (0: no limit) or SIGINT / SIGTERM arrives, then
+    reads the unterminated last lines and returns the line counts; the gate
+    has then seen exactly the rows a full pass over those bytes would give it,
+    ready for finalize().
+
+    Files are polled round-robin in stream order, so only gates whose checks
+    do not depend on another file having been read completely can follow.
+    """
+    tails = {name: JsonlTail(run_dir / name) for name in stream_order(gate.files)}
+    failed: set = set()
+    fed: set = set()  # a full pass feeds every existing file at least one partial (fn([]) if empty)
+    stop: List[int] = []
+    restore: Dict[int, Any] = {}
+    if threading.current_thread() is threading.main_thread():
+        for sig in (signal.SIGINT, signal.SIGTERM):
+            restore[sig] = signal.signal(sig, lambda signum, _frame: stop.append(signum))
+    try:
+        last_growth = time.monotonic()
+        next_emit = last_growth + interval
+        while not stop:
+            grew = False
+            for name, tail in tails.items():
+                fn = gate.reader(name)
+                if name in failed or fn is None:
+                    continue
+                try:
+                    part = tail.poll(fn)
+                except Exception as e:
+                    failed.add(name)
+                    gate.fail(name, e)
+                    continue
+                if part is not None:
+                    grew = True
+                elif name not in fed and (run_dir / name).exists():
+                    part = fn([])
+                if part is not None:
+                    fed.add(name)
+                    gate.update(name, part)
+            now = time.monotonic()
+            if grew:
+                last_growth = now
+            if now >= next_emit:
+                on_interval(gate, {name: t.line_no for name, t in tails.items()})
+                next_emit = now + interval
+            if not grew:
+                if idle_timeout > 0 and now - last_growth >= idle_timeout:
+                    break
+                time.sleep(poll)
+    finally:
+        for sig, handler in restore.items():
+            signal.signal(sig, handler)
+
+    for name, tail in tails.items():
+        fn = gate.reader(name)
+        if name in failed or fn is None:
+            tail.close()
+            continue
+        try:
+            part = tail.finish(fn)
+        except Exception as e:
+            gate.fail(name, e)
+            continue
+        if part is None and name not in fed and (run_dir / name).exists():
+            part = fn([])
+        if part is not None:
+            gate.update(name, part)
+    return {name: t.line_no for name, t in tails.items()}
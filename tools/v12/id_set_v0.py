@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+V12 compact exact string-id set (Research repo, stdlib only).
+
+Verifiers keep every snapshot_id of a run to check uniqueness and joins; a
+Python set of str costs ~90 bytes per id (str object + table slot), so long
+runs either truncated the set (false join FAILs) or paid hundreds of MB.
+
+IdSet stores the UTF-8 bytes of each id in one of 2^k bucket blobs picked by
+zlib.crc32, every id followed by 0xFF (a byte UTF-8 never produces):
+  blob = FF id1 FF id2 FF ...
+Membership is a substring search for FF id FF in the id's bucket, so it is
+exact (no hash-collision caveat), and memory is ~len(id) + 10 bytes per id.
+The bucket count grows 4x once buckets average LOAD ids; crc32 is
+process-independent, so the layout round-trips through JSON (to_state / from_state) for
+gate_engine_v0 checkpoints.
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+import base64
+from typing import Any, Dict, Iterable, List, Optional
+from zlib import crc32
+
+
+LOAD = 32  # average ids per bucket before the table grows
+_SEP = b"\xff"
+
+
+def _encode(s: str) -> bytes:
+    try:
+        return s.encode("utf-8")
+    except UnicodeEncodeError:
+        # JSON may carry lone surrogates; surrogatepass still never emits 0xFF
+        return s.encode("utf-8", "surrogatepass")
+
+
+class IdSet:
+    """Exact set of str ids in bucketed byte blobs; see the module docstring."""
+
+    def __init__(self, ids: Iterable[str] = ()) -> None:
+        self._mask = 255
+        self._buckets: List[Optional[bytearray]] = [None] * 256
+        self._count = 0
+        for s in ids:
+            self.add(s)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __contains__(self, s: object) -> bool:
+        if not isinstance(s, str):
+            return False
+        b = _encode(s)
+        blob = self._buckets[crc32(b) & self._mask]
+        return blob is not None and blob.find(_SEP + b + _SEP) >= 0
+
+    def add(self, s: str) -> bool:
+        """Insert `s`; False when it was already present."""
+        b = _encode(s)
+        i = crc32(b) & self._mask
+        blob = self._buckets[i]
+        if blob is None:
+            self._buckets[i] = bytearray(_SEP + b + _SEP)
+        elif blob.find(_SEP + b + _SEP) >= 0:
+            return False
+        else:
+            blob += b
+            blob += _SEP
+        self._count += 1
+        if self._count > LOAD * len(self._buckets):
+            self._grow()
+        return True
+
+    def _grow(self) -> None:
+        # bucket i splits into i, i + n, i + 2n, i + 3n (two more crc32 bits)
+        n = 4 * len(self._buckets)
+        mask = n - 1
+        buckets: List[Optional[bytearray]] = [None] * n
+        for blob in self._buckets:
+            if blob is None:
+                continue
+            for b in bytes(blob[1:-1]).split(_SEP):
+                j = crc32(b) & mask
+                out = buckets[j]
+                if out is None:
+                    buckets[j] = bytearray(_SEP + b + _SEP)
+                else:
+                    out += b
+                    out += _SEP
+        self._buckets = buckets
+        self._mask = mask
+
+    def to_state(self) -> Dict[str, Any]:
+        return {
+            "count": self._count,
+            "buckets": [base64.b64encode(blob).decode("ascii") if blob is not None else "" for blob in self._buckets],
+        }
+
+    @classmethod
+    def from_state(cls, state: Dict[str, Any]) -> "IdSet":
+        ids = cls()
+        ids._buckets = [bytearray(base64.b64decode(s)) if s else None for s in state["buckets"]]
+        ids._mask = len(ids._buckets) - 1
+        ids._count = state["count"]
+        return ids
@@ -0,0 +1,202 @@
+#!/usr/bin/env python3
+"""
+V12 Replay Dataset v0 ts_utc index + slicing helpers (Research repo, stdlib only).
+
+Sparse ts index (<dataset_dir>/market_snapshot.ts_index.json, written by
+build_replay_dataset_v0 and listed in dataset_manifest.json "files"):
+  {format, stream, market_snapshot_sha256, bytes, tick_count, stride, entries}
+  entries: [tick, line_no, byte_offset, ts_utc] for ticks 0, stride, 2*stride, ...
+    byte_offset: where the tick's line starts in market_snapshot.jsonl
+    ts_utc: the record's raw ts_utc (null unless a non-empty string)
+  Ticks are 0-based positions in the market_snapshot stream (blank lines are
+  not ticks), as in replay_snapshot_v1.
+
+Locating a tick is a division and a ts_utc a bisect over the entries (ts_utc
+is monotonic non-decreasing by contract). A slice then seeks to the anchor and
+reads at most `stride` records before its first tick and nothing past its end.
+Without an index the same reader starts at byte 0 (correct, but O(dataset)).
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import io
+import json
+from bisect import bisect_left
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from evidence_io_v0 import check_ts_tz, try_ts_epoch_us_tz, ts_epoch_us_tz
+from replay_dataset_io_v1 import read_manifest
+
+
+TS_INDEX_NAME = "market_snapshot.ts_index.json"
+TS_INDEX_FORMAT = "replay_ts_index_v0"
+DEFAULT_TS_INDEX_STRIDE = 1000
+
+
+def compact_ts(ts: str) -> str:
+    # Best-effort; keep original if unknown format.
+    s = ts.strip()
+    return (
+        s.replace("-", "")
+        .replace(":", "")
+        .replace(".000", "")
+        .replace(".000000", "")
+        .replace("+00:00", "Z")
+    )
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def _index_ts(ts: Any) -> Optional[str]:
+    return ts if isinstance(ts, str) and ts else None
+
+
+def ts_index_entry(tick: int, line_no: int, offset: int, ts: Any) -> List[Any]:
+    return [tick, line_no, offset, _index_ts(ts)]
+
+
+def write_ts_index(
+    path: Path, entries: List[List[Any]], stride: int, tick_count: int, size: int, market_snapshot_sha256: str
+) -> str:
+    """Write the index next to its market_snapshot.jsonl; returns the index file's sha256."""
+    doc = {
+        "format": TS_INDEX_FORMAT,
+        "stream": "market_snapshot.jsonl",
+        "market_snapshot_sha256": market_snapshot_sha256,
+        "bytes": size,
+        "tick_count": tick_count,
+        "stride": stride,
+        "entries": entries,
+    }
+    raw = (json.dumps(doc, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+    path.write_bytes(raw)
+    return hashlib.sha256(raw).hexdigest()
+
+
+def load_ts_index(dataset_dir: Path, manifest: Optional[Dict[str, Any]] = None) -> Optional[Dict[str, Any]]:
+    """
+    The dataset's ts index, or None when it has none. ValueError when the index
+    is malformed or does not belong to the current market_snapshot.jsonl
+    (sha256 per the manifest, byte size per stat) -- a stale index is never used.
+    """
+    path = dataset_dir / TS_INDEX_NAME
+    if not path.exists():
+        return None
+    if manifest is None:
+        manifest = read_manifest(dataset_dir)
+    with path.open("r", encoding="utf-8") as f:
+        index = json.load(f)
+    if not isinstance(index, dict) or index.get("format") != TS_INDEX_FORMAT:
+        raise ValueError(f"{TS_INDEX_NAME} must be a {TS_INDEX_FORMAT!r} object")
+    files = manifest.get("files") if isinstance(manifest.get("files"), dict) else {}
+    ms_entry = files.get("market_snapshot.jsonl") if isinstance(files.get("market_snapshot.jsonl"), dict) else {}
+    if index.get("market_snapshot_sha256") != ms_entry.get("sha256") or index.get("tick_count") != ms_entry.get("record_count"):
+        raise ValueError(f"{TS_INDEX_NAME} does not match files['market_snapshot.jsonl'] (sha256/record_count)")
+    size = (dataset_dir / "market_snapshot.jsonl").stat().st_size
+    if index.get("bytes") != size:
+        raise ValueError(f"{TS_INDEX_NAME} bytes={index.get('bytes')!r} != market_snapshot.jsonl size {size}")
+    stride = index.get("stride")
+    entries = index.get("entries")
+    if not _is_int(stride) or stride <= 0 or not isinstance(entries, list) or not entries:
+        raise ValueError(f"{TS_INDEX_NAME} needs a positive int stride and a non-empty entries list")
+    for k, e in enumerate(entries):
+        if not (isinstance(e, list) and len(e) == 4 and e[0] == k * stride and _is_int(e[1]) and _is_int(e[2])):
+            raise ValueError(f"{TS_INDEX_NAME} entries[{k}] must be [tick={k * stride}, line_no, byte_offset, ts_utc]")
+    return index
+
+
+def anchor_for_tick(index: Dict[str, Any], tick: int) -> List[Any]:
+    """Last index entry at or before `tick`."""
+    entries = index["entries"]
+    return entries[min(max(0, tick) // index["stride"], len(entries) - 1)]
+
+
+def anchor_for_ts(index: Dict[str, Any], ts: Tuple[int, bool]) -> List[Any]:
+    """
+    Last index entry with ts_utc < `ts` ((epoch us, offset-aware); first entry
+    when none): no record at or after it precedes it. TypeError when an entry's
+    offset-awareness differs from ts's, as datetime comparison.
+    """
+    usable = [(t, e) for t, e in ((try_ts_epoch_us_tz(e[3]), e) for e in index["entries"]) if t is not None]
+    for t, _e in usable:
+        check_ts_tz(t[1], ts[1], "compare")
+    k = bisect_left([t[0] for t, _e in usable], ts[0])
+    return usable[k - 1][1] if k > 0 else index["entries"][0]
+
+
+def iter_slice(
+    dataset_dir: Path,
+    tick_start: int = 0,
+    tick_end: Optional[int] = None,
+    ts_start: Optional[str] = None,
+    ts_end: Optional[str] = None,
+) -> Iterator[Tuple[int, str, Dict[str, Any]]]:
+    """
+    (tick, stripped line, record) for the ticks in [tick_start, tick_end) whose
+    ts_utc is in [ts_start, ts_end) (ISO8601; None = open bound), reading
+    market_snapshot.jsonl only from the nearest index anchor to the slice end.
+
+    Strict like iter_jsonl over the bytes it reads. With a ts bound, every record
+    read must carry a parseable ts_utc that does not go backward (ValueError),
+    and naive and offset-carrying values never meet (TypeError, as datetimes).
+    """
+    path = dataset_dir / "market_snapshot.jsonl"
+    t0 = ts_epoch_us_tz(ts_start) if ts_start else None
+    t1 = ts_epoch_us_tz(ts_end) if ts_end else None
+    by_ts = t0 is not None or t1 is not None
+
+    index = load_ts_index(dataset_dir)
+    anchor: List[Any] = [0, 1, 0, None]
+    if index is not None:
+        anchor = anchor_for_tick(index, tick_start)
+        if t0 is not None:
+            anchor = max(anchor, anchor_for_ts(index, t0), key=lambda e: e[0])
+
+    tick, line_no = anchor[0], anchor[1] - 1
+    checked = index is None
+    prev: Optional[Tuple[int, bool]] = None
+    with path.open("rb") as raw:
+        raw.seek(anchor[2])
+        f = io.TextIOWrapper(raw, encoding="utf-8", newline="")
+        for line in f:
+            line_no += 1
+            s = line.strip()
+            if not s:
+                continue
+            if tick_end is not None and tick >= tick_end:
+                return
+            try:
+                rec = json.loads(s)
+            except json.JSONDecodeError as e:
+                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+            if not isinstance(rec, dict):
+                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+            if not checked:
+                # the anchor record itself: a cheap guard against an index pointing mid-line
+                if line_no != anchor[1] or _index_ts(rec.get("ts_utc")) != anchor[3]:
+                    raise ValueError(f"{TS_INDEX_NAME} entry for tick {tick} does not match {path} line {line_no}")
+                checked = True
+            if by_ts:
+                ts = try_ts_epoch_us_tz(rec.get("ts_utc"))
+                if ts is None:
+                    raise ValueError(f"ts_utc missing/unparseable at {path} line {line_no}; cannot slice by time")
+                for other in (prev, t1, t0):
+                    if other is not None:
+                        check_ts_tz(ts[1], other[1], "compare")
+                if prev is not None and ts[0] < prev[0]:
+                    raise ValueError(f"ts_utc goes backward at {path} line {line_no}; cannot slice by time")
+                prev = ts
+                if t1 is not None and ts[0] >= t1[0]:
+                    return
+                if t0 is not None and ts[0] < t0[0]:
+                    tick += 1
+                    continue
+            if tick >= tick_start:
+                yield tick, s, rec
+            tick += 1
@@ -0,0 +1,170 @@
+#!/usr/bin/env python3
+"""
+V12 Replay Dataset v1 chunk layout helpers (Research repo, stdlib only).
+
+Layout (replay_snapshot_v1, SSOT: docs/v12/V12_SSOT_REPLAY_DATASET_V1_20261017.md):
+  <dataset_dir>/dataset_manifest.json              dataset_kind = "replay_snapshot_v1"
+  <dataset_dir>/chunks/market_snapshot.NNNNNN.jsonl
+    chunk k holds ticks [k * chunk_ticks, (k + 1) * chunk_ticks) -- only the
+    last chunk may be shorter -- one tick per line, no blank lines
+
+Chunk index (manifest["chunk_index"], one entry per chunk, in tick order):
+  {chunk, path, tick_start, tick_end, ts_first_utc, ts_last_utc, sha256, record_count, bytes}
+  Ticks are 0-based positions in the logical market_snapshot stream. A tick
+  maps to its chunk by integer division; a ts_utc by bisecting ts_first_utc
+  (ts_utc is monotonic non-decreasing by contract).
+
+Readers touch only the chunks they need: random access, partial
+re-verification and parallel replay cost O(chunk), not O(dataset).
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+import json
+from bisect import bisect_right
+from datetime import datetime
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from evidence_io_v0 import check_ts_tz, ts_epoch_us_tz
+
+
+DATASET_KIND_V1 = "replay_snapshot_v1"
+CHUNK_DIRNAME = "chunks"
+DEFAULT_CHUNK_TICKS = 100_000
+
+_ENTRY_KEYS = ("chunk", "path", "tick_start", "tick_end", "ts_first_utc", "ts_last_utc", "sha256", "record_count", "bytes")
+
+
+def chunk_relpath(k: int) -> str:
+    return f"{CHUNK_DIRNAME}/market_snapshot.{k:06d}.jsonl"
+
+
+def parse_iso_utc(ts: str) -> datetime:
+    s = ts.strip()
+    if s.endswith("Z"):
+        s = s[:-1] + "+00:00"
+    return datetime.fromisoformat(s)
+
+
+def read_manifest(dataset_dir: Path) -> Dict[str, Any]:
+    with (dataset_dir / "dataset_manifest.json").open("r", encoding="utf-8") as f:
+        obj = json.load(f)
+    if not isinstance(obj, dict):
+        raise ValueError("dataset_manifest.json must be a JSON object")
+    return obj
+
+
+def _is_int(v: Any) -> bool:
+    return isinstance(v, int) and not isinstance(v, bool)
+
+
+def check_chunk_index(manifest: Dict[str, Any]) -> Tuple[List[Dict[str, Any]], int, List[str]]:
+    """
+    (entries, chunk_ticks, problems) for manifest["chunking"] / manifest["chunk_index"].
+
+    problems is empty iff the index is well-formed: contiguous fixed-size tick
+    ranges starting at 0, canonical chunk paths, and the totals in "chunking".
+    """
+    problems: List[str] = []
+    chunking = manifest.get("chunking")
+    if not isinstance(chunking, dict):
+        return [], 0, ["chunking must be an object"]
+    chunk_ticks = chunking.get("chunk_ticks")
+    if not _is_int(chunk_ticks) or chunk_ticks <= 0:
+        return [], 0, [f"chunking.chunk_ticks must be a positive int, got {chunk_ticks!r}"]
+    entries = manifest.get("chunk_index")
+    if not isinstance(entries, list) or not entries:
+        return [], chunk_ticks, ["chunk_index must be a non-empty list"]
+
+    out: List[Dict[str, Any]] = []
+    for k, e in enumerate(entries):
+        if not isinstance(e, dict):
+            problems.append(f"chunk_index[{k}] must be an object")
+            continue
+        missing = [key for key in _ENTRY_KEYS if key not in e]
+        if missing:
+            problems.append(f"chunk_index[{k}] missing keys: {missing}")
+            continue
+        if e["chunk"] != k or e["path"] != chunk_relpath(k):
+            problems.append(f"chunk_index[{k}] must be chunk {k} at {chunk_relpath(k)}, got {e['chunk']!r} at {e['path']!r}")
+        ts, te, rc = e["tick_start"], e["tick_end"], e["record_count"]
+        if not (_is_int(ts) and _is_int(te) and _is_int(rc)):
+            problems.append(f"chunk_index[{k}] tick_start/tick_end/record_count must be ints")
+            continue
+        last = k == len(entries) - 1
+        if ts != k * chunk_ticks or rc != te - ts or not (0 < rc <= chunk_ticks) or (not last and rc != chunk_ticks):
+            problems.append(
+                f"chunk_index[{k}] tick range [{ts}, {te}) record_count={rc} breaks fixed chunking of {chunk_ticks} ticks"
+            )
+        if not isinstance(e["sha256"], str) or not e["sha256"]:
+            problems.append(f"chunk_index[{k}].sha256 must be a non-empty string")
+        out.append(e)
+
+    if not problems:
+        tick_count = out[-1]["tick_end"]
+        if chunking.get("chunk_count") != len(out) or chunking.get("tick_count") != tick_count:
+            problems.append(
+                f"chunking totals (chunk_count={chunking.get('chunk_count')!r}, tick_count={chunking.get('tick_count')!r})"
+                f" do not match chunk_index ({len(out)} chunks, {tick_count} ticks)"
+            )
+    return out, chunk_ticks, problems
+
+
+def load_chunk_index(dataset_dir: Path) -> Tuple[Dict[str, Any], List[Dict[str, Any]], int]:
+    """(manifest, chunk entries, chunk_ticks) of a v1 dataset; ValueError if it is not a well-formed v1 manifest."""
+    manifest = read_manifest(dataset_dir)
+    if manifest.get("dataset_kind") != DATASET_KIND_V1:
+        raise ValueError(f"dataset_kind must be {DATASET_KIND_V1!r}, got {manifest.get('dataset_kind')!r}")
+    entries, chunk_ticks, problems = check_chunk_index(manifest)
+    if problems:
+        raise ValueError(f"invalid chunk_index: {problems[0]}")
+    return manifest, entries, chunk_ticks
+
+
+def chunks_for_ticks(entries: List[Dict[str, Any]], chunk_ticks: int, start: int, end: int) -> List[Dict[str, Any]]:
+    """Entries overlapping ticks [start, end)."""
+    if end <= start:
+        return []
+    lo = max(0, start // chunk_ticks)
+    hi = min(len(entries), -(-end // chunk_ticks))
+    return entries[lo:hi]
+
+
+def chunk_for_ts(entries: List[Dict[str, Any]], ts_utc: str) -> int:
+    """Index of the first chunk that may hold ts_utc (0 if it precedes the dataset; TypeError on a naive/aware mix)."""
+    us, aware = ts_epoch_us_tz(ts_utc)
+    keys = []
+    for e in entries:
+        k_us, k_aware = ts_epoch_us_tz(e["ts_first_utc"])
+        check_ts_tz(k_aware, aware, "compare")
+        keys.append(k_us)
+    return max(0, bisect_right(keys, us) - 1)
+
+
+def iter_ticks(dataset_dir: Path, start: int = 0, end: Optional[int] = None) -> Iterator[Tuple[int, Dict[str, Any]]]:
+    """(tick, record) for ticks [start, end) of a v1 dataset, reading only the chunks that hold them."""
+    _manifest, entries, chunk_ticks = load_chunk_index(dataset_dir)
+    total = entries[-1]["tick_end"]
+    end = total if end is None else min(end, total)
+    for e in chunks_for_ticks(entries, chunk_ticks, start, end):
+        path = dataset_dir / e["path"]
+        first = max(start, e["tick_start"]) - e["tick_start"]
+        last = min(end, e["tick_end"]) - e["tick_start"]
+        n = 0
+        with path.open("r", encoding="utf-8") as f:
+            # one tick per line: skipped lines are never decoded
+            for n, raw in enumerate(islice(f, first, last), 1):
+                line_no = first + n
+                try:
+                    rec = json.loads(raw)
+                except json.JSONDecodeError as ex:
+                    raise ValueError(f"Invalid JSONL at {path} line {line_no}: {ex}") from ex
+                if not isinstance(rec, dict):
+                    raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+                yield e["tick_start"] + line_no - 1, rec
+        if first + n < last:
+            raise ValueError(f"{path} has {first + n} lines, chunk_index record_count={e['record_count']}")
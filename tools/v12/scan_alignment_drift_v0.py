@@ -28,6 +28,8 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -39,17 +41,16 @@ def _read_json(path: Path) -> Dict[str, Any]:
 
 
 def _iter_jsonl(path: Path) -> Iterable[Dict[str, Any]]:
-    if not path.exists():
+    if not evidence_exists(path):
         return
-    with open(path, "r", encoding="utf-8") as f:
-        for line_no, line in enumerate(f, 1):
-            line = line.strip()
-            if not line:
-                continue
-            try:
-                yield json.loads(line)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+    for line_no, line in enumerate(iter_evidence_lines(path), 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
 
 
 def _get_nested(obj: Dict[str, Any], keys: List[str]) -> Optional[Any]:
@@ -195,7 +196,7 @@ def main() -> int:
     template_fields, tpl = _load_template(template_path)
 
     exchange_api_calls = run_dir / "exchange_api_calls.jsonl"
-    if not exchange_api_calls.exists():
+    if not evidence_exists(exchange_api_calls):
         # Backward compatibility: Quant may call it okx_api_calls.jsonl
         exchange_api_calls = run_dir / "okx_api_calls.jsonl"
 
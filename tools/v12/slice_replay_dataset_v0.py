@@ -0,0 +1,220 @@
+#!/usr/bin/env python3
+"""
+Slice a Replay Dataset v0 by time or tick range into a new v0 dataset (stdlib only).
+
+The sparse ts index written by build_replay_dataset_v0
+(market_snapshot.ts_index.json, see replay_dataset_io_v0) locates the first
+tick of the slice in milliseconds; only the bytes from the nearest index
+anchor to the end of the slice are read. Datasets built before the index
+existed are still sliced, by reading from the start (WARNING on stderr).
+
+Ranges are half-open: ticks [tick_start, tick_end), ts_utc [ts_start, ts_end);
+given both, the slice is their intersection. The output is a regular
+replay_snapshot_v0 dataset (its own sha256 / record_count / ts index) whose
+manifest "source" records the parent dataset and the slice bounds.
+okx_api_calls.jsonl / errors.jsonl are not tick-aligned and are not carried.
+Files are staged under <output_root>/.tmp_slice_replay_* and moved into the
+dataset dir only after every check passed.
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import os
+import shutil
+import sys
+import tempfile
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from replay_dataset_io_v0 import (
+    DEFAULT_TS_INDEX_STRIDE,
+    TS_INDEX_NAME,
+    compact_ts,
+    iter_slice,
+    load_ts_index,
+    ts_index_entry,
+    write_ts_index,
+)
+from replay_dataset_io_v1 import read_manifest
+
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def slice_dataset(
+    dataset_dir: Path,
+    output_root: Path,
+    dataset_id: str | None = None,
+    tick_start: int = 0,
+    tick_end: Optional[int] = None,
+    ts_start: Optional[str] = None,
+    ts_end: Optional[str] = None,
+) -> Path:
+    if not (dataset_dir / "dataset_manifest.json").exists() or not (dataset_dir / "market_snapshot.jsonl").exists():
+        raise FileNotFoundError("v0 dataset needs dataset_manifest.json and market_snapshot.jsonl")
+    manifest = read_manifest(dataset_dir)
+    if manifest.get("dataset_kind") != "replay_snapshot_v0":
+        raise ValueError(f"dataset_kind must be 'replay_snapshot_v0', got {manifest.get('dataset_kind')!r}")
+
+    output_root = output_root.expanduser().resolve()
+    output_root.mkdir(parents=True, exist_ok=True)
+    staging = Path(tempfile.mkdtemp(prefix=".tmp_slice_replay_", dir=output_root))
+    try:
+        return _slice_staged(dataset_dir, manifest, output_root, staging, dataset_id, tick_start, tick_end, ts_start, ts_end)
+    finally:
+        shutil.rmtree(staging, ignore_errors=True)
+
+
+def _slice_staged(
+    dataset_dir: Path,
+    manifest: Dict[str, Any],
+    output_root: Path,
+    staging: Path,
+    dataset_id: str | None,
+    tick_start: int,
+    tick_end: Optional[int],
+    ts_start: Optional[str],
+    ts_end: Optional[str],
+) -> Path:
+    index = load_ts_index(dataset_dir, manifest)
+    stride = index["stride"] if index is not None else DEFAULT_TS_INDEX_STRIDE
+
+    h = hashlib.sha256()
+    n = 0
+    size = 0
+    first_tick: Optional[int] = None
+    last_tick = 0
+    first_ts: Optional[str] = None
+    last_ts: Optional[str] = None
+    entries: List[List[Any]] = []
+    with (staging / "market_snapshot.jsonl").open("wb") as f:
+        for tick, text, rec in iter_slice(dataset_dir, tick_start, tick_end, ts_start, ts_end):
+            ts = rec.get("ts_utc")
+            if n % stride == 0:
+                entries.append(ts_index_entry(n, n + 1, size, ts))
+            data = text.encode("utf-8") + b"\n"
+            f.write(data)
+            h.update(data)
+            n += 1
+            size += len(data)
+            if first_tick is None:
+                first_tick = tick
+            last_tick = tick
+            if isinstance(ts, str) and ts:
+                if first_ts is None:
+                    first_ts = ts
+                last_ts = ts
+    if first_tick is None:
+        raise ValueError("slice is empty (no records in range)")
+
+    digest = h.hexdigest()
+    files: Dict[str, Any] = {
+        "market_snapshot.jsonl": {"path": "market_snapshot.jsonl", "sha256": digest, "record_count": n},
+        TS_INDEX_NAME: {
+            "path": TS_INDEX_NAME,
+            "sha256": write_ts_index(staging / TS_INDEX_NAME, entries, stride, n, size, digest),
+            "record_count": None,
+        },
+    }
+    src_files = manifest.get("files") if isinstance(manifest.get("files"), dict) else {}
+    entry = src_files.get("source_run_manifest.json")
+    if isinstance(entry, dict) and (dataset_dir / "source_run_manifest.json").exists():
+        raw = (dataset_dir / "source_run_manifest.json").read_bytes()
+        digest_rm = hashlib.sha256(raw).hexdigest()
+        if digest_rm != entry.get("sha256"):
+            raise ValueError("source_run_manifest.json does not match its dataset_manifest entry (sha256)")
+        (staging / "source_run_manifest.json").write_bytes(raw)
+        files["source_run_manifest.json"] = {"path": "source_run_manifest.json", "sha256": digest_rm, "record_count": None}
+
+    wc = manifest.get("world_contract") if isinstance(manifest.get("world_contract"), dict) else {}
+    if dataset_id is None:
+        inst_id = wc.get("inst_id") or "UNKNOWN"
+        s0 = compact_ts(first_ts) if first_ts else "UNKNOWN_START"
+        s1 = compact_ts(last_ts) if last_ts else "UNKNOWN_END"
+        dataset_id = f"dataset_replay_v0_{inst_id}_{s0}_{s1}_{wc.get('tick_interval_ms')}ms"
+
+    out_dir = (output_root / dataset_id).expanduser().resolve()
+    if out_dir == dataset_dir.resolve():
+        raise ValueError(f"slice would overwrite its source dataset {out_dir}; pass a different --dataset_id")
+
+    source = dict(manifest["source"]) if isinstance(manifest.get("source"), dict) else {}
+    source.update(
+        {
+            "source_dataset_kind": "replay_snapshot_v0",
+            "source_dataset_id": manifest.get("dataset_id"),
+            "source_dataset_dir": str(dataset_dir),
+            "source_market_snapshot_sha256": src_files.get("market_snapshot.jsonl", {}).get("sha256"),
+            "slice": {
+                "tick_start": first_tick,
+                "tick_end": last_tick + 1,
+                "ts_start_utc": ts_start,
+                "ts_end_utc": ts_end,
+            },
+        }
+    )
+    ds_manifest = {
+        "dataset_kind": "replay_snapshot_v0",
+        "dataset_id": dataset_id,
+        "created_at_utc": _ts_utc(),
+        "source": source,
+        "world_contract": manifest.get("world_contract"),
+        "files": files,
+    }
+
+    out_dir.mkdir(parents=True, exist_ok=True)
+    for name in files:
+        os.replace(staging / name, out_dir / name)
+    (out_dir / "dataset_manifest.json").write_text(
+        json.dumps(ds_manifest, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+    )
+    return out_dir
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dataset_dir", required=True, help="Replay dataset v0 directory (contains dataset_manifest.json)")
+    ap.add_argument("--output_root", default="./datasets_v12", help="Output root directory (local artifact)")
+    ap.add_argument("--dataset_id", default="", help="Optional dataset_id override (default: from the slice's ts range)")
+    ap.add_argument("--ts_start", default="", help="First ts_utc to keep (ISO8601, inclusive)")
+    ap.add_argument("--ts_end", default="", help="ts_utc to stop at (ISO8601, exclusive)")
+    ap.add_argument("--tick_start", type=int, default=0, help="First tick to keep (0-based, inclusive)")
+    ap.add_argument("--tick_end", type=int, default=-1, help="Tick to stop at (exclusive; -1 = end of dataset)")
+    args = ap.parse_args()
+
+    dataset_dir = Path(args.dataset_dir).expanduser().resolve()
+    output_root = Path(args.output_root).expanduser().resolve()
+
+    if not dataset_dir.exists():
+        print(f"ERROR: dataset_dir not found: {dataset_dir}", file=sys.stderr)
+        return 1
+    if args.tick_start < 0 or (args.tick_end >= 0 and args.tick_end <= args.tick_start):
+        print(f"ERROR: need 0 <= --tick_start < --tick_end, got {args.tick_start}, {args.tick_end}", file=sys.stderr)
+        return 1
+    if not (dataset_dir / TS_INDEX_NAME).exists():
+        print(f"WARNING: {TS_INDEX_NAME} missing; slicing reads market_snapshot.jsonl from the start", file=sys.stderr)
+
+    try:
+        out_dir = slice_dataset(
+            dataset_dir,
+            output_root,
+            dataset_id=(args.dataset_id.strip() or None),
+            tick_start=args.tick_start,
+            tick_end=(args.tick_end if args.tick_end >= 0 else None),
+            ts_start=(args.ts_start.strip() or None),
+            ts_end=(args.ts_end.strip() or None),
+        )
+    except Exception as e:
+        print(f"ERROR: slice failed: {e}", file=sys.stderr)
+        return 2
+
+    print(json.dumps({"tool": "slice_replay_dataset_v0", "dataset_dir": str(out_dir)}, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,194 @@
+#!/usr/bin/env python3
+"""
+V12 shared rank / correlation kernel v0 (Research repo; stdlib, NumPy optional).
+
+Average ranks, Pearson r and Spearman rho exactly as the calibration / epoch
+tools have always computed them, behind one API:
+  - rankdata(xs) -> 1-based ranks, ties get the mean of their positions
+  - pearson(x, y) -> r, or None (empty, length mismatch, zero variance)
+  - spearman(x, y) -> pearson of the average ranks, or None
+
+Backends:
+  - python: the reference implementation (rankdata_py / pearson_py / spearman_py)
+  - numpy: argsort-based average ranks and vectorized Pearson (rankdata_np /
+    pearson_np / spearman_np); NumPy is imported on first use
+  $PROMETHEUS_STATS_BACKEND: `auto` (default: numpy for inputs of at least
+  NUMPY_MIN_N samples when NumPy imports, else python), `python`, or `numpy`
+  (every input; RuntimeError without NumPy).
+
+Backend parity (verify_stats_kernel_parity_v0.py checks it):
+  - rankdata: bit-identical (ranks are exact half-integers); inputs holding NaN
+    run the reference (sorted() places NaN by comparison order, argsort does not)
+  - spearman: bit-identical while the rank moment sums stay exact in float64
+    (n up to ~3e5), then within 1e-11 (sum()'s sequential rounding)
+  - pearson: within 1e-12 on data whose |mean| / std is below ~1e3 (same
+    formula; NumPy's pairwise sums round differently from sum())
+  - None / NaN exactly where the reference returns them: constant or
+    non-finite inputs run the reference (its sum() mean can round off a
+    constant value and leave v > 0)
+
+This module is not a CLI; tools import it as a sibling module.
+"""
+
+from __future__ import annotations
+
+import math
+import os
+from typing import Any, List, Optional, Sequence
+
+
+ENV_STATS_BACKEND = "PROMETHEUS_STATS_BACKEND"
+NUMPY_MIN_N = 1024  # below this, NumPy's per-call overhead outweighs the loops
+
+_numpy: Any = None  # module once imported; False when unavailable
+
+
+def _mode() -> str:
+    mode = os.environ.get(ENV_STATS_BACKEND, "auto").strip().lower() or "auto"
+    if mode not in ("auto", "python", "numpy"):
+        raise ValueError(f"invalid ${ENV_STATS_BACKEND}: {mode!r} (expected auto, python or numpy)")
+    return mode
+
+
+def _load_numpy() -> Any:
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def _require_numpy() -> Any:
+    np = _load_numpy()
+    if np is None:
+        raise RuntimeError(f"NumPy backend requested (${ENV_STATS_BACKEND}=numpy) but NumPy is not installed")
+    return np
+
+
+def numpy_available() -> bool:
+    return _load_numpy() is not None
+
+
+def backend_for(n: int) -> str:
+    """Backend rankdata / pearson / spearman use for inputs of n samples."""
+    mode = _mode()
+    if mode == "numpy":
+        _require_numpy()
+        return "numpy"
+    if mode == "python" or n < NUMPY_MIN_N or _load_numpy() is None:
+        return "python"
+    return "numpy"
+
+
+# --- reference (pure Python) ---
+
+
+def rankdata_py(xs: Sequence[float]) -> List[float]:
+    n = len(xs)
+    order = sorted(range(n), key=lambda i: xs[i])
+    ranks = [0.0] * n
+    i = 0
+    while i < n:
+        j = i
+        while j + 1 < n and xs[order[j + 1]] == xs[order[i]]:
+            j += 1
+        # average rank for ties
+        avg = (i + 1 + j + 1) / 2.0
+        for k in range(i, j + 1):
+            ranks[order[k]] = avg
+        i = j + 1
+    return ranks
+
+
+def pearson_py(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    n = len(x)
+    if n == 0 or n != len(y):
+        return None
+    mx = sum(x) / n
+    my = sum(y) / n
+    vx = sum((a - mx) ** 2 for a in x)
+    vy = sum((b - my) ** 2 for b in y)
+    if vx <= 0 or vy <= 0:
+        return None
+    cov = sum((a - mx) * (b - my) for a, b in zip(x, y))
+    return cov / math.sqrt(vx * vy)
+
+
+def spearman_py(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    if len(x) != len(y) or not x:
+        return None
+    return pearson_py(rankdata_py(x), rankdata_py(y))
+
+
+# --- NumPy fast path ---
+
+
+def _ranks_np(np: Any, a: Any) -> Any:
+    n = a.size
+    order = np.argsort(a, kind="stable")
+    sa = a[order]
+    first = np.empty(n, dtype=bool)  # sorted position opens a tie group
+    first[0] = True
+    np.not_equal(sa[1:], sa[:-1], out=first[1:])
+    starts = np.flatnonzero(first)
+    ends = np.append(starts[1:], n) - 1
+    ranks = np.empty(n, dtype=np.float64)
+    ranks[order] = ((starts + ends + 2) / 2.0)[np.cumsum(first) - 1]
+    return ranks
+
+
+def _pearson_np(np: Any, a: Any, b: Any) -> Optional[float]:
+    if not (np.isfinite(a).all() and np.isfinite(b).all()) or a.min() == a.max() or b.min() == b.max():
+        return pearson_py(a.tolist(), b.tolist())
+    n = a.size
+    da = a - a.sum() / n
+    db = b - b.sum() / n
+    vx = float(np.dot(da, da))
+    vy = float(np.dot(db, db))
+    if vx <= 0 or vy <= 0:
+        return None
+    return float(np.dot(da, db)) / math.sqrt(vx * vy)
+
+
+def rankdata_np(xs: Sequence[float]) -> List[float]:
+    np = _require_numpy()
+    a = np.asarray(xs, dtype=np.float64)
+    if a.size == 0 or np.isnan(a).any():
+        return rankdata_py(xs)
+    return _ranks_np(np, a).tolist()
+
+
+def pearson_np(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    np = _require_numpy()
+    if len(x) == 0 or len(x) != len(y):
+        return None
+    return _pearson_np(np, np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64))
+
+
+def spearman_np(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    np = _require_numpy()
+    if len(x) != len(y) or len(x) == 0:
+        return None
+    a = np.asarray(x, dtype=np.float64)
+    b = np.asarray(y, dtype=np.float64)
+    if np.isnan(a).any() or np.isnan(b).any():
+        return spearman_py(x, y)
+    return _pearson_np(np, _ranks_np(np, a), _ranks_np(np, b))
+
+
+# --- dispatch ---
+
+
+def rankdata(xs: Sequence[float]) -> List[float]:
+    return rankdata_np(xs) if backend_for(len(xs)) == "numpy" else rankdata_py(xs)
+
+
+def pearson(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    return pearson_np(x, y) if backend_for(len(x)) == "numpy" else pearson_py(x, y)
+
+
+def spearman(x: Sequence[float], y: Sequence[float]) -> Optional[float]:
+    return spearman_np(x, y) if backend_for(len(x)) == "numpy" else spearman_py(x, y)
@@ -9,6 +9,10 @@ This tool is post-hoc analysis only (no runtime feedback). It reads a run_dir an
   3) Action–dissipation coupling (intensity vs dL_imp/dt correlation)
   4) Nonlinear collapse signature (stage-wise shrink near L→0)
 
+decision_trace.jsonl and survival_space.jsonl are read in one streaming pass (zipped by tick);
+per-tick signals are accumulated as they go (intensity/dL_imp pairs in typed arrays, per-bin
+counters), so memory no longer grows with boxed per-tick series.
+
 Exit codes:
   0: PASS (report produced)
   2: FAIL (strict JSONL broken / missing inputs)
@@ -19,11 +23,14 @@ from __future__ import annotations
 
 import argparse
 import json
-import math
 import sys
+from array import array
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from evidence_io_v0 import evidence_exists, iter_evidence_lines
+from stats_kernel_v0 import pearson
 
 
 def _ts_utc() -> str:
@@ -39,18 +46,17 @@ def _read_json(path: Path) -> Dict[str, Any]:
 
 
 def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+    for line_no, raw in enumerate(iter_evidence_lines(path), 1):
+        s = raw.strip()
+        if not s:
+            continue
+        try:
+            obj = json.loads(s)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
+        if not isinstance(obj, dict):
+            raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
+        yield line_no, obj
 
 
 def _is_num(x: Any) -> bool:
@@ -68,23 +74,13 @@ def _safe_get(d: Dict[str, Any], keys: List[str]) -> Any:
     return None
 
 
-def _pearsonr(xs: List[float], ys: List[float]) -> Optional[float]:
-    if len(xs) != len(ys) or len(xs) < 3:
-        return None
-    mx = sum(xs) / len(xs)
-    my = sum(ys) / len(ys)
-    num = 0.0
-    dx = 0.0
-    dy = 0.0
-    for x, y in zip(xs, ys):
-        ax = x - mx
-        ay = y - my
-        num += ax * ay
-        dx += ax * ax
-        dy += ay * ay
-    if dx <= 0 or dy <= 0:
-        return None
-    return float(num / math.sqrt(dx * dy))
+def _num_or_none(v: Any) -> Optional[float]:
+    return float(v) if _is_num(v) else None
+
+
+def _masked(rec: Dict[str, Any], key: str) -> Optional[float]:
+    # value only when `<key>_mask` == 1 and the value is numeric
+    return float(rec[key]) if rec.get(f"{key}_mask") == 1 and _is_num(rec.get(key)) else None
 
 
 def summarize(run_dir: Path, l_epsilon: float, bins: List[Tuple[float, float]]) -> Dict[str, Any]:
@@ -94,7 +90,7 @@ def summarize(run_dir: Path, l_epsilon: float, bins: List[Tuple[float, float]])
         "decision_trace.jsonl",
         "order_attempts.jsonl",
     ]
-    missing = [x for x in required if not (run_dir / x).exists()]
+    missing = [x for x in required if not evidence_exists(run_dir / x)]
     if missing:
         raise ValueError(f"missing required file(s): {missing}")
 
@@ -138,17 +134,6 @@ def summarize(run_dir: Path, l_epsilon: float, bins: List[Tuple[float, float]])
                 for c in grc:
                     gate_reason_counts_attempt[c] = gate_reason_counts_attempt.get(c, 0) + 1
 
-    # Decision-level (primary)
-    for _ln, rec in _iter_jsonl(run_dir / "decision_trace.jsonl"):
-        _consume_gate(rec, scope="decision")
-
-    # Attempt-level (secondary; may be biased if attempts only emitted when allowed)
-    for _ln, rec in _iter_jsonl(run_dir / "order_attempts.jsonl"):
-        _consume_gate(rec, scope="attempt")
-
-    gate_rate_decision = (gate_blocked_decision / gate_total_decision) if gate_total_decision > 0 else None
-    gate_rate_attempt = (gate_blocked_attempt / gate_total_attempt) if gate_total_attempt > 0 else None
-
     # Gate suppression (cap/downshift) at decision-level:
     # If decision_trace carries both interaction_intensity and post_gate_intensity, we can measure:
     #  - downshift_rate: fraction of decisions where post < proposed
@@ -157,144 +142,163 @@ def summarize(run_dir: Path, l_epsilon: float, bins: List[Tuple[float, float]])
     post_sum = 0.0
     downshift_cnt = 0
     downshift_total = 0
-    for _ln, rec in _iter_jsonl(run_dir / "decision_trace.jsonl"):
-        it = _safe_get(rec, ["interaction_intensity", "intensity", "action_intensity"])
-        pt = rec.get("post_gate_intensity")
-        if _is_num(it) and _is_num(pt):
-            itf = float(it)
-            ptf = float(pt)
-            proposed_sum += itf
-            post_sum += ptf
-            downshift_total += 1
-            if ptf < itf:
-                downshift_cnt += 1
-
-    suppression_ratio = None
-    if proposed_sum > 0:
-        suppression_ratio = float((proposed_sum - post_sum) / proposed_sum)
 
-    # --- Read survival_space series (for exhaustion + collapse + dL_imp/dt)
-    # We join by index/order (tick alignment is assumed by strict per-tick write requirement).
-    L_series: List[Optional[float]] = []
-    Lm_series: List[int] = []
-    Lliq_series: List[Optional[float]] = []
-    Lliq_m_series: List[int] = []
-    Limp_series: List[Optional[float]] = []
-    Limp_m_series: List[int] = []
-
-    for _ln, rec in _iter_jsonl(run_dir / "survival_space.jsonl"):
-        L_series.append(float(rec["L"]) if rec.get("L_mask") == 1 and _is_num(rec.get("L")) else None)
-        Lm_series.append(int(rec.get("L_mask", 0)) if rec.get("L_mask") in (0, 1) else 0)
-        Lliq_series.append(float(rec["L_liq"]) if rec.get("L_liq_mask") == 1 and _is_num(rec.get("L_liq")) else None)
-        Lliq_m_series.append(int(rec.get("L_liq_mask", 0)) if rec.get("L_liq_mask") in (0, 1) else 0)
-        Limp_series.append(float(rec["L_imp"]) if rec.get("L_imp_mask") == 1 and _is_num(rec.get("L_imp")) else None)
-        Limp_m_series.append(int(rec.get("L_imp_mask", 0)) if rec.get("L_imp_mask") in (0, 1) else 0)
-
-    n = len(L_series)
-
-    # --- Exhaustion attribution: first tick where L <= epsilon (measurable)
+    # --- Per-tick signals, one streaming pass over decision_trace zipped with survival_space.
+    # We join by index/order (tick alignment is assumed by strict per-tick write requirement);
+    # survival_space ticks past the end of decision_trace have no intensity / cap / action_allowed.
+    #  - exhaustion attribution: first tick where L <= epsilon (measurable)
+    #  - action–dissipation coupling: intensity vs dL_imp/dt, pairs kept as typed arrays
+    #  - nonlinear collapse: each tick's L is assigned to its bin(s) once; per-bin accumulators
     first_exhaust = {"tick_idx": None, "first_exhaust_dim": None, "L_at_exhaust": None}
-    for i in range(n):
-        if Lm_series[i] != 1 or L_series[i] is None:
-            continue
-        if float(L_series[i]) <= l_epsilon:
-            dim = None
+    xs = array("d")
+    ys = array("d")
+    n_bins = len(bins)
+    bin_cnt = array("q", [0]) * n_bins
+    bin_aa_cnt = array("q", [0]) * n_bins
+    bin_aa_blocked = array("q", [0]) * n_bins
+    bin_cap_cnt = array("q", [0]) * n_bins
+    bin_cap_sum = array("d", [0.0]) * n_bins
+
+    n = 0
+    prev_imp: Optional[float] = None
+
+    def _consume_tick(srec: Dict[str, Any], intensity: Optional[float], cap: Optional[float], aa: Optional[bool]) -> None:
+        nonlocal n, prev_imp, first_exhaust
+        i = n
+        L = _masked(srec, "L")
+        L_liq = _masked(srec, "L_liq")
+        L_imp = _masked(srec, "L_imp")
+        n += 1
+
+        if L is not None and first_exhaust["tick_idx"] is None and L <= l_epsilon:
             # choose the min contributor if both measurable; else unknown
-            if Lliq_m_series[i] == 1 and Limp_m_series[i] == 1 and Lliq_series[i] is not None and Limp_series[i] is not None:
-                dim = "liq" if float(Lliq_series[i]) <= float(Limp_series[i]) else "imp"
-            first_exhaust = {"tick_idx": i, "first_exhaust_dim": dim, "L_at_exhaust": float(L_series[i])}
-            break
+            dim = None
+            if L_liq is not None and L_imp is not None:
+                dim = "liq" if L_liq <= L_imp else "imp"
+            first_exhaust = {"tick_idx": i, "first_exhaust_dim": dim, "L_at_exhaust": L}
 
-    # --- Action–dissipation coupling: intensity vs dL_imp/dt
-    # Extract per-tick intensity from decision_trace, best-effort.
-    intensities: List[Optional[float]] = []
-    for _ln, rec in _iter_jsonl(run_dir / "decision_trace.jsonl"):
-        v = _safe_get(rec, ["interaction_intensity", "intensity", "action_intensity"])
-        if v is None:
-            intensities.append(None)
-        elif _is_num(v):
-            intensities.append(float(v))
-        else:
-            intensities.append(None)
-        if len(intensities) >= n:
-            break
-    # pad if shorter
-    if len(intensities) < n:
-        intensities.extend([None] * (n - len(intensities)))
-
-    xs: List[float] = []
-    ys: List[float] = []
-    for i in range(1, n):
-        if intensities[i] is None:
-            continue
-        if Limp_m_series[i] != 1 or Limp_m_series[i - 1] != 1:
-            continue
-        if Limp_series[i] is None or Limp_series[i - 1] is None:
-            continue
-        d = float(Limp_series[i]) - float(Limp_series[i - 1])  # dL_imp/dt (per tick)
-        xs.append(float(intensities[i]))
-        ys.append(float(d))
+        if i > 0 and intensity is not None and L_imp is not None and prev_imp is not None:
+            xs.append(intensity)
+            ys.append(L_imp - prev_imp)  # dL_imp/dt (per tick)
+        prev_imp = L_imp
 
-    r = _pearsonr(xs, ys)
+        if L is None:
+            return
+        for j in range(n_bins):
+            lo, hi = bins[j]
+            if L < lo or L >= hi:
+                continue
+            bin_cnt[j] += 1
+            if aa is not None:
+                bin_aa_cnt[j] += 1
+                if aa is False:
+                    bin_aa_blocked[j] += 1
+            if cap is not None:
+                bin_cap_cnt[j] += 1
+                bin_cap_sum[j] += cap
+
+    # Errors surface in the order of the former per-signal passes (decision_trace strict JSONL,
+    # order_attempts, suppression, survival_space, intensity, intensity_cap): decision_trace
+    # and order_attempts raise as read, the rest are held until both are known clean.
+    deferred: Dict[str, Exception] = {}
+    ss_iter: Optional[Iterator[Tuple[int, Dict[str, Any]]]] = _iter_jsonl(run_dir / "survival_space.jsonl")
+
+    def _next_tick() -> Optional[Dict[str, Any]]:
+        nonlocal ss_iter
+        if ss_iter is None:
+            return None
+        try:
+            return next(ss_iter)[1]
+        except StopIteration:
+            pass
+        except Exception as e:
+            deferred["survival_space"] = e
+        ss_iter = None
+        return None
 
-    # --- Nonlinear collapse signature: bin by L and summarize gate/intensity-cap visibility
-    # intensity_cap may be in decision_trace or order_attempts; summarize if present.
-    intensity_caps: List[Optional[float]] = []
-    for _ln, rec in _iter_jsonl(run_dir / "decision_trace.jsonl"):
-        v = rec.get("intensity_cap")
-        if v is None:
-            intensity_caps.append(None)
-        elif _is_num(v):
-            intensity_caps.append(float(v))
-        else:
-            intensity_caps.append(None)
-        if len(intensity_caps) >= n:
-            break
-    if len(intensity_caps) < n:
-        intensity_caps.extend([None] * (n - len(intensity_caps)))
+    for dt_idx, (_ln, rec) in enumerate(_iter_jsonl(run_dir / "decision_trace.jsonl")):
+        _consume_gate(rec, scope="decision")
 
-    # We don't require perfect per-tick action_allowed; use global gate_rate plus by-bin using decision_trace when possible
-    action_allowed_by_tick: List[Optional[bool]] = []
-    for _ln, rec in _iter_jsonl(run_dir / "decision_trace.jsonl"):
+        it = _safe_get(rec, ["interaction_intensity", "intensity", "action_intensity"])
+        if "suppression" not in deferred:
+            pt = rec.get("post_gate_intensity")
+            if _is_num(it) and _is_num(pt):
+                try:
+                    itf = float(it)
+                    ptf = float(pt)
+                except Exception as e:
+                    deferred["suppression"] = e
+                else:
+                    proposed_sum += itf
+                    post_sum += ptf
+                    downshift_total += 1
+                    if ptf < itf:
+                        downshift_cnt += 1
+
+        srec = _next_tick()
+        # the former per-tick passes read decision_trace up to n records (at least one)
+        if srec is None and dt_idx > 0:
+            continue
+        intensity = cap = None
+        try:
+            intensity = _num_or_none(it)
+        except Exception as e:
+            deferred.setdefault("intensity", e)
+        try:
+            cap = _num_or_none(rec.get("intensity_cap"))
+        except Exception as e:
+            deferred.setdefault("intensity_cap", e)
+        if srec is None or "survival_space" in deferred:
+            continue
         aa = rec.get("action_allowed")
-        action_allowed_by_tick.append(aa if isinstance(aa, bool) else None)
-        if len(action_allowed_by_tick) >= n:
+        try:
+            _consume_tick(srec, intensity, cap, aa if isinstance(aa, bool) else None)
+        except Exception as e:
+            deferred["survival_space"] = e
+            ss_iter = None
+
+    while ss_iter is not None:
+        srec = _next_tick()
+        if srec is None:
             break
-    if len(action_allowed_by_tick) < n:
-        action_allowed_by_tick.extend([None] * (n - len(action_allowed_by_tick)))
+        try:
+            _consume_tick(srec, None, None, None)
+        except Exception as e:
+            deferred["survival_space"] = e
+            ss_iter = None
 
+    # Attempt-level (secondary; may be biased if attempts only emitted when allowed)
+    for _ln, rec in _iter_jsonl(run_dir / "order_attempts.jsonl"):
+        _consume_gate(rec, scope="attempt")
+
+    for step in ("suppression", "survival_space", "intensity", "intensity_cap"):
+        if step in deferred:
+            raise deferred[step]
+
+    gate_rate_decision = (gate_blocked_decision / gate_total_decision) if gate_total_decision > 0 else None
+    gate_rate_attempt = (gate_blocked_attempt / gate_total_attempt) if gate_total_attempt > 0 else None
+
+    suppression_ratio = None
+    if proposed_sum > 0:
+        suppression_ratio = float((proposed_sum - post_sum) / proposed_sum)
+
+    r = pearson(xs, ys) if len(xs) >= 3 else None
+
+    # intensity_cap may be in decision_trace or order_attempts; summarize if present.
     bin_stats: List[Dict[str, Any]] = []
-    for lo, hi in bins:
-        cnt = 0
-        aa_cnt = 0
-        aa_blocked = 0
-        cap_cnt = 0
-        cap_sum = 0.0
-        for i in range(n):
-            if Lm_series[i] != 1 or L_series[i] is None:
-                continue
-            v = float(L_series[i])
-            if v < lo or v >= hi:
-                continue
-            cnt += 1
-            aa = action_allowed_by_tick[i]
-            if isinstance(aa, bool):
-                aa_cnt += 1
-                if aa is False:
-                    aa_blocked += 1
-            cap = intensity_caps[i]
-            if cap is not None:
-                cap_cnt += 1
-                cap_sum += float(cap)
+    for j, (lo, hi) in enumerate(bins):
+        aa_cnt = bin_aa_cnt[j]
+        aa_blocked = bin_aa_blocked[j]
+        cap_cnt = bin_cap_cnt[j]
         bin_stats.append(
             {
                 "L_bin": [lo, hi],
-                "L_sample_count": cnt,
+                "L_sample_count": bin_cnt[j],
                 "action_allowed_sample_count": aa_cnt,
                 "action_blocked_count": aa_blocked,
                 "action_blocked_rate": (aa_blocked / aa_cnt) if aa_cnt > 0 else None,
                 "intensity_cap_sample_count": cap_cnt,
-                "intensity_cap_mean": (cap_sum / cap_cnt) if cap_cnt > 0 else None,
+                "intensity_cap_mean": (bin_cap_sum[j] / cap_cnt) if cap_cnt > 0 else None,
             }
         )
 
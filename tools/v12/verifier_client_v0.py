@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+V12/V13 warm verifier client v0 (Research repo, stdlib only).
+
+Runs a tools/v12 or tools/v13 verifier through verifier_daemon_v0 when one is
+listening, else as a plain `python3 <tool> <args>`; either way the report,
+stderr and exit code are the standalone script's. The verifier's own
+arguments follow the tool path unchanged. The client's stdio and environment
+only go to a daemon running under the client's own uid (Linux SO_PEERCRED,
+else the socket file's owner); any other listener is ignored and the tool
+runs standalone. Kept import-light (no typing; the
+daemon imports its socket path helper from here, not the other way round).
+
+Usage:
+  python3 tools/v12/verifier_client_v0.py [--socket PATH] <tool.py> [tool args...]
+
+Exit codes: the verifier's (1 if the daemon worker died without one).
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import signal
+import socket
+import struct
+import sys
+
+
+SOCKET_ENV = "PROMETHEUS_VERIFIER_SOCKET"
+
+
+def default_socket_path() -> str:
+    p = os.environ.get(SOCKET_ENV)
+    if p:
+        return p
+    runtime = os.environ.get("XDG_RUNTIME_DIR")
+    if runtime and os.path.isdir(runtime):
+        return os.path.join(runtime, "prometheus_verifier_v0.sock")
+    return f"/tmp/prometheus_verifier_v0_{os.getuid()}.sock"
+
+
+def _run_standalone(tool: str, argv: list[str]) -> None:
+    os.execv(sys.executable, [sys.executable, tool, *argv])
+
+
+def _daemon_is_ours(conn: socket.socket, path: str) -> bool:
+    if hasattr(socket, "SO_PEERCRED"):
+        creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+        return struct.unpack("3i", creds)[1] == os.getuid()
+    try:
+        return os.stat(path).st_uid == os.getuid()
+    except OSError:
+        return False
+
+
+def _read_line(f) -> dict | None:
+    line = f.readline()
+    return json.loads(line) if line else None
+
+
+def main() -> int:
+    args = sys.argv[1:]
+    socket_path = ""
+    if len(args) >= 2 and args[0] == "--socket":
+        socket_path, args = args[1], args[2:]
+    if not args or args[0].startswith("-"):
+        print("usage: verifier_client_v0.py [--socket PATH] <tool.py> [tool args...]", file=sys.stderr)
+        return 1
+    tool, argv = os.path.abspath(args[0]), args[1:]
+
+    socket_path = socket_path or default_socket_path()
+    conn = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        conn.connect(socket_path)
+    except OSError:
+        _run_standalone(tool, argv)  # no daemon: same tool, cold
+    if not _daemon_is_ours(conn, socket_path):
+        conn.close()
+        _run_standalone(tool, argv)  # someone else's listener: never hand it our fds / environment
+
+    req = {"tool": os.path.realpath(tool), "argv": argv, "cwd": os.getcwd(), "env": dict(os.environ)}
+    sys.stdout.flush()
+    sys.stderr.flush()
+    socket.send_fds(conn, [json.dumps(req).encode("utf-8") + b"\n"], [0, 1, 2])
+    f = conn.makefile("rb")
+    first = _read_line(f)
+    if first is None or "pid" not in first:
+        _run_standalone(tool, argv)  # tool not served by this daemon
+
+    pid = int(first["pid"])
+
+    def _forward(sig: int, _frame: object) -> None:
+        try:
+            os.kill(pid, sig)
+        except OSError:
+            pass
+
+    signal.signal(signal.SIGINT, _forward)
+    signal.signal(signal.SIGTERM, _forward)
+    done = _read_line(f)
+    if done is None or "exit_code" not in done:
+        print("ERROR: verifier daemon worker exited without a result", file=sys.stderr)
+        return 1
+    return int(done["exit_code"])
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,318 @@
+#!/usr/bin/env python3
+"""
+V12/V13 warm verifier daemon v0 (Research repo, stdlib only; Linux / macOS).
+
+Ops scripts call verifiers many times a day; every call pays interpreter
+start-up, the verifier's imports (evidence_io_v0, gate_engine_v0, ...) and its
+source hashing before reading a single record. This optional daemon pays that
+once and serves `verifier_client_v0.py` requests over a local UNIX socket.
+
+Serving model (one request = one forked worker):
+  - at start-up every `verify_*.py` in tools/v12 and tools/v13 is imported
+    (warming its sibling modules) and its source compiled; that is the set of
+    tools served
+  - the client sends its stdin/stdout/stderr file descriptors (SCM_RIGHTS),
+    cwd, environment and argv; the worker adopts them and runs the compiled
+    script as `__main__`, exactly like `python3 <tool> <args>`, so output
+    (including tty buffering), side files and the exit code are the
+    standalone script's
+  - the worker reports its pid first (the client forwards SIGINT / SIGTERM, so
+    --follow modes finalize as on Ctrl-C), then the exit code
+  - workers are independent processes: requests run concurrently, and state a
+    verifier mutates never leaks into the next request
+  - when any .py file under tools/v12 or tools/v13 changes (size / mtime_ns),
+    the request runs cold (`python3 <tool>` in the worker) and the daemon
+    re-executes itself, so report-cache keys (gate_engine_v0 tool source
+    sha256, memoized per process) never describe stale code
+
+Socket: --socket, else $PROMETHEUS_VERIFIER_SOCKET, else
+$XDG_RUNTIME_DIR/prometheus_verifier_v0.sock, else
+/tmp/prometheus_verifier_v0_<uid>.sock; created 0600 and only peers with the
+daemon's uid are served (Linux SO_PEERCRED). Connections are accepted
+serially, so a request must arrive within REQUEST_TIMEOUT_S or it is dropped
+(a silent client cannot stall the others).
+
+Protocol (one JSON object per line): the client sends
+  {"tool": <abs path>, "argv": [...], "cwd": ..., "env": {...}}
+with its three fds; the daemon answers {"pid": N} or {"error": "..."} (tool
+not served: the client runs it standalone), then {"exit_code": N}.
+
+Usage:
+  nohup python3 tools/v12/verifier_daemon_v0.py >/tmp/verifier_daemon.log 2>&1 &
+  python3 tools/v12/verifier_client_v0.py tools/v12/verify_tick_loop_v0.py --run_dir <RUN_DIR>
+
+Exit codes (daemon):
+  0: stopped (SIGINT / SIGTERM / --idle_exit_s)
+  1: ERROR (socket in use by a live daemon, invalid usage)
+"""
+
+from __future__ import annotations
+
+import argparse
+import importlib
+import io
+import json
+import os
+import select
+import signal
+import socket
+import struct
+import subprocess
+import sys
+import time
+import traceback
+import types
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from verifier_client_v0 import SOCKET_ENV, default_socket_path
+
+
+TOOLS_ROOT = Path(__file__).resolve().parent.parent
+TOOL_DIRS = (TOOLS_ROOT / "v12", TOOLS_ROOT / "v13")
+_MAX_REQUEST = 4 * 1024 * 1024  # argv + environment
+REQUEST_TIMEOUT_S = 5.0
+
+
+def _source_stats() -> Dict[str, Tuple[int, int]]:
+    out: Dict[str, Tuple[int, int]] = {}
+    for d in TOOL_DIRS:
+        for p in d.glob("*.py"):
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            out[str(p)] = (st.st_size, st.st_mtime_ns)
+    return out
+
+
+def _warm() -> Dict[str, Any]:
+    """Import every verifier once and compile its script; {abs path: code object}."""
+    for d in TOOL_DIRS:
+        if str(d) not in sys.path:
+            sys.path.append(str(d))
+    compiled: Dict[str, Any] = {}
+    for d in TOOL_DIRS:
+        for p in sorted(d.glob("verify_*.py")):
+            try:
+                importlib.import_module(p.stem)
+                compiled[str(p)] = compile(p.read_bytes(), str(p), "exec")
+            except Exception as e:
+                # not served: the client runs it standalone, which reports the error itself
+                print(f"WARNING: not serving {p.name}: {type(e).__name__}: {e}", file=sys.stderr)
+    return compiled
+
+
+def _send(conn: socket.socket, obj: Dict[str, Any]) -> None:
+    conn.sendall(json.dumps(obj).encode("utf-8") + b"\n")
+
+
+def _recv_request(conn: socket.socket) -> Tuple[Dict[str, Any], List[int]]:
+    data = b""
+    fds: List[int] = []
+    while not data.endswith(b"\n"):
+        msg, new_fds, _flags, _addr = socket.recv_fds(conn, 65536, 3)
+        fds.extend(new_fds)
+        if not msg:
+            break
+        data += msg
+        if len(data) > _MAX_REQUEST:
+            raise ValueError("request too large")
+    req = json.loads(data.decode("utf-8"))
+    if (
+        len(fds) != 3
+        or not isinstance(req, dict)
+        or not isinstance(req.get("tool"), str)
+        or not isinstance(req.get("cwd"), str)
+        or not isinstance(req.get("argv"), list)
+        or not all(isinstance(a, str) for a in req["argv"])
+        or not isinstance(req.get("env"), dict)
+        or not all(isinstance(k, str) and isinstance(v, str) for k, v in req["env"].items())
+    ):
+        raise ValueError("malformed request")
+    return req, fds
+
+
+def _peer_uid_ok(conn: socket.socket) -> bool:
+    if not hasattr(socket, "SO_PEERCRED"):
+        return True  # macOS: the 0600 socket file is the access check
+    creds = conn.getsockopt(socket.SOL_SOCKET, socket.SO_PEERCRED, struct.calcsize("3i"))
+    _pid, uid, _gid = struct.unpack("3i", creds)
+    return uid == os.getuid()
+
+
+def _adopt(req: Dict[str, Any], fds: List[int]) -> None:
+    # the client's stdio, cwd and environment, as if it had started the tool itself
+    for target, fd in enumerate(fds):
+        os.dup2(fd, target)
+        os.close(fd)
+    os.chdir(req["cwd"])
+    os.environ.clear()
+    os.environ.update(req["env"])
+    enc, errors = sys.stdout.encoding, sys.stdout.errors
+    sys.stdin = io.TextIOWrapper(io.FileIO(0, "r", closefd=False), encoding=enc, errors=errors)
+    sys.stdout = io.TextIOWrapper(
+        io.FileIO(1, "w", closefd=False), encoding=enc, errors=errors, line_buffering=os.isatty(1)
+    )
+    sys.stderr = io.TextIOWrapper(
+        io.FileIO(2, "w", closefd=False), encoding=enc, errors="backslashreplace", line_buffering=True
+    )
+
+
+def _run_script(path: str, code: Any, argv: List[str]) -> int:
+    """Run `code` as `python3 <path> <argv>` would; its exit code."""
+    mod = types.ModuleType("__main__")
+    mod.__file__ = path
+    mod.__builtins__ = __builtins__
+    sys.modules["__main__"] = mod
+    sys.argv = [path, *argv]
+    sys.path[0] = str(Path(path).parent)
+    try:
+        exec(code, mod.__dict__)
+        rc = 0
+    except SystemExit as e:
+        if e.code is None:
+            rc = 0
+        elif isinstance(e.code, int):
+            rc = e.code
+        else:
+            print(e.code, file=sys.stderr)
+            rc = 1
+    except KeyboardInterrupt:
+        traceback.print_exc()
+        rc = 130
+    except BaseException:
+        traceback.print_exc()
+        rc = 1
+    for stream in (sys.stdout, sys.stderr):
+        try:
+            stream.flush()
+        except Exception:
+            rc = rc or 120
+    return rc
+
+
+def _worker(conn: socket.socket, req: Dict[str, Any], fds: List[int], code: Any) -> int:
+    signal.signal(signal.SIGINT, signal.default_int_handler)
+    signal.signal(signal.SIGTERM, signal.SIG_DFL)
+    signal.signal(signal.SIGCHLD, signal.SIG_DFL)
+    _send(conn, {"pid": os.getpid()})
+    _adopt(req, fds)
+    if code is None:
+        # sources changed since start-up: run the current file, unwarmed
+        rc = subprocess.call([sys.executable, req["tool"], *req["argv"]])
+    else:
+        rc = _run_script(req["tool"], code, list(req["argv"]))
+    _send(conn, {"exit_code": rc})
+    return rc
+
+
+def _bind(path: str) -> socket.socket:
+    if os.path.exists(path):
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(path)
+        except OSError:
+            os.unlink(path)  # stale socket of a dead daemon
+        else:
+            raise RuntimeError(f"a verifier daemon is already listening on {path}")
+        finally:
+            probe.close()
+    srv = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old = os.umask(0o177)
+    try:
+        srv.bind(path)
+    finally:
+        os.umask(old)
+    srv.listen(64)
+    return srv
+
+
+def serve(socket_path: str, idle_exit_s: float = 0.0) -> int:
+    compiled = _warm()
+    sources = _source_stats()
+    srv = _bind(socket_path)
+    print(f"verifier daemon pid={os.getpid()} socket={socket_path} tools={len(compiled)}", file=sys.stderr, flush=True)
+
+    stop = False
+
+    def _stop(_sig: int, _frame: Any) -> None:
+        nonlocal stop
+        stop = True
+
+    signal.signal(signal.SIGINT, _stop)
+    signal.signal(signal.SIGTERM, _stop)
+    restart = False
+    last = time.monotonic()
+    try:
+        while not stop and not restart:
+            try:
+                while os.waitpid(-1, os.WNOHANG)[0] > 0:
+                    pass
+            except ChildProcessError:
+                pass
+            ready, _w, _x = select.select([srv], [], [], 1.0)
+            if not ready:
+                if idle_exit_s > 0 and time.monotonic() - last > idle_exit_s:
+                    break
+                restart = _source_stats() != sources
+                continue
+            conn, _addr = srv.accept()
+            last = time.monotonic()
+            fds: List[int] = []
+            try:
+                if not _peer_uid_ok(conn):
+                    continue
+                conn.settimeout(REQUEST_TIMEOUT_S)
+                req, fds = _recv_request(conn)
+                conn.settimeout(None)
+                tool = str(req.get("tool"))
+                if tool not in compiled:
+                    _send(conn, {"error": f"not served: {tool}"})
+                    continue
+                restart = _source_stats() != sources
+                code = None if restart else compiled[tool]
+                sys.stdout.flush()
+                sys.stderr.flush()
+                if os.fork() == 0:
+                    srv.close()
+                    rc = 1
+                    try:
+                        rc = _worker(conn, req, fds, code)
+                    finally:
+                        os._exit(rc)
+            except Exception as e:
+                print(f"WARNING: bad request: {type(e).__name__}: {e}", file=sys.stderr, flush=True)
+            finally:
+                for fd in fds:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+                conn.close()
+    finally:
+        srv.close()
+        try:
+            os.unlink(socket_path)
+        except OSError:
+            pass
+    if restart:
+        print("verifier sources changed; restarting", file=sys.stderr, flush=True)
+        os.execv(sys.executable, [sys.executable, *sys.argv])
+    return 0
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--socket", default="", help=f"UNIX socket path (default: ${SOCKET_ENV} or a per-user path)")
+    ap.add_argument("--idle_exit_s", type=float, default=0.0, help="Exit after N seconds without requests (0 = never)")
+    args = ap.parse_args()
+    try:
+        return serve(args.socket or default_socket_path(), idle_exit_s=args.idle_exit_s)
+    except RuntimeError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -27,7 +27,10 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from evidence_io_v0 import evidence_exists
+from gate_engine_v0 import Gate, count_rows, gate_report, run_gates
 
 
 def _ts_utc() -> str:
@@ -39,28 +42,6 @@ def _read_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
-def _count_jsonl_records(path: Path) -> int:
-    n = 0
-    for _line_no, _obj in _iter_jsonl(path):
-        n += 1
-    return n
-
-
 def _is_num(x: Any) -> bool:
     return isinstance(x, (int, float)) and not isinstance(x, bool)
 
@@ -76,7 +57,7 @@ def _is_list_of_str(x: Any) -> bool:
 def _get_first_existing(run_dir: Path, names: List[str]) -> Optional[Path]:
     for n in names:
         p = run_dir / n
-        if p.exists():
+        if evidence_exists(p):
             return p
     return None
 
@@ -92,12 +73,13 @@ class CheckResult:
 def _check_required_files(run_dir: Path, required: List[str]) -> List[str]:
     missing = []
     for name in required:
-        if not (run_dir / name).exists():
+        if not evidence_exists(run_dir / name):
             missing.append(name)
     return missing
 
 
-def _verify_position_snapshots(path: Path) -> Tuple[List[str], List[str]]:
+def _position_snapshots_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[int, List[str], List[str]]:
+    n = 0
     errors: List[str] = []
     warnings: List[str] = []
 
@@ -105,7 +87,8 @@ def _verify_position_snapshots(path: Path) -> Tuple[List[str], List[str]]:
     optional_num_or_str_or_null = ["lever", "pos", "avg_px", "upl"]
     optional_str_or_null = ["mgn_mode", "pos_side"]
 
-    for line_no, rec in _iter_jsonl(path):
+    for line_no, rec in rows:
+        n += 1
         for k in required_keys:
             if k not in rec:
                 errors.append(f"position_snapshots missing key: {k} at line {line_no}")
@@ -146,17 +129,19 @@ def _verify_position_snapshots(path: Path) -> Tuple[List[str], List[str]]:
             if k in rec and rec[k] is None:
                 warnings.append(f"position_snapshots.{k} is null at line {line_no} (NOT_MEASURABLE sample)")
 
-    return errors, warnings
+    return n, errors, warnings
 
 
-def _verify_interaction_impedance(path: Path) -> Tuple[List[str], List[str]]:
+def _interaction_impedance_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[int, List[str], List[str]]:
+    n = 0
     errors: List[str] = []
     warnings: List[str] = []
 
     required_keys = ["ts_utc", "account_id_hash", "verdict", "reason_codes", "evidence_refs"]
     count_keys = ["attempts", "okx_reject_count", "rate_limited_count", "http_error_count"]
 
-    for line_no, rec in _iter_jsonl(path):
+    for line_no, rec in rows:
+        n += 1
         for k in required_keys:
             if k not in rec:
                 errors.append(f"interaction_impedance missing key: {k} at line {line_no}")
@@ -204,76 +189,149 @@ def _verify_interaction_impedance(path: Path) -> Tuple[List[str], List[str]]:
                     f"interaction_impedance.evidence_refs.exchange_api_call_ids must be array[string] at line {line_no}"
                 )
 
-    return errors, warnings
+    return n, errors, warnings
 
 
-def verify(run_dir: Path) -> CheckResult:
-    errors: List[str] = []
-    warnings: List[str] = []
-    counts: Dict[str, int] = {}
+_SCHEMA_CHECKS = {
+    "position_snapshots.jsonl": ("position_snapshots", _position_snapshots_slice),
+    "interaction_impedance.jsonl": ("interaction_impedance", _interaction_impedance_slice),
+}
+
 
-    # Required files: fail-closed, even if empty
-    required = [
+class BaseDimensionsEIMGate(Gate):
+    """
+    E/I/M checks as a gate_engine_v0 gate: strict-JSONL + counts for every file,
+    minimal schema for I (position_snapshots) and M (interaction_impedance),
+    counted and checked from the same read.
+    """
+
+    tool = "verify_base_dimensions_eim_v0"
+    not_measurable_warning = "evidence is valid but degraded samples exist"
+    inputs = (
         "run_manifest.json",
         "market_snapshot.jsonl",
         "position_snapshots.jsonl",
         "interaction_impedance.jsonl",
         "errors.jsonl",
-    ]
-    missing = _check_required_files(run_dir, required)
-    if missing:
-        errors.extend([f"missing required file: {name}" for name in missing])
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts)
-
-    # Optional but recommended API call evidence (backward compatibility names)
-    api_calls = _get_first_existing(run_dir, ["okx_api_calls.jsonl", "exchange_api_calls.jsonl"])
-    if api_calls is None:
-        warnings.append("missing api calls evidence file: okx_api_calls.jsonl/exchange_api_calls.jsonl")
-    else:
-        try:
-            counts["api_calls"] = _count_jsonl_records(api_calls)
-        except Exception as e:
-            errors.append(f"api_calls strict-jsonl failed: {e}")
-
-    # Strict JSONL for E/I/M
-    for name in ["market_snapshot.jsonl", "position_snapshots.jsonl", "interaction_impedance.jsonl", "errors.jsonl"]:
-        p = run_dir / name
-        try:
-            counts[name] = _count_jsonl_records(p)
-        except Exception as e:
-            errors.append(f"{name} strict-jsonl failed: {e}")
-
-    # Schema checks for I/M (E is covered by its own SSOT/verifiers; here we only strict-jsonl + presence)
-    try:
-        e1, w1 = _verify_position_snapshots(run_dir / "position_snapshots.jsonl")
-        errors.extend(e1)
-        warnings.extend(w1)
-    except Exception as e:
-        errors.append(f"position_snapshots schema check crashed: {e}")
-
-    try:
-        e2, w2 = _verify_interaction_impedance(run_dir / "interaction_impedance.jsonl")
-        errors.extend(e2)
-        warnings.extend(w2)
-    except Exception as e:
-        errors.append(f"interaction_impedance schema check crashed: {e}")
+        "okx_api_calls.jsonl",
+        "exchange_api_calls.jsonl",
+    )
+
+    def __init__(self, run_dir: Path) -> None:
+        super().__init__()
+        self.run_dir = run_dir
+        self._early: Optional[CheckResult] = None
+        self._api_calls: Optional[str] = None
+        self._warnings: List[str] = []
+        self._counts: Dict[str, int] = {}
+        self._strict_errors: Dict[str, str] = {}
+        self._schema: Dict[str, Tuple[List[str], List[str]]] = {name: ([], []) for name in _SCHEMA_CHECKS}
+
+        # Required files: fail-closed, even if empty
+        required = [
+            "run_manifest.json",
+            "market_snapshot.jsonl",
+            "position_snapshots.jsonl",
+            "interaction_impedance.jsonl",
+            "errors.jsonl",
+        ]
+        missing = _check_required_files(run_dir, required)
+        if missing:
+            errors = [f"missing required file: {name}" for name in missing]
+            self._early = CheckResult(verdict="FAIL", errors=errors, warnings=[], counts={})
+            return
+
+        # Optional but recommended API call evidence (backward compatibility names)
+        api_calls = _get_first_existing(run_dir, ["okx_api_calls.jsonl", "exchange_api_calls.jsonl"])
+        if api_calls is not None:
+            self._api_calls = api_calls.name
+        else:
+            self._warnings.append("missing api calls evidence file: okx_api_calls.jsonl/exchange_api_calls.jsonl")
+        self.files = tuple(([self._api_calls] if self._api_calls else []) + required[1:])
 
-    if errors:
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts)
+    def _label(self, name: str) -> str:
+        return "api_calls" if name == self._api_calls else name
 
-    # If there are any NOT_MEASURABLE samples, we surface NOT_MEASURABLE (but still exit 0).
-    # This is intentionally conservative: the evidence is valid, but the measurement is degraded.
-    not_measurable = any("NOT_MEASURABLE" in w for w in warnings)
-    if not_measurable:
-        return CheckResult(verdict="NOT_MEASURABLE", errors=errors, warnings=warnings, counts=counts)
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        check = _SCHEMA_CHECKS.get(name)
+        return check[1] if check is not None else count_rows
 
-    return CheckResult(verdict="PASS", errors=errors, warnings=warnings, counts=counts)
+    def update(self, name: str, part: Any) -> None:
+        if name in _SCHEMA_CHECKS:
+            n, e, w = part
+            self._schema[name][0].extend(e)
+            self._schema[name][1].extend(w)
+        else:
+            n = part
+        label = self._label(name)
+        self._counts[label] = self._counts.get(label, 0) + n
+
+    def fail(self, name: str, exc: Exception) -> None:
+        label = self._label(name)
+        self._counts.pop(label, None)
+        self._strict_errors[label] = f"{label} strict-jsonl failed: {exc}"
+        if name in _SCHEMA_CHECKS:
+            self._schema[name] = ([f"{_SCHEMA_CHECKS[name][0]} schema check crashed: {exc}"], [])
+
+    def finalize(self) -> CheckResult:
+        if self._early is not None:
+            return self._early
+        labels = [self._label(name) for name in self.files]
+        counts = {label: self._counts[label] for label in labels if label in self._counts}
+        errors = [self._strict_errors[label] for label in labels if label in self._strict_errors]
+        warnings = list(self._warnings)
+
+        # Schema checks for I/M (E is covered by its own SSOT/verifiers; here we only strict-jsonl + presence)
+        for name in _SCHEMA_CHECKS:
+            errors.extend(self._schema[name][0])
+            warnings.extend(self._schema[name][1])
+
+        if errors:
+            return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts)
+
+        # If there are any NOT_MEASURABLE samples, we surface NOT_MEASURABLE (but still exit 0).
+        # This is intentionally conservative: the evidence is valid, but the measurement is degraded.
+        not_measurable = any("NOT_MEASURABLE" in w for w in warnings)
+        if not_measurable:
+            return CheckResult(verdict="NOT_MEASURABLE", errors=errors, warnings=warnings, counts=counts)
+
+        return CheckResult(verdict="PASS", errors=errors, warnings=warnings, counts=counts)
+
+    def report(self, result: CheckResult) -> Dict[str, Any]:
+        manifest_path = self.run_dir / "run_manifest.json"
+        manifest = _read_json(manifest_path) if manifest_path.exists() else {}
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "run_dir": str(self.run_dir),
+            "manifest": {
+                "run_id": manifest.get("run_id"),
+                "run_kind": manifest.get("run_kind"),
+                "mode": manifest.get("mode"),
+                "truth_profile": manifest.get("truth_profile"),
+            },
+            "verdict": result.verdict,
+            "counts": result.counts,
+            "errors": result.errors,
+            "warnings": result.warnings,
+        }
+
+
+def verify(run_dir: Path, workers: int = 1) -> CheckResult:
+    gate = BaseDimensionsEIMGate(run_dir)
+    run_gates(run_dir, [gate], workers)
+    return gate.finalize()
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--run_dir", required=True, help="run_dir to verify (scanner / modeling_tool / etc.)")
     ap.add_argument("--output", default="", help="Optional output JSON report path")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
     args = ap.parse_args()
 
     run_dir = Path(args.run_dir).expanduser().resolve()
@@ -283,30 +341,18 @@ def main() -> int:
         print(f"ERROR: run_dir not found: {run_dir}", file=sys.stderr)
         return 1
 
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+
     try:
-        manifest_path = run_dir / "run_manifest.json"
-        manifest = _read_json(manifest_path) if manifest_path.exists() else {}
-        result = verify(run_dir)
+        report, code = gate_report(
+            run_dir, BaseDimensionsEIMGate(run_dir), args.workers, use_cache=(False if args.no_report_cache else None), refresh_cache=args.refresh_report_cache
+        )
     except Exception as e:
         print(f"ERROR: verifier crashed: {e}", file=sys.stderr)
         return 1
 
-    report: Dict[str, Any] = {
-        "tool": "verify_base_dimensions_eim_v0",
-        "generated_at_utc": _ts_utc(),
-        "run_dir": str(run_dir),
-        "manifest": {
-            "run_id": manifest.get("run_id"),
-            "run_kind": manifest.get("run_kind"),
-            "mode": manifest.get("mode"),
-            "truth_profile": manifest.get("truth_profile"),
-        },
-        "verdict": result.verdict,
-        "counts": result.counts,
-        "errors": result.errors,
-        "warnings": result.warnings,
-    }
-
     if out_path is not None:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -314,12 +360,9 @@ def main() -> int:
     # Machine output to stdout
     print(json.dumps(report, ensure_ascii=False))
 
-    if result.verdict == "FAIL":
-        return 2
-    if result.verdict == "NOT_MEASURABLE":
+    if report["verdict"] == "NOT_MEASURABLE":
         print("WARNING: verdict=NOT_MEASURABLE (evidence is valid but degraded samples exist)", file=sys.stderr)
-        return 0
-    return 0
+    return code
 
 
 if __name__ == "__main__":
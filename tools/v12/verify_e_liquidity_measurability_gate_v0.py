@@ -14,30 +14,19 @@ from __future__ import annotations
 
 import argparse
 import json
+import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from evidence_io_v0 import evidence_exists
+from gate_engine_v0 import Gate, gate_report, run_gates
 
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
 def _safe_float(x: Any) -> float | None:
     if x is None:
         return None
@@ -54,89 +43,130 @@ def _safe_float(x: Any) -> float | None:
     return None
 
 
+def _bid_ask_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[int, ...]:
+    N = 0
+    ok = 0
+    bad_bid = 0
+    bad_ask = 0
+    missing_bid = 0
+    missing_ask = 0
+    for _ln, rec in rows:
+        N += 1
+        bid = rec.get("bid_px_1")
+        ask = rec.get("ask_px_1")
+        if bid is None:
+            missing_bid += 1
+        if ask is None:
+            missing_ask += 1
+        bid_f = _safe_float(bid)
+        ask_f = _safe_float(ask)
+        if bid_f is None or bid_f <= 0:
+            bad_bid += 1
+            continue
+        if ask_f is None or ask_f <= 0:
+            bad_ask += 1
+            continue
+        ok += 1
+    return N, ok, bad_bid, bad_ask, missing_bid, missing_ask
+
+
+class ELiquidityGate(Gate):
+    """Bid/ask coverage as a gate_engine_v0 gate (market_snapshot: bid_px_1 / ask_px_1)."""
+
+    tool = "verify_e_liquidity_measurability_gate_v0"
+    inputs = ("market_snapshot.jsonl",)
+
+    def __init__(self, dataset_dir: Path, min_ticks: int = 1000, coverage_threshold: float = 0.95) -> None:
+        super().__init__()
+        self.dataset_dir = dataset_dir
+        self.min_ticks = int(min_ticks)
+        self.coverage_threshold = float(coverage_threshold)
+        self._totals = [0] * 6
+        self._error: Optional[Exception] = None
+        if evidence_exists(dataset_dir / "market_snapshot.jsonl"):
+            self.files = ("market_snapshot.jsonl",)
+
+    def params(self) -> Dict[str, Any]:
+        return {"min_ticks": self.min_ticks, "coverage_threshold": self.coverage_threshold}
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        return _bid_ask_slice
+
+    def update(self, name: str, part: Tuple[int, ...]) -> None:
+        self._totals = [a + b for a, b in zip(self._totals, part)]
+
+    def fail(self, name: str, exc: Exception) -> None:
+        self._error = exc
+
+    def finalize(self) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+        if not self.files:
+            return "FAIL", ["missing_required_file:market_snapshot.jsonl"], [], {}
+        if self._error is not None:
+            return "FAIL", [f"market_snapshot_jsonl_invalid:{self._error}"], [], {}
+
+        N, ok, bad_bid, bad_ask, missing_bid, missing_ask = self._totals
+        if N < self.min_ticks:
+            return "FAIL", [f"insufficient_ticks:N={N} < min_ticks={self.min_ticks}"], [], {"N": N, "eligible_tick_count": ok}
+
+        coverage = ok / max(1, N)
+        stats = {
+            "N": N,
+            "eligible_tick_count": ok,
+            "coverage": coverage,
+            "missing_bid_count": missing_bid,
+            "missing_ask_count": missing_ask,
+            "bad_bid_count": bad_bid,
+            "bad_ask_count": bad_ask,
+        }
+        verdict = "PASS" if coverage >= self.coverage_threshold else "NOT_MEASURABLE"
+        return verdict, [], [], stats
+
+    def report(self, result: Tuple[str, List[str], List[str], Dict[str, Any]]) -> Dict[str, Any]:
+        verdict, errors, _warnings, stats = result
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "dataset_dir": str(self.dataset_dir),
+            "market_snapshot_jsonl": str(self.dataset_dir / "market_snapshot.jsonl"),
+            "min_ticks": self.min_ticks,
+            "coverage_threshold": self.coverage_threshold,
+            "stats": stats,
+            "verdict": verdict,
+            "errors": errors,
+        }
+
+
+def verify(
+    dataset_dir: Path, min_ticks: int = 1000, coverage_threshold: float = 0.95, workers: int = 1
+) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+    gate = ELiquidityGate(dataset_dir, min_ticks, coverage_threshold)
+    run_gates(dataset_dir, [gate], workers)
+    return gate.finalize()
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--dataset_dir", required=True)
     ap.add_argument("--min_ticks", type=int, default=1000)
     ap.add_argument("--coverage_threshold", type=float, default=0.95)
     ap.add_argument("--output_json", default="")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
     args = ap.parse_args()
 
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+
     dataset_dir = Path(args.dataset_dir).expanduser().resolve()
-    p = dataset_dir / "market_snapshot.jsonl"
-    report: Dict[str, Any] = {
-        "tool": "verify_e_liquidity_measurability_gate_v0",
-        "generated_at_utc": _ts_utc(),
-        "dataset_dir": str(dataset_dir),
-        "market_snapshot_jsonl": str(p),
-        "min_ticks": int(args.min_ticks),
-        "coverage_threshold": float(args.coverage_threshold),
-        "stats": {},
-        "verdict": "FAIL",
-        "errors": [],
-    }
-
-    if not p.exists():
-        report["errors"].append("missing_required_file:market_snapshot.jsonl")
-        if args.output_json:
-            Path(args.output_json).expanduser().resolve().write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
-        print(json.dumps(report, ensure_ascii=False))
-        return 2
+    gate = ELiquidityGate(dataset_dir, args.min_ticks, args.coverage_threshold)
+    report, code = gate_report(dataset_dir, gate, args.workers, use_cache=(False if args.no_report_cache else None), refresh_cache=args.refresh_report_cache)
 
-    N = 0
-    ok = 0
-    bad_bid = 0
-    bad_ask = 0
-    missing_bid = 0
-    missing_ask = 0
-    try:
-        for _ln, rec in _iter_jsonl(p):
-            N += 1
-            bid = rec.get("bid_px_1")
-            ask = rec.get("ask_px_1")
-            if bid is None:
-                missing_bid += 1
-            if ask is None:
-                missing_ask += 1
-            bid_f = _safe_float(bid)
-            ask_f = _safe_float(ask)
-            if bid_f is None or bid_f <= 0:
-                bad_bid += 1
-                continue
-            if ask_f is None or ask_f <= 0:
-                bad_ask += 1
-                continue
-            ok += 1
-    except Exception as e:
-        report["errors"].append(f"market_snapshot_jsonl_invalid:{e}")
-        print(json.dumps(report, ensure_ascii=False))
-        return 2
-
-    if N < int(args.min_ticks):
-        report["errors"].append(f"insufficient_ticks:N={N} < min_ticks={int(args.min_ticks)}")
-        report["stats"] = {"N": N, "eligible_tick_count": ok}
-        print(json.dumps(report, ensure_ascii=False))
-        return 2
-
-    coverage = ok / max(1, N)
-    report["stats"] = {
-        "N": N,
-        "eligible_tick_count": ok,
-        "coverage": coverage,
-        "missing_bid_count": missing_bid,
-        "missing_ask_count": missing_ask,
-        "bad_bid_count": bad_bid,
-        "bad_ask_count": bad_ask,
-    }
-
-    if coverage >= float(args.coverage_threshold):
-        report["verdict"] = "PASS"
-        code = 0
-    else:
-        report["verdict"] = "NOT_MEASURABLE"
-        code = 0
-
-    if args.output_json:
+    # FAIL reports are written to --output_json only for a missing file (as before the gate refactor)
+    if args.output_json and (report["verdict"] != "FAIL" or not gate.files):
         out = Path(args.output_json).expanduser().resolve()
         out.parent.mkdir(parents=True, exist_ok=True)
         out.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
@@ -147,4 +177,3 @@ def main() -> int:
 
 if __name__ == "__main__":
     raise SystemExit(main())
-
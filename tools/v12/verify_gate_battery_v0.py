@@ -0,0 +1,180 @@
+#!/usr/bin/env python3
+"""
+V12 gate battery: several run_dir verifiers in one pass over the evidence (stdlib only).
+
+Runs any of
+  scanner_e_schema     verify_scanner_e_schema_v0
+  tick_loop            verify_tick_loop_v0
+  base_dimensions_eim  verify_base_dimensions_eim_v0
+  world_structure      verify_world_structure_gate_v0
+  e_liquidity          verify_e_liquidity_measurability_gate_v0
+over one run_dir through gate_engine_v0: each evidence file (market_snapshot.jsonl
+above all) is parsed once and fed to every selected gate, instead of once per
+verifier (market_snapshot.jsonl was read six times by the five tools).
+
+Each gate produces exactly the report its standalone tool prints (same verdict,
+errors, warnings, stats). stdout: one report JSON line per gate, in the order
+above, then a summary line {"tool": "verify_gate_battery_v0", ..., "gates"}.
+With --output_dir every report is also written to <output_dir>/<tool>.json.
+Gates go through the gate_engine_v0 report cache: a gate whose inputs are
+unchanged since an earlier run (same tool code and parameters) returns its
+stored report without reading the evidence ("cached": true in the summary);
+--no_report_cache bypasses it, --refresh_report_cache re-verifies and overwrites.
+With --resume, tick_loop and scanner_e_schema continue from their checkpoints
+and parse only the evidence appended since (see gate_engine_v0).
+
+Exit codes (frozen):
+  - 0: every gate exits 0 (PASS or NOT_MEASURABLE; WARNING lines on stderr)
+  - 2: no gate crashed and at least one FAILed
+  - 1: ERROR (invalid usage, or a gate crashed where its standalone tool exits 1)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List
+
+from gate_engine_v0 import Gate, run_gate_reports
+from verify_base_dimensions_eim_v0 import BaseDimensionsEIMGate
+from verify_e_liquidity_measurability_gate_v0 import ELiquidityGate
+from verify_scanner_e_schema_v0 import ScannerESchemaGate
+from verify_tick_loop_v0 import TickLoopGate
+from verify_world_structure_gate_v0 import WorldStructureGate
+
+
+GATE_CLASSES = {
+    "scanner_e_schema": ScannerESchemaGate,
+    "tick_loop": TickLoopGate,
+    "base_dimensions_eim": BaseDimensionsEIMGate,
+    "world_structure": WorldStructureGate,
+    "e_liquidity": ELiquidityGate,
+}
+GATE_NAMES = list(GATE_CLASSES)
+
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _build_gate(name: str, run_dir: Path, args: argparse.Namespace, k_windows: List[int]) -> Gate:
+    if name == "scanner_e_schema":
+        return ScannerESchemaGate(run_dir)
+    if name == "tick_loop":
+        return TickLoopGate(run_dir, args.min_ticks, args.max_backward_ms)
+    if name == "base_dimensions_eim":
+        return BaseDimensionsEIMGate(run_dir)
+    if name == "world_structure":
+        return WorldStructureGate(run_dir / "market_snapshot.jsonl", k_windows, args.p99_threshold, args.min_samples)
+    return ELiquidityGate(run_dir, args.liquidity_min_ticks, args.coverage_threshold)
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--run_dir", required=True, help="run_dir to verify")
+    ap.add_argument("--gates", default=",".join(GATE_NAMES), help=f"Comma-separated subset of: {','.join(GATE_NAMES)}")
+    ap.add_argument("--output_dir", default="", help="Optional dir for one <tool>.json report per gate")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore cached reports; verify and overwrite them")
+    ap.add_argument(
+        "--resume", action="store_true", help="Resumable gates verify only evidence appended since their checkpoint"
+    )
+    ap.add_argument("--min_ticks", type=int, default=60, help="tick_loop: minimum tick count required for PASS")
+    ap.add_argument("--max_backward_ms", type=int, default=0, help="tick_loop: allowed backward time drift (ms)")
+    ap.add_argument("--k_windows", default="1,100,500", help="world_structure: comma-separated k windows")
+    ap.add_argument("--p99_threshold", type=float, default=0.001, help="world_structure: primary-k p99 threshold")
+    ap.add_argument("--min_samples", type=int, default=1000, help="world_structure: minimum primary-k samples")
+    ap.add_argument("--liquidity_min_ticks", type=int, default=1000, help="e_liquidity: minimum tick count (N)")
+    ap.add_argument("--coverage_threshold", type=float, default=0.95, help="e_liquidity: bid/ask coverage for PASS")
+    args = ap.parse_args()
+
+    run_dir = Path(args.run_dir).expanduser().resolve()
+    out_dir = Path(args.output_dir).expanduser().resolve() if args.output_dir else None
+
+    if not run_dir.exists():
+        print(f"ERROR: run_dir not found: {run_dir}", file=sys.stderr)
+        return 1
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+    names = [x.strip() for x in args.gates.split(",") if x.strip()]
+    unknown = [x for x in names if x not in GATE_NAMES]
+    if not names or unknown:
+        print(f"ERROR: --gates must be a non-empty subset of {GATE_NAMES}, got {args.gates!r}", file=sys.stderr)
+        return 1
+    names = [x for x in GATE_NAMES if x in names]
+    try:
+        k_windows = [int(x.strip()) for x in args.k_windows.split(",") if x.strip()]
+    except ValueError as e:
+        print(f"ERROR: invalid --k_windows: {e}", file=sys.stderr)
+        return 1
+    if "world_structure" in names and not k_windows:
+        print("ERROR: k_windows is empty", file=sys.stderr)
+        return 1
+
+    # a gate whose standalone tool would crash (exit 1) is reported as ERROR; the others still run
+    built: Dict[str, Any] = {}
+    for name in names:
+        try:
+            built[name] = _build_gate(name, run_dir, args, k_windows)
+        except Exception as e:
+            built[name] = e
+    try:
+        runs = run_gate_reports(
+            run_dir,
+            [g for g in built.values() if isinstance(g, Gate)],
+            args.workers,
+            use_cache=(False if args.no_report_cache else None),
+            refresh_cache=args.refresh_report_cache,
+            resume=args.resume,
+        )
+    except Exception as e:
+        print(f"ERROR: gate battery crashed: {e}", file=sys.stderr)
+        return 1
+    by_gate = {id(run.gate): run for run in runs}
+
+    summary: Dict[str, Any] = {}
+    for name, gate in built.items():
+        tool = GATE_CLASSES[name].tool
+        run = by_gate.get(id(gate))
+        if run is None or run.report is None:
+            print(f"ERROR: {tool}: verifier crashed: {gate if run is None else run.error}", file=sys.stderr)
+            summary[tool] = {"verdict": "ERROR", "exit_code": 1}
+            continue
+        report = run.report
+        verdict = report["verdict"]
+        summary[gate.tool] = {"verdict": verdict, "exit_code": run.exit_code, "cached": run.cached}
+        if out_dir is not None:
+            out_dir.mkdir(parents=True, exist_ok=True)
+            (out_dir / f"{gate.tool}.json").write_text(
+                json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8"
+            )
+        print(json.dumps(report, ensure_ascii=False))
+        if verdict == "NOT_MEASURABLE" and gate.not_measurable_warning:
+            print(f"WARNING: {gate.tool}: verdict=NOT_MEASURABLE ({gate.not_measurable_warning})", file=sys.stderr)
+
+    codes = [g["exit_code"] for g in summary.values()]
+    code = 1 if 1 in codes else (2 if 2 in codes else 0)
+    print(
+        json.dumps(
+            {
+                "tool": "verify_gate_battery_v0",
+                "generated_at_utc": _ts_utc(),
+                "run_dir": str(run_dir),
+                "exit_code": code,
+                "gates": summary,
+            },
+            ensure_ascii=False,
+        )
+    )
+    return code
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -14,6 +14,17 @@ Exit codes (frozen):
   - 0: PASS or NOT_MEASURABLE (prints WARNING when NOT_MEASURABLE)
   - 2: FAIL (evidence missing / strict-jsonl broken / schema violation)
   - 1: ERROR (tool crash / invalid usage)
+
+Runs as a gate_engine_v0 gate (report cache: --no_report_cache /
+--refresh_report_cache). --resume verifies only the records appended since
+the last checkpoint (offset + prefix sha256 + counters and errors so far).
+
+Errors and warnings are collected per code in error_sink_v0.ErrorSink (first
+and last exemplars per code, totals in stats), so the whole file is checked
+with bounded memory; errors_truncated / warnings_truncated say whether any
+exemplar was omitted. A strict-JSONL break after more than
+ABORT_AFTER_ERRORS schema errors is still FAIL (too_many_errors_abort): the
+pre-sink verifier stopped reading there and never reached the broken line.
 """
 
 from __future__ import annotations
@@ -25,26 +36,18 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from error_sink_v0 import ErrorSink
+from evidence_io_v0 import evidence_exists
+from gate_engine_v0 import Gate, gate_report
 
-def _ts_utc() -> str:
-    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
+ABORT_AFTER_ERRORS = 2000
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
 def _is_num(x: Any) -> bool:
@@ -79,22 +82,31 @@ def _approx_equal(a: float, b: float, tol: float = 1e-9) -> bool:
     return abs(a - b) <= tol
 
 
-def _verify_local_reachability_schema(path: Path) -> CheckResult:
-    errors: List[str] = []
-    warnings: List[str] = []
-    stats: Dict[str, Any] = {"records": 0}
+@dataclass
+class _Slice:
+    records: int
+    errors: ErrorSink
+    warnings: ErrorSink
+    min_fr: Optional[float]
+    max_fr: Optional[float]
+
+
+def _check_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> _Slice:
+    errors = ErrorSink()
+    warnings = ErrorSink()
+    records = 0
 
     # For basic sanity stats
     min_fr = None
     max_fr = None
 
-    for line_no, rec in _iter_jsonl(path):
-        stats["records"] += 1
+    for line_no, rec in rows:
+        records += 1
 
         # required top-level fields
         for k in ("ts_utc", "snapshot_id", "account_id_hash", "tick_index", "state_id", "world_contract", "neighborhood", "graph_optional", "death_label_ex_post", "reason_codes"):
             if k not in rec:
-                errors.append(f"missing_required_field:{k} (line={line_no})")
+                errors.add(f"missing_required_field:{k}", f"missing_required_field:{k} (line={line_no})", line_no)
 
         ts = _get(rec, "ts_utc")
         sid = _get(rec, "snapshot_id")
@@ -108,101 +120,183 @@ def _verify_local_reachability_schema(path: Path) -> CheckResult:
         rc = _get(rec, "reason_codes")
 
         if ts is not None and not _is_str(ts):
-            errors.append(f"invalid_type:ts_utc (line={line_no})")
+            errors.add("invalid_type:ts_utc", f"invalid_type:ts_utc (line={line_no})", line_no)
         if not (_is_str(sid) and sid):
-            errors.append(f"invalid_value:snapshot_id (line={line_no})")
+            errors.add("invalid_value:snapshot_id", f"invalid_value:snapshot_id (line={line_no})", line_no)
         if not (_is_str(aid) and aid):
-            errors.append(f"invalid_value:account_id_hash (line={line_no})")
+            errors.add("invalid_value:account_id_hash", f"invalid_value:account_id_hash (line={line_no})", line_no)
         if not _is_int(ti):
-            errors.append(f"invalid_type:tick_index (line={line_no})")
+            errors.add("invalid_type:tick_index", f"invalid_type:tick_index (line={line_no})", line_no)
         if not (_is_str(stid) and stid):
-            errors.append(f"invalid_value:state_id (line={line_no})")
+            errors.add("invalid_value:state_id", f"invalid_value:state_id (line={line_no})", line_no)
 
         # world_contract
         if not isinstance(wc, dict):
-            errors.append(f"invalid_type:world_contract (line={line_no})")
+            errors.add("invalid_type:world_contract", f"invalid_type:world_contract (line={line_no})", line_no)
         else:
             mf = wc.get("M_frozen")
             if mf is not True:
-                errors.append(f"world_contract_not_frozen (line={line_no})")
+                errors.add("world_contract_not_frozen", f"world_contract_not_frozen (line={line_no})", line_no)
             we = wc.get("world_epoch_id")
             if we is not None and not _is_str(we):
-                errors.append(f"invalid_type:world_epoch_id (line={line_no})")
+                errors.add("invalid_type:world_epoch_id", f"invalid_type:world_epoch_id (line={line_no})", line_no)
 
         # neighborhood
         if not isinstance(nb, dict):
-            errors.append(f"invalid_type:neighborhood (line={line_no})")
+            errors.add("invalid_type:neighborhood", f"invalid_type:neighborhood (line={line_no})", line_no)
         else:
             cc = nb.get("candidate_count")
             fc = nb.get("feasible_count")
             fr = nb.get("feasible_ratio")
             if not (_is_int(cc) and cc >= 1):
-                errors.append(f"invalid_value:neighborhood.candidate_count (line={line_no})")
+                errors.add("invalid_value:neighborhood.candidate_count", f"invalid_value:neighborhood.candidate_count (line={line_no})", line_no)
             if not (_is_int(fc) and fc >= 0):
-                errors.append(f"invalid_value:neighborhood.feasible_count (line={line_no})")
+                errors.add("invalid_value:neighborhood.feasible_count", f"invalid_value:neighborhood.feasible_count (line={line_no})", line_no)
             if _is_int(cc) and _is_int(fc) and (fc > cc):
-                errors.append(f"inconsistent:feasible_count_gt_candidate_count (line={line_no})")
+                errors.add("inconsistent:feasible_count_gt_candidate_count", f"inconsistent:feasible_count_gt_candidate_count (line={line_no})", line_no)
             if not _is_num(fr):
-                errors.append(f"invalid_type:neighborhood.feasible_ratio (line={line_no})")
+                errors.add("invalid_type:neighborhood.feasible_ratio", f"invalid_type:neighborhood.feasible_ratio (line={line_no})", line_no)
             else:
                 frf = float(fr)
                 if frf < 0.0 - 1e-12 or frf > 1.0 + 1e-12:
-                    errors.append(f"invalid_range:neighborhood.feasible_ratio (line={line_no})")
+                    errors.add("invalid_range:neighborhood.feasible_ratio", f"invalid_range:neighborhood.feasible_ratio (line={line_no})", line_no)
                 if _is_int(cc) and _is_int(fc) and cc >= 1:
                     expected = fc / max(1, cc)
                     if not _approx_equal(frf, expected, tol=1e-9):
                         # allow tiny float drift but not semantic mismatch
-                        errors.append(f"inconsistent:feasible_ratio_mismatch (line={line_no})")
+                        errors.add("inconsistent:feasible_ratio_mismatch", f"inconsistent:feasible_ratio_mismatch (line={line_no})", line_no)
                 min_fr = frf if min_fr is None else min(min_fr, frf)
                 max_fr = frf if max_fr is None else max(max_fr, frf)
 
         # graph_optional
         if not isinstance(go, dict):
-            errors.append(f"invalid_type:graph_optional (line={line_no})")
+            errors.add("invalid_type:graph_optional", f"invalid_type:graph_optional (line={line_no})", line_no)
         else:
             enabled = go.get("enabled")
             if not isinstance(enabled, bool):
-                errors.append(f"invalid_type:graph_optional.enabled (line={line_no})")
+                errors.add("invalid_type:graph_optional.enabled", f"invalid_type:graph_optional.enabled (line={line_no})", line_no)
             if enabled is False:
                 for k in ("feasible_component_count", "largest_feasible_component_ratio", "edge_cut_rate"):
                     if go.get(k) is not None:
-                        errors.append(f"graph_optional_disabled_but_non_null:{k} (line={line_no})")
+                        errors.add(f"graph_optional_disabled_but_non_null:{k}", f"graph_optional_disabled_but_non_null:{k} (line={line_no})", line_no)
 
         # death_label_ex_post
         if not isinstance(dl, dict):
-            errors.append(f"invalid_type:death_label_ex_post (line={line_no})")
+            errors.add("invalid_type:death_label_ex_post", f"invalid_type:death_label_ex_post (line={line_no})", line_no)
         else:
             enabled = dl.get("enabled")
             if not isinstance(enabled, bool):
-                errors.append(f"invalid_type:death_label_ex_post.enabled (line={line_no})")
+                errors.add("invalid_type:death_label_ex_post.enabled", f"invalid_type:death_label_ex_post.enabled (line={line_no})", line_no)
             if enabled is False:
                 if dl.get("dead_at_or_before_tick") is not None:
-                    errors.append(f"death_label_disabled_but_non_null (line={line_no})")
+                    errors.add("death_label_disabled_but_non_null", f"death_label_disabled_but_non_null (line={line_no})", line_no)
 
         # reason_codes
         if rc is not None and not _is_list_of_str(rc):
-            errors.append(f"invalid_type:reason_codes (line={line_no})")
+            errors.add("invalid_type:reason_codes", f"invalid_type:reason_codes (line={line_no})", line_no)
 
         # soft sanity: state_id format
         if _is_str(sid) and _is_str(aid) and _is_int(ti) and _is_str(stid):
             expected_prefix = f"{sid}:{aid}:{ti}"
             if stid != expected_prefix:
-                warnings.append(f"state_id_unexpected_format (line={line_no})")
-
-        if len(errors) > 2000:
-            errors.append("too_many_errors_abort")
-            break
-
-    stats["feasible_ratio_min"] = min_fr
-    stats["feasible_ratio_max"] = max_fr
-
-    verdict = "PASS" if not errors else "FAIL"
-    return CheckResult(verdict=verdict, errors=errors, warnings=warnings, stats=stats)
+                warnings.add("state_id_unexpected_format", f"state_id_unexpected_format (line={line_no})", line_no)
+
+    return _Slice(records, errors, warnings, min_fr, max_fr)
+
+
+class LocalReachabilityGate(Gate):
+    """Schema + consistency checks as a gate_engine_v0 gate (local_reachability.jsonl, serial reader)."""
+
+    tool = "verify_local_reachability_v0"
+    inputs = ("local_reachability.jsonl",)
+    resumable = True
+
+    def __init__(self, run_dir: Path) -> None:
+        super().__init__()
+        self.run_dir = run_dir
+        self.errors = ErrorSink()
+        self.warnings = ErrorSink()
+        self.records = 0
+        self.min_fr: Optional[float] = None
+        self.max_fr: Optional[float] = None
+        self._error: Optional[Exception] = None
+        if evidence_exists(run_dir / "local_reachability.jsonl"):
+            self.files = ("local_reachability.jsonl",)
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        return _check_slice
+
+    def update(self, name: str, part: _Slice) -> None:
+        self.records += part.records
+        self.errors.merge(part.errors)
+        self.warnings.merge(part.warnings)
+        if part.min_fr is not None:
+            self.min_fr = part.min_fr if self.min_fr is None else min(self.min_fr, part.min_fr)
+            self.max_fr = part.max_fr if self.max_fr is None else max(self.max_fr, part.max_fr)
+
+    def fail(self, name: str, exc: Exception) -> None:
+        if self.errors.total > ABORT_AFTER_ERRORS:
+            self.errors.add("too_many_errors_abort", f"too_many_errors_abort (then {name} strict-jsonl failed: {exc})")
+            return
+        self._error = exc
+
+    def checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        return {
+            "errors": self.errors.to_state(),
+            "warnings": self.warnings.to_state(),
+            "records": self.records,
+            "min_fr": self.min_fr,
+            "max_fr": self.max_fr,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self.errors = ErrorSink.from_state(state["errors"])
+        self.warnings = ErrorSink.from_state(state["warnings"])
+        self.records = state["records"]
+        self.min_fr = state["min_fr"]
+        self.max_fr = state["max_fr"]
+
+    def finalize(self) -> CheckResult:
+        if self._error is not None:
+            raise self._error
+        stats: Dict[str, Any] = {
+            "records": self.records,
+            "feasible_ratio_min": self.min_fr,
+            "feasible_ratio_max": self.max_fr,
+        }
+        if self.errors:
+            stats.update(self.errors.summary())
+        if self.warnings:
+            stats["warning_total"] = self.warnings.total
+            stats["warnings_omitted"] = self.warnings.omitted
+        verdict = "PASS" if not self.errors else "FAIL"
+        return CheckResult(verdict=verdict, errors=self.errors.messages(), warnings=self.warnings.messages(), stats=stats)
+
+    def report(self, result: CheckResult) -> Dict[str, Any]:
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "run_dir": str(self.run_dir),
+            "local_reachability_jsonl": str(self.run_dir / "local_reachability.jsonl"),
+            "verdict": result.verdict,
+            "stats": result.stats,
+            "warnings": result.warnings,
+            "errors": result.errors,
+            "errors_truncated": result.stats.get("errors_omitted", 0) > 0,
+            "warnings_truncated": result.stats.get("warnings_omitted", 0) > 0,
+        }
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--run_dir", required=True)
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
+    ap.add_argument(
+        "--resume",
+        action="store_true",
+        help="Verify only what was appended since the last --resume checkpoint (fails closed if the prefix changed)",
+    )
     args = ap.parse_args()
 
     run_dir = Path(args.run_dir).expanduser().resolve()
@@ -211,33 +305,24 @@ def main() -> int:
         return 2
 
     p = run_dir / "local_reachability.jsonl"
-    if not p.exists():
+    if not evidence_exists(p):
         print(f"FAIL: missing required file: {p}", file=sys.stderr)
         return 2
 
     try:
-        res = _verify_local_reachability_schema(p)
+        report, code = gate_report(
+            run_dir,
+            LocalReachabilityGate(run_dir),
+            use_cache=(False if args.no_report_cache else None),
+            refresh_cache=args.refresh_report_cache,
+            resume=args.resume,
+        )
     except Exception as e:
         print(f"ERROR: {e}", file=sys.stderr)
         return 1
 
-    report = {
-        "tool": "verify_local_reachability_v0",
-        "generated_at_utc": _ts_utc(),
-        "run_dir": str(run_dir),
-        "local_reachability_jsonl": str(p),
-        "verdict": res.verdict,
-        "stats": res.stats,
-        "warnings": res.warnings[:200],
-        "errors": res.errors[:200],
-        "errors_truncated": len(res.errors) > 200,
-        "warnings_truncated": len(res.warnings) > 200,
-    }
     print(json.dumps(report, ensure_ascii=False))
-
-    if res.verdict == "PASS":
-        return 0
-    return 2
+    return code
 
 
 if __name__ == "__main__":
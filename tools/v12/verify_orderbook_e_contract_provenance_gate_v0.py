@@ -22,9 +22,12 @@ import argparse
 import json
 from dataclasses import dataclass
 from datetime import datetime, timezone
+from itertools import islice
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+from evidence_io_v0 import iter_evidence_lines
+
 
 @dataclass
 class GateResult:
@@ -88,25 +91,21 @@ def _scan_market_snapshot_orderbook_source(
     source_counts: Dict[str, int] = {}
 
     try:
-        with market_snapshot_path.open("r", encoding="utf-8") as f:
-            for _ in range(sample_lines):
-                line = f.readline()
-                if not line:
-                    break
-                notes["sampled"] += 1
-                try:
-                    obj = json.loads(line)
-                except Exception:
-                    errors.append("market_snapshot_invalid_jsonl")
-                    break
-
-                # Heuristic 1: explicit marker used by some builders
-                if "orderbook_source" in obj:
-                    notes["has_orderbook_source_field"] += 1
-                    src = str(obj.get("orderbook_source")).strip().lower()
-                    if not src:
-                        src = "empty"
-                    source_counts[src] = source_counts.get(src, 0) + 1
+        for line in islice(iter_evidence_lines(market_snapshot_path), max(0, sample_lines)):
+            notes["sampled"] += 1
+            try:
+                obj = json.loads(line)
+            except Exception:
+                errors.append("market_snapshot_invalid_jsonl")
+                break
+
+            # Heuristic 1: explicit marker used by some builders
+            if "orderbook_source" in obj:
+                notes["has_orderbook_source_field"] += 1
+                src = str(obj.get("orderbook_source")).strip().lower()
+                if not src:
+                    src = "empty"
+                source_counts[src] = source_counts.get(src, 0) + 1
     except FileNotFoundError:
         return None, ["market_snapshot_missing"], notes
     except Exception as e:
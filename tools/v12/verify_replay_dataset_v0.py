@@ -2,6 +2,17 @@
 """
 Verify Replay Dataset v0 (Research repo, stdlib only).
 
+Integrity (fused): the sha256 and record_count that dataset_manifest.json
+records for market_snapshot.jsonl are recomputed from the same read that
+feeds the schema / interval checks; any mismatch is a FAIL. An optional
+ts index (market_snapshot.ts_index.json) must match its files entry and
+belong to this market_snapshot.jsonl (sha256 / record_count / size).
+
+Per-line errors go through error_sink_v0.ErrorSink: "errors" keeps the first
+and last exemplars per error code (with an "omitted" marker in between) and
+stats["errors_by_code"] the totals, so a systematically broken file does not
+produce an O(file) report; the verdict still counts every error.
+
 Exit codes (frozen):
   - 0: PASS or NOT_MEASURABLE (prints WARNING when NOT_MEASURABLE)
   - 2: FAIL
@@ -11,12 +22,18 @@ Exit codes (frozen):
 from __future__ import annotations
 
 import argparse
+import hashlib
 import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Any, Dict, Iterable, List, Optional, Tuple
 
+from error_sink_v0 import ErrorSink
+from evidence_io_v0 import check_ts_tz, delta_ms, evidence_exists, map_jsonl_ranges, ts_epoch_us_list
+from id_set_v0 import IdSet
+from replay_dataset_io_v0 import TS_INDEX_NAME, load_ts_index
+
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
@@ -30,38 +47,31 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return obj
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
+_SNAPSHOT_REQUIRED_FIELDS = ("ts_utc", "inst_id", "snapshot_id", "source_endpoints", "quality")
 
 
-def _parse_iso_utc(ts: str) -> datetime:
-    s = ts.strip()
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-    return datetime.fromisoformat(s)
+def _snapshot_facts(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, List[str], Any, Any, Any, Optional[int], bool]]:
+    # runs per slice (possibly in a worker process): keep only what the replay checks read;
+    # ts_utc is parsed here too, so the merge loop only does integer arithmetic
+    out = []
+    for line_no, rec in rows:
+        missing = [k for k in _SNAPSHOT_REQUIRED_FIELDS if k not in rec]
+        out.append((line_no, missing, rec.get("snapshot_id"), rec.get("inst_id"), rec.get("ts_utc")))
+    epoch_us, aware = ts_epoch_us_list([f[4] for f in out])
+    return [(*f, us, a) for f, us, a in zip(out, epoch_us, aware)]
 
 
-def verify(dataset_dir: Path, min_ticks: int, max_jitter_ms: int) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
-    errors: List[str] = []
+def verify(
+    dataset_dir: Path, min_ticks: int, max_jitter_ms: int, workers: int = 1
+) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+    errors = ErrorSink()
     warnings: List[str] = []
     stats: Dict[str, Any] = {}
 
     required = ["dataset_manifest.json", "market_snapshot.jsonl"]
-    missing = [x for x in required if not (dataset_dir / x).exists()]
+    missing = [x for x in required if not evidence_exists(dataset_dir / x)]
     if missing:
-        errors.extend([f"missing required file: {x}" for x in missing])
-        return "FAIL", errors, warnings, stats
+        return "FAIL", [f"missing required file: {x}" for x in missing], warnings, stats
 
     try:
         manifest = _read_json(dataset_dir / "dataset_manifest.json")
@@ -69,78 +79,92 @@ def verify(dataset_dir: Path, min_ticks: int, max_jitter_ms: int) -> Tuple[str,
         return "FAIL", [f"dataset_manifest.json invalid: {e}"], warnings, stats
 
     if manifest.get("dataset_kind") != "replay_snapshot_v0":
-        errors.append(f"dataset_kind must be 'replay_snapshot_v0', got {manifest.get('dataset_kind')!r}")
+        errors.add("manifest", f"dataset_kind must be 'replay_snapshot_v0', got {manifest.get('dataset_kind')!r}")
 
     wc = manifest.get("world_contract")
     if not isinstance(wc, dict):
-        errors.append("world_contract must be an object")
+        errors.add("manifest", "world_contract must be an object")
         wc = {}
 
     if wc.get("truth_profile") != "replay_truth":
-        errors.append(f"world_contract.truth_profile must be 'replay_truth', got {wc.get('truth_profile')!r}")
+        errors.add("manifest", f"world_contract.truth_profile must be 'replay_truth', got {wc.get('truth_profile')!r}")
 
     inst_id_expected = wc.get("inst_id")
     if not isinstance(inst_id_expected, str) or not inst_id_expected:
-        errors.append("world_contract.inst_id must be a non-empty string")
+        errors.add("manifest", "world_contract.inst_id must be a non-empty string")
         inst_id_expected = None
 
+    files = manifest.get("files")
+    ms_entry = files.get("market_snapshot.jsonl") if isinstance(files, dict) else None
+    if not isinstance(ms_entry, dict):
+        errors.add("manifest", "files['market_snapshot.jsonl'] must be an object (path, sha256, record_count)")
+        ms_entry = {}
+    sha256_expected = ms_entry.get("sha256")
+    if not isinstance(sha256_expected, str) or not sha256_expected:
+        errors.add("manifest", "files['market_snapshot.jsonl'].sha256 must be a non-empty string")
+        sha256_expected = None
+    record_count_expected = ms_entry.get("record_count")
+    if not isinstance(record_count_expected, int) or isinstance(record_count_expected, bool):
+        errors.add("manifest", "files['market_snapshot.jsonl'].record_count must be an int")
+        record_count_expected = None
+
     tick_ms_expected = wc.get("tick_interval_ms")
     if not isinstance(tick_ms_expected, int) or tick_ms_expected <= 0:
         warnings.append("world_contract.tick_interval_ms missing/invalid; verifier will not enforce interval strictly")
         tick_ms_expected = None
 
     # Snapshot checks (minimal E fields + replay requirements)
-    snapshot_ids = set()
+    snapshot_ids = IdSet()
     tick = 0
-    prev_ts: Optional[datetime] = None
+    prev_us: Optional[int] = None
+    prev_aware = True
     inst_id_bad = 0
     missing_fields = 0
 
     deltas_ms: List[int] = []
     interval_violations = 0
 
+    h = hashlib.sha256()
+    streamed = False
     try:
-        for line_no, rec in _iter_jsonl(dataset_dir / "market_snapshot.jsonl"):
-            tick += 1
-            # minimal required fields from canonical E schema
-            for k in ["ts_utc", "inst_id", "snapshot_id", "source_endpoints", "quality"]:
-                if k not in rec:
+        for facts in map_jsonl_ranges(dataset_dir / "market_snapshot.jsonl", _snapshot_facts, workers, h=h):
+            for line_no, missing, sid, inst, ts, cur_us, cur_aware in facts:
+                tick += 1
+                # minimal required fields from canonical E schema
+                for k in missing:
                     missing_fields += 1
-                    errors.append(f"market_snapshot missing field {k} at line {line_no}")
-
-            sid = rec.get("snapshot_id")
-            if isinstance(sid, str) and sid:
-                if sid in snapshot_ids:
-                    errors.append(f"duplicate snapshot_id at line {line_no}: {sid}")
-                snapshot_ids.add(sid)
-            else:
-                errors.append(f"snapshot_id missing/invalid at line {line_no}")
-
-            inst = rec.get("inst_id")
-            if inst_id_expected is not None and inst != inst_id_expected:
-                inst_id_bad += 1
-
-            ts = rec.get("ts_utc")
-            if not isinstance(ts, str) or not ts:
-                errors.append(f"ts_utc missing/invalid at line {line_no}")
-                continue
-            try:
-                cur_ts = _parse_iso_utc(ts)
-            except Exception:
-                errors.append(f"ts_utc not isoformat at line {line_no}: {ts!r}")
-                continue
-
-            if prev_ts is not None:
-                delta_ms = int((cur_ts - prev_ts).total_seconds() * 1000)
-                deltas_ms.append(delta_ms)
-                if delta_ms < 0:
-                    errors.append(f"ts_utc went backward by {delta_ms}ms at line {line_no}")
-                if tick_ms_expected is not None:
-                    if abs(delta_ms - tick_ms_expected) > max_jitter_ms:
-                        interval_violations += 1
-            prev_ts = cur_ts
+                    errors.add(f"missing_field:{k}", f"market_snapshot missing field {k} at line {line_no}", line_no)
+
+                if isinstance(sid, str) and sid:
+                    if not snapshot_ids.add(sid):
+                        errors.add("duplicate_snapshot_id", f"duplicate snapshot_id at line {line_no}: {sid}", line_no)
+                else:
+                    errors.add("invalid_snapshot_id", f"snapshot_id missing/invalid at line {line_no}", line_no)
+
+                if inst_id_expected is not None and inst != inst_id_expected:
+                    inst_id_bad += 1
+
+                if not isinstance(ts, str) or not ts:
+                    errors.add("invalid_ts_utc", f"ts_utc missing/invalid at line {line_no}", line_no)
+                    continue
+                if cur_us is None:
+                    errors.add("unparseable_ts_utc", f"ts_utc not isoformat at line {line_no}: {ts!r}", line_no)
+                    continue
+
+                if prev_us is not None:
+                    check_ts_tz(cur_aware, prev_aware)
+                    d_ms = delta_ms(cur_us, prev_us)
+                    deltas_ms.append(d_ms)
+                    if d_ms < 0:
+                        errors.add("ts_backward", f"ts_utc went backward by {d_ms}ms at line {line_no}", line_no)
+                    if tick_ms_expected is not None:
+                        if abs(d_ms - tick_ms_expected) > max_jitter_ms:
+                            interval_violations += 1
+                prev_us = cur_us
+                prev_aware = cur_aware
+        streamed = True
     except Exception as e:
-        errors.append(f"market_snapshot.jsonl strict-jsonl failed: {e}")
+        errors.add("strict_jsonl", f"market_snapshot.jsonl strict-jsonl failed: {e}")
 
     stats["tick_count"] = tick
     stats["unique_snapshot_id_count"] = len(snapshot_ids)
@@ -150,11 +174,33 @@ def verify(dataset_dir: Path, min_ticks: int, max_jitter_ms: int) -> Tuple[str,
         stats["delta_ms_min"] = min(deltas_ms)
         stats["delta_ms_max"] = max(deltas_ms)
 
+    # Integrity vs dataset_manifest.json (only meaningful after a complete read)
+    if streamed:
+        sha256_actual = h.hexdigest()
+        stats["sha256"] = sha256_actual
+        if sha256_expected is not None and sha256_actual != sha256_expected:
+            errors.add("integrity", f"market_snapshot.jsonl sha256 mismatch: manifest {sha256_expected} != actual {sha256_actual}")
+        if record_count_expected is not None and tick != record_count_expected:
+            errors.add("integrity", f"market_snapshot.jsonl record_count mismatch: manifest {record_count_expected} != actual {tick}")
+
+    ix_entry = files.get(TS_INDEX_NAME) if isinstance(files, dict) else None
+    if ix_entry is not None or (dataset_dir / TS_INDEX_NAME).exists():
+        ix_path = dataset_dir / TS_INDEX_NAME
+        if not isinstance(ix_entry, dict) or not ix_path.exists():
+            errors.add("ts_index", f"{TS_INDEX_NAME} and its files entry must come together")
+        elif hashlib.sha256(ix_path.read_bytes()).hexdigest() != ix_entry.get("sha256"):
+            errors.add("ts_index", f"{TS_INDEX_NAME} sha256 mismatch vs dataset_manifest.json")
+        else:
+            try:
+                load_ts_index(dataset_dir, manifest)
+            except (ValueError, OSError) as e:
+                errors.add("ts_index", f"ts index invalid: {e}")
+
     if tick < min_ticks:
-        errors.append(f"tick_count < min_ticks: {tick} < {min_ticks}")
+        errors.add("min_ticks", f"tick_count < min_ticks: {tick} < {min_ticks}")
 
     if inst_id_bad > 0:
-        errors.append(f"inst_id mismatch for {inst_id_bad} record(s)")
+        errors.add("inst_id", f"inst_id mismatch for {inst_id_bad} record(s)")
 
     # Interval quality semantics:
     # - Tick interval stability is a QUALITY signal for replay datasets.
@@ -172,12 +218,13 @@ def verify(dataset_dir: Path, min_ticks: int, max_jitter_ms: int) -> Tuple[str,
             )
 
     if errors:
-        return "FAIL", errors, warnings, stats
+        stats.update(errors.summary())
+        return "FAIL", errors.messages(), warnings, stats
 
     if warnings:
-        return "NOT_MEASURABLE", errors, warnings, stats
+        return "NOT_MEASURABLE", [], warnings, stats
 
-    return "PASS", errors, warnings, stats
+    return "PASS", [], warnings, stats
 
 
 def main() -> int:
@@ -186,6 +233,9 @@ def main() -> int:
     ap.add_argument("--min_ticks", type=int, default=1000, help="Minimum ticks required")
     ap.add_argument("--max_jitter_ms", type=int, default=500, help="Allowed tick interval jitter (ms)")
     ap.add_argument("--output", default="", help="Optional report output path")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
     args = ap.parse_args()
 
     dataset_dir = Path(args.dataset_dir).expanduser().resolve()
@@ -195,7 +245,11 @@ def main() -> int:
         print(f"ERROR: dataset_dir not found: {dataset_dir}", file=sys.stderr)
         return 1
 
-    verdict, errors, warnings, stats = verify(dataset_dir, args.min_ticks, args.max_jitter_ms)
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+
+    verdict, errors, warnings, stats = verify(dataset_dir, args.min_ticks, args.max_jitter_ms, args.workers)
     report = {
         "tool": "verify_replay_dataset_v0",
         "generated_at_utc": _ts_utc(),
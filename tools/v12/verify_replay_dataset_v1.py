@@ -0,0 +1,410 @@
+#!/usr/bin/env python3
+"""
+Verify Replay Dataset v1 (chunked layout; Research repo, stdlib only).
+
+Same checks as verify_replay_dataset_v0 (minimal E fields, unique snapshot_id,
+single inst_id, monotonic ts_utc, tick interval quality), plus per-chunk
+integrity against dataset_manifest.json chunk_index (sha256, bytes,
+record_count, ts_first_utc / ts_last_utc).
+
+Chunks are checked independently (in N processes with --workers) and merged in
+tick order; cross-chunk checks (duplicate snapshot_id, ts at chunk boundaries)
+run in the parent. --chunks re-verifies a subset: boundaries against unselected
+neighbours use their chunk_index ts values, and the report says scope=partial.
+
+Errors go through error_sink_v0.ErrorSink under the same codes as
+verify_replay_dataset_v0 (line numbers are dataset-wide tick lines), so a
+systematically broken dataset yields a bounded report; per-chunk sinks merge
+in tick order.
+
+Exit codes (frozen):
+  - 0: PASS or NOT_MEASURABLE (prints WARNING when NOT_MEASURABLE)
+  - 2: FAIL
+  - 1: ERROR
+"""
+
+from __future__ import annotations
+
+import argparse
+import hashlib
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from functools import partial
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from error_sink_v0 import ErrorSink
+from evidence_io_v0 import check_ts_tz, delta_ms, resolve_workers, try_ts_epoch_us_tz
+from id_set_v0 import IdSet
+from replay_dataset_io_v1 import DATASET_KIND_V1, check_chunk_index, read_manifest
+
+
+_SNAPSHOT_REQUIRED_FIELDS = ("ts_utc", "inst_id", "snapshot_id", "source_endpoints", "quality")
+
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+@dataclass
+class _ChunkResult:
+    chunk: int
+    errors: ErrorSink = field(default_factory=ErrorSink)
+    ids: List[Optional[str]] = field(default_factory=list)  # per line, for cross-chunk duplicates
+    ticks: int = 0
+    first_us: Optional[int] = None  # epoch microseconds
+    first_aware: bool = True  # ts_utc carried a UTC offset
+    last_us: Optional[int] = None
+    last_aware: bool = True
+    deltas: int = 0
+    delta_min: Optional[int] = None
+    delta_max: Optional[int] = None
+    interval_violations: int = 0
+    inst_id_bad: int = 0
+
+
+def _check_chunk(
+    dataset_dir: str, inst_id_expected: Optional[str], tick_ms_expected: Optional[int], max_jitter_ms: int, entry: Dict[str, Any]
+) -> _ChunkResult:
+    """Worker: every per-chunk check; reads the chunk once."""
+    res = _ChunkResult(chunk=entry["chunk"])
+    rel = entry["path"]
+    try:
+        data = (Path(dataset_dir) / rel).read_bytes()
+    except OSError as e:
+        res.errors.add("missing_chunk", f"missing chunk file: {rel} ({e})")
+        return res
+
+    sha256 = hashlib.sha256(data).hexdigest()
+    if sha256 != entry["sha256"]:
+        res.errors.add("chunk_integrity", f"{rel} sha256 mismatch: chunk_index {entry['sha256']} != actual {sha256}")
+    if len(data) != entry["bytes"]:
+        res.errors.add("chunk_integrity", f"{rel} bytes mismatch: chunk_index {entry['bytes']} != actual {len(data)}")
+
+    try:
+        text = data.decode("utf-8")
+    except UnicodeDecodeError as e:
+        res.errors.add("strict_jsonl", f"{rel} strict-jsonl failed: not UTF-8: {e}")
+        return res
+    lines = text.split("\n")
+    if lines[-1] == "":
+        lines.pop()
+    else:
+        res.errors.add("strict_jsonl", f"{rel} must end with a newline")
+
+    seen = set()
+    prev_us: Optional[int] = None
+    prev_aware = True
+    first_raw: Optional[str] = None
+    last_raw: Optional[str] = None
+    for n, line in enumerate(lines, 1):
+        loc = f"{rel} line {n}"
+        line_no = entry["tick_start"] + n  # dataset-wide, as in the v0 file
+        if not line.strip():
+            res.errors.add("strict_jsonl", f"{rel} strict-jsonl failed: blank line at line {n} (v1 chunks carry one tick per line)", line_no)
+            break
+        try:
+            rec = json.loads(line)
+        except json.JSONDecodeError as e:
+            res.errors.add("strict_jsonl", f"{rel} strict-jsonl failed: Invalid JSONL at line {n}: {e}", line_no)
+            break
+        if not isinstance(rec, dict):
+            res.errors.add("strict_jsonl", f"{rel} strict-jsonl failed: JSONL record must be an object at line {n}", line_no)
+            break
+        res.ticks += 1
+
+        for k in _SNAPSHOT_REQUIRED_FIELDS:
+            if k not in rec:
+                res.errors.add(f"missing_field:{k}", f"market_snapshot missing field {k} at {loc}", line_no)
+
+        sid = rec.get("snapshot_id")
+        if isinstance(sid, str) and sid:
+            if sid in seen:
+                res.errors.add("duplicate_snapshot_id", f"duplicate snapshot_id at {loc}: {sid}", line_no)
+            seen.add(sid)
+            res.ids.append(sid)
+        else:
+            res.errors.add("invalid_snapshot_id", f"snapshot_id missing/invalid at {loc}", line_no)
+            res.ids.append(None)
+
+        if inst_id_expected is not None and rec.get("inst_id") != inst_id_expected:
+            res.inst_id_bad += 1
+
+        ts = rec.get("ts_utc")
+        if not isinstance(ts, str) or not ts:
+            res.errors.add("invalid_ts_utc", f"ts_utc missing/invalid at {loc}", line_no)
+            continue
+        if first_raw is None:
+            first_raw = ts
+        last_raw = ts
+        cur = try_ts_epoch_us_tz(ts)
+        if cur is None:
+            res.errors.add("unparseable_ts_utc", f"ts_utc not isoformat at {loc}: {ts!r}", line_no)
+            continue
+        cur_us, cur_aware = cur
+
+        if prev_us is not None:
+            try:
+                check_ts_tz(cur_aware, prev_aware)
+            except TypeError as e:
+                res.errors.add("strict_jsonl", f"{rel} strict-jsonl failed: {e} at line {n}", line_no)
+                break
+            d_ms = delta_ms(cur_us, prev_us)
+            _add_delta(res, d_ms, tick_ms_expected, max_jitter_ms)
+            if d_ms < 0:
+                res.errors.add("ts_backward", f"ts_utc went backward by {d_ms}ms at {loc}", line_no)
+        if res.first_us is None:
+            res.first_us, res.first_aware = cur_us, cur_aware
+        res.last_us, res.last_aware = cur_us, cur_aware
+        prev_us, prev_aware = cur_us, cur_aware
+
+    if res.ticks != entry["record_count"]:
+        res.errors.add("chunk_integrity", f"{rel} record_count mismatch: chunk_index {entry['record_count']} != actual {res.ticks}")
+    if first_raw != entry["ts_first_utc"] or last_raw != entry["ts_last_utc"]:
+        res.errors.add(
+            "chunk_integrity",
+            f"{rel} ts range mismatch: chunk_index [{entry['ts_first_utc']}, {entry['ts_last_utc']}] != actual [{first_raw}, {last_raw}]"
+        )
+    return res
+
+
+def _add_delta(res: _ChunkResult, d_ms: int, tick_ms_expected: Optional[int], max_jitter_ms: int) -> None:
+    res.deltas += 1
+    res.delta_min = d_ms if res.delta_min is None else min(res.delta_min, d_ms)
+    res.delta_max = d_ms if res.delta_max is None else max(res.delta_max, d_ms)
+    if tick_ms_expected is not None and abs(d_ms - tick_ms_expected) > max_jitter_ms:
+        res.interval_violations += 1
+
+
+def _index_ts_before(entries: List[Dict[str, Any]], k: int) -> Optional[Tuple[int, bool]]:
+    """Last parseable chunk_index ts_last_utc (epoch us, offset-aware) before chunk k (boundary anchor for an unverified neighbour)."""
+    for e in reversed(entries[:k]):
+        ts = try_ts_epoch_us_tz(e["ts_last_utc"])
+        if ts is not None:
+            return ts
+    return None
+
+
+def _parse_chunk_selection(spec: str, chunk_count: int) -> List[int]:
+    """'3', '0,5-7' -> sorted chunk numbers; ValueError when malformed or out of range."""
+    out = set()
+    for part in spec.split(","):
+        part = part.strip()
+        if not part:
+            continue
+        a, _, b = part.partition("-")
+        lo, hi = int(a), int(b) if b else int(a)
+        if lo < 0 or hi < lo or hi >= chunk_count:
+            raise ValueError(f"chunk selection {part!r} outside 0..{chunk_count - 1}")
+        out.update(range(lo, hi + 1))
+    if not out:
+        raise ValueError("empty chunk selection")
+    return sorted(out)
+
+
+def _map_chunks(fn: Any, entries: List[Dict[str, Any]], workers: int) -> Iterable[_ChunkResult]:
+    workers = min(resolve_workers(workers), len(entries))
+    if workers <= 1:
+        yield from map(fn, entries)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        yield from pool.map(fn, entries)
+
+
+def verify(
+    dataset_dir: Path, min_ticks: int, max_jitter_ms: int, workers: int = 1, chunks: str = ""
+) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+    errors = ErrorSink()
+    warnings: List[str] = []
+    stats: Dict[str, Any] = {}
+
+    if not (dataset_dir / "dataset_manifest.json").exists():
+        return "FAIL", ["missing required file: dataset_manifest.json"], warnings, stats
+
+    try:
+        manifest = read_manifest(dataset_dir)
+    except Exception as e:
+        return "FAIL", [f"dataset_manifest.json invalid: {e}"], warnings, stats
+
+    if manifest.get("dataset_kind") != DATASET_KIND_V1:
+        errors.add("manifest", f"dataset_kind must be {DATASET_KIND_V1!r}, got {manifest.get('dataset_kind')!r}")
+
+    wc = manifest.get("world_contract")
+    if not isinstance(wc, dict):
+        errors.add("manifest", "world_contract must be an object")
+        wc = {}
+
+    if wc.get("truth_profile") != "replay_truth":
+        errors.add("manifest", f"world_contract.truth_profile must be 'replay_truth', got {wc.get('truth_profile')!r}")
+
+    inst_id_expected = wc.get("inst_id")
+    if not isinstance(inst_id_expected, str) or not inst_id_expected:
+        errors.add("manifest", "world_contract.inst_id must be a non-empty string")
+        inst_id_expected = None
+
+    tick_ms_expected = wc.get("tick_interval_ms")
+    if not isinstance(tick_ms_expected, int) or tick_ms_expected <= 0:
+        warnings.append("world_contract.tick_interval_ms missing/invalid; verifier will not enforce interval strictly")
+        tick_ms_expected = None
+
+    entries, _chunk_ticks, problems = check_chunk_index(manifest)
+    if problems:
+        return "FAIL", errors.messages() + problems, warnings, stats
+
+    selected = list(range(len(entries)))
+    if chunks:
+        selected = _parse_chunk_selection(chunks, len(entries))
+    dataset_ticks = entries[-1]["tick_end"]
+    stats["chunk_count"] = len(entries)
+    stats["chunks_verified"] = len(selected)
+    stats["scope"] = "full" if len(selected) == len(entries) else "partial"
+
+    # Per-chunk checks (parallel), merged in tick order with the cross-chunk checks
+    snapshot_ids = IdSet()
+    merged = _ChunkResult(chunk=-1)
+    fn = partial(_check_chunk, str(dataset_dir), inst_id_expected, tick_ms_expected, max_jitter_ms)
+    carry: Optional[Tuple[int, bool]] = None  # last valid ts_utc (epoch us, offset-aware) up to the previous chunk
+    carry_chunk = -1
+    for res in _map_chunks(fn, [entries[k] for k in selected], workers):
+        e = entries[res.chunk]
+        errors.merge(res.errors)
+        merged.ticks += res.ticks
+        merged.inst_id_bad += res.inst_id_bad
+        merged.deltas += res.deltas
+        merged.interval_violations += res.interval_violations
+        for v in (res.delta_min, res.delta_max):
+            if v is not None:
+                merged.delta_min = v if merged.delta_min is None else min(merged.delta_min, v)
+                merged.delta_max = v if merged.delta_max is None else max(merged.delta_max, v)
+
+        chunk_ids = set()  # one chunk's worth
+        for n, sid in enumerate(res.ids, 1):
+            if sid is None or sid in chunk_ids:
+                continue  # in-chunk duplicates are reported by the worker
+            chunk_ids.add(sid)
+            if not snapshot_ids.add(sid):
+                errors.add(
+                    "duplicate_snapshot_id",
+                    f"duplicate snapshot_id across chunks at {e['path']} line {n}: {sid}",
+                    e["tick_start"] + n,
+                )
+
+        # boundary with the previous chunk: verified results, else chunk_index ts
+        if carry_chunk != res.chunk - 1:
+            carry = _index_ts_before(entries, res.chunk)
+        if carry is not None and res.first_us is not None:
+            try:
+                check_ts_tz(res.first_aware, carry[1])
+            except TypeError as exc:
+                errors.add(
+                    "strict_jsonl",
+                    f"{e['path']} strict-jsonl failed: {exc} at the start of the chunk (chunk boundary)",
+                    e["tick_start"] + 1,
+                )
+            else:
+                d_ms = delta_ms(res.first_us, carry[0])
+                _add_delta(merged, d_ms, tick_ms_expected, max_jitter_ms)
+                if d_ms < 0:
+                    errors.add(
+                        "ts_backward",
+                        f"ts_utc went backward by {d_ms}ms at the start of {e['path']} (chunk boundary)",
+                        e["tick_start"] + 1,
+                    )
+        if res.last_us is not None:
+            carry = (res.last_us, res.last_aware)
+        carry_chunk = res.chunk
+
+    stats["tick_count"] = merged.ticks
+    stats["dataset_tick_count"] = dataset_ticks
+    stats["unique_snapshot_id_count"] = len(snapshot_ids)
+    stats["inst_id_bad_count"] = merged.inst_id_bad
+    stats["interval_violation_count"] = merged.interval_violations
+    if merged.deltas:
+        stats["delta_ms_min"] = merged.delta_min
+        stats["delta_ms_max"] = merged.delta_max
+
+    if dataset_ticks < min_ticks:
+        errors.add("min_ticks", f"tick_count < min_ticks: {dataset_ticks} < {min_ticks}")
+
+    if merged.inst_id_bad > 0:
+        errors.add("inst_id", f"inst_id mismatch for {merged.inst_id_bad} record(s)")
+
+    # Interval quality semantics: same as verify_replay_dataset_v0 (jitter degrades to NOT_MEASURABLE).
+    if tick_ms_expected is not None and merged.deltas:
+        violation_ratio = merged.interval_violations / max(1, merged.deltas)
+        stats["interval_violation_ratio"] = round(violation_ratio, 6)
+        if merged.interval_violations > 0:
+            level = "unstable" if violation_ratio > 0.05 else "drift"
+            warnings.append(
+                f"tick interval {level}: violations={merged.interval_violations} ratio={violation_ratio:.3f} "
+                f"(expected {tick_ms_expected}ms ± {max_jitter_ms}ms)"
+            )
+
+    if errors:
+        stats.update(errors.summary())
+        return "FAIL", errors.messages(), warnings, stats
+
+    if warnings:
+        return "NOT_MEASURABLE", [], warnings, stats
+
+    return "PASS", [], warnings, stats
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--dataset_dir", required=True, help="Replay dataset v1 directory (contains dataset_manifest.json)")
+    ap.add_argument("--min_ticks", type=int, default=1000, help="Minimum ticks required")
+    ap.add_argument("--max_jitter_ms", type=int, default=500, help="Allowed tick interval jitter (ms)")
+    ap.add_argument("--output", default="", help="Optional report output path")
+    ap.add_argument("--workers", type=int, default=1, help="Verify chunks in N processes (1 = serial, 0 = all CPUs)")
+    ap.add_argument("--chunks", default="", help="Optional chunk subset to re-verify, e.g. '3' or '0,5-7' (default: all)")
+    args = ap.parse_args()
+
+    dataset_dir = Path(args.dataset_dir).expanduser().resolve()
+    out_path = Path(args.output).expanduser().resolve() if args.output else None
+
+    if not dataset_dir.exists():
+        print(f"ERROR: dataset_dir not found: {dataset_dir}", file=sys.stderr)
+        return 1
+
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+
+    try:
+        verdict, errors, warnings, stats = verify(dataset_dir, args.min_ticks, args.max_jitter_ms, args.workers, args.chunks)
+    except ValueError as e:
+        print(f"ERROR: {e}", file=sys.stderr)
+        return 1
+    report = {
+        "tool": "verify_replay_dataset_v1",
+        "generated_at_utc": _ts_utc(),
+        "dataset_dir": str(dataset_dir),
+        "verdict": verdict,
+        "min_ticks": args.min_ticks,
+        "max_jitter_ms": args.max_jitter_ms,
+        "chunks": args.chunks or "all",
+        "stats": stats,
+        "errors": errors,
+        "warnings": warnings,
+    }
+
+    if out_path is not None:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+
+    print(json.dumps(report, ensure_ascii=False))
+
+    if verdict == "FAIL":
+        return 2
+    if verdict == "NOT_MEASURABLE":
+        print("WARNING: verdict=NOT_MEASURABLE (dataset valid but degraded for baseline)", file=sys.stderr)
+        return 0
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
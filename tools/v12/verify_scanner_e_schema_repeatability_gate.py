@@ -8,6 +8,12 @@ Given a Quant artifacts root (default: runs_v12_modeling_tool) and a list of run
 
 This tool is read-only with respect to run_dir artifacts.
 
+The E-schema verifier runs in-process through its Python API (verify_report:
+the report + exit code its CLI would produce; a crash counts as exit 1), one
+run_dir per task, over --jobs worker processes; results keep run_ids order.
+Reports come from the gate_engine_v0 report cache while a run_dir is unchanged
+(--no_report_cache / --refresh_report_cache to bypass / re-verify).
+
 Exit codes:
   0: PASS (FAIL=0)
   2: FAIL (FAIL>0 or cannot load inputs)
@@ -20,11 +26,13 @@ import argparse
 import json
 import sys
 from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
 from typing import Any, Dict, List
 
-REPO_ROOT = Path(__file__).parent.parent.parent
-E_VERIFIER = REPO_ROOT / "tools" / "v12" / "verify_scanner_e_schema_v0.py"
+from evidence_io_v0 import resolve_workers
+from verify_scanner_e_schema_v0 import verify_report
 
 
 def _ts_utc() -> str:
@@ -35,12 +43,36 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _verify_run(runs_root: Path, cache: Dict[str, Any], rid: str) -> Dict[str, Any]:
+    run_dir = runs_root / rid
+    code = 1  # CLI semantics: missing run_dir / crash -> exit 1 without a report
+    verdict = "ERROR"
+    errs: List[str] = []
+    if run_dir.exists():
+        try:
+            rep, code = verify_report(run_dir.expanduser().resolve(), **cache)
+            verdict = rep.get("verdict", "ERROR")
+            errs = rep.get("errors", [])[:10]
+        except Exception:
+            code = 1
+    return {
+        "run_id": rid,
+        "run_dir": str(run_dir),
+        "exit_code": code,
+        "verdict": verdict,
+        "errors_head": errs,
+    }
+
+
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--runs_root", default="", help="Quant runs root (e.g. /.../Prometheus-Quant/runs_v12_modeling_tool)")
     ap.add_argument("--summary_json", default="", help="Optional seed_sweep_summary_*.json to read run_ids from")
     ap.add_argument("--run_ids", default="", help="Optional comma-separated run_ids (overrides summary_json)")
     ap.add_argument("--output", default="", help="Optional output json path")
+    ap.add_argument("--jobs", type=int, default=1, help="Verify N run_dirs concurrently in worker processes (1 = serial, 0 = all CPUs)")
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore cached reports; verify and overwrite them")
     args = ap.parse_args()
 
     runs_root = Path(args.runs_root).expanduser().resolve() if args.runs_root else None
@@ -70,41 +102,19 @@ def main() -> int:
         print(f"ERROR: runs_root not found: {runs_root}", file=sys.stderr)
         return 2
 
-    if not E_VERIFIER.exists():
-        print(f"ERROR: E verifier not found: {E_VERIFIER}", file=sys.stderr)
+    if args.jobs < 0:
+        print(f"ERROR: --jobs must be >= 0, got {args.jobs}", file=sys.stderr)
         return 2
 
-    import subprocess
-
-    results: List[Dict[str, Any]] = []
-    fail = 0
-
-    for rid in run_ids:
-        run_dir = runs_root / rid
-        cmd = [sys.executable, str(E_VERIFIER), "--run_dir", str(run_dir)]
-        p = subprocess.run(cmd, capture_output=True, text=True)
-        verdict = "ERROR"
-        errs = []
-        try:
-            if p.stdout.strip():
-                rep = json.loads(p.stdout.strip())
-                verdict = rep.get("verdict", "ERROR")
-                errs = rep.get("errors", [])[:10]
-        except Exception:
-            verdict = "ERROR"
-
-        if p.returncode != 0 or verdict == "FAIL":
-            fail += 1
-
-        results.append(
-            {
-                "run_id": rid,
-                "run_dir": str(run_dir),
-                "exit_code": p.returncode,
-                "verdict": verdict,
-                "errors_head": errs,
-            }
-        )
+    cache = {"use_cache": (False if args.no_report_cache else None), "refresh_cache": args.refresh_report_cache}
+    check = partial(_verify_run, runs_root, cache)
+    jobs = min(resolve_workers(args.jobs), len(run_ids))
+    if jobs <= 1:
+        results: List[Dict[str, Any]] = [check(rid) for rid in run_ids]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check, run_ids))
+    fail = sum(1 for r in results if r["exit_code"] != 0 or r["verdict"] == "FAIL")
 
     report = {
         "tool": "verify_scanner_e_schema_repeatability_gate",
@@ -19,6 +19,20 @@ Exit codes (frozen):
   - 0: PASS or NOT_MEASURABLE (prints WARNING when NOT_MEASURABLE)
   - 2: FAIL (evidence missing / strict-jsonl broken / schema violation)
   - 1: ERROR (tool crash / invalid usage)
+
+Python API (stable; import as a sibling module, no subprocess needed):
+  - verify(run_dir, workers=1) -> CheckResult
+  - verify_report(run_dir, workers=1, use_cache=None, refresh_cache=False, resume=False)
+    -> (report, exit_code): exactly what the CLI prints / returns for an
+    existing run_dir; raises where the CLI exits 1. Served from the
+    gate_engine_v0 report cache while the run_dir's inputs are unchanged;
+    resume=True continues from the last checkpoint.
+
+Incremental verification (--resume): the gate_engine_v0 checkpoint keeps each
+file's verified byte offset + prefix sha256 and the counters, endpoint set and
+errors so far; the next run parses only the appended records. A point with
+unreplayable source_endpoints is not checkpointed (endpoints logged later
+could still resolve them), so the report always equals a full pass.
 """
 
 from __future__ import annotations
@@ -29,7 +43,25 @@ import sys
 from dataclasses import dataclass
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from functools import partial
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple
+
+from evidence_io_v0 import evidence_exists
+from gate_engine_v0 import Gate, count_rows, gate_report, run_gates
+
+REQUIRED_FIELDS = ["ts_utc", "inst_id", "snapshot_id", "source_endpoints", "quality"]
+
+MARKET_FIELDS = [
+    "last_px",
+    "bid_px_1",
+    "ask_px_1",
+    "bid_sz_1",
+    "ask_sz_1",
+    "mark_px",
+    "index_px",
+    "funding_rate",
+    "next_funding_ts_ms",
+]
 
 
 def _ts_utc() -> str:
@@ -41,28 +73,6 @@ def _read_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
-def _count_jsonl_records(path: Path) -> int:
-    n = 0
-    for _line_no, _obj in _iter_jsonl(path):
-        n += 1
-    return n
-
-
 def _is_num(x: Any) -> bool:
     return isinstance(x, (int, float)) and not isinstance(x, bool)
 
@@ -82,27 +92,29 @@ def _is_int(x: Any) -> bool:
 def _check_required_files(run_dir: Path, required: List[str]) -> List[str]:
     missing = []
     for name in required:
-        if not (run_dir / name).exists():
+        if not evidence_exists(run_dir / name):
             missing.append(name)
     return missing
 
 
-def _extract_okx_endpoints(okx_api_calls_path: Path) -> Set[str]:
+def _api_calls_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[int, Set[str]]:
     """
-    Best-effort: extract endpoint identifiers from okx_api_calls.jsonl to validate replayability.
-    We accept either:
+    Best-effort: extract endpoint identifiers from okx_api_calls.jsonl to validate replayability
+    (and count its records). We accept either:
       - endpoint: '/api/v5/market/ticker'
       - method: 'get_ticker' (Quant-style)
     """
+    n = 0
     out: Set[str] = set()
-    for _line_no, rec in _iter_jsonl(okx_api_calls_path):
+    for _line_no, rec in rows:
+        n += 1
         ep = rec.get("endpoint")
         m = rec.get("method")
         if isinstance(ep, str) and ep.strip():
             out.add(ep.strip())
         if isinstance(m, str) and m.strip():
             out.add(m.strip())
-    return out
+    return n, out
 
 
 def _bad_unknown_value(v: Any) -> bool:
@@ -129,40 +141,32 @@ class CheckResult:
     field_coverage: Dict[str, Dict[str, Any]]
 
 
-def _verify_market_snapshot(
-    market_snapshot_path: Path, okx_api_calls_path: Path
-) -> Tuple[List[str], List[str], Dict[str, Dict[str, Any]]]:
-    errors: List[str] = []
-    warnings: List[str] = []
-    coverage: Dict[str, Dict[str, Any]] = {}
+@dataclass
+class _SnapshotSlice:
+    seen: int
+    errors: List[str]
+    present_cnt: Dict[str, int]
+    null_cnt: Dict[str, int]
+    not_measurable_cnt: Dict[str, int]
+    reason_counts: Dict[str, int]
+    unreplayable: int
 
-    required_fields = ["ts_utc", "inst_id", "snapshot_id", "source_endpoints", "quality"]
-
-    market_fields = [
-        "last_px",
-        "bid_px_1",
-        "ask_px_1",
-        "bid_sz_1",
-        "ask_sz_1",
-        "mark_px",
-        "index_px",
-        "funding_rate",
-        "next_funding_ts_ms",
-    ]
-
-    okx_endpoints = _extract_okx_endpoints(okx_api_calls_path)
-    seen = 0
 
-    # coverage counters
-    present_cnt = {k: 0 for k in required_fields + market_fields}
-    null_cnt = {k: 0 for k in market_fields}
-    not_measurable_cnt = {k: 0 for k in market_fields}
+def _check_snapshot_slice(okx_endpoints: Set[str], rows: Iterable[Tuple[int, Dict[str, Any]]]) -> _SnapshotSlice:
+    # per-record rules for one slice of market_snapshot.jsonl (possibly in a worker process);
+    # counters and errors are merged in slice order by _verify_market_snapshot
+    errors: List[str] = []
+    seen = 0
+    present_cnt = {k: 0 for k in REQUIRED_FIELDS + MARKET_FIELDS}
+    null_cnt = {k: 0 for k in MARKET_FIELDS}
+    not_measurable_cnt = {k: 0 for k in MARKET_FIELDS}
     reason_counts: Dict[str, int] = {}
+    unreplayable = 0
 
-    for line_no, rec in _iter_jsonl(market_snapshot_path):
+    for line_no, rec in rows:
         seen += 1
 
-        for k in required_fields:
+        for k in REQUIRED_FIELDS:
             if k not in rec:
                 errors.append(f"market_snapshot missing required field: {k} at line {line_no}")
             else:
@@ -191,6 +195,7 @@ def _verify_market_snapshot(
             # replayability (best-effort): each endpoint must be seen in okx_api_calls by method or endpoint
             missing_eps = [x for x in se if x not in okx_endpoints]
             if missing_eps:
+                unreplayable += 1
                 errors.append(
                     f"market_snapshot.source_endpoints not replayable via okx_api_calls (missing={missing_eps}) at line {line_no}"
                 )
@@ -212,7 +217,7 @@ def _verify_market_snapshot(
                     reason_counts[rc] = reason_counts.get(rc, 0) + 1
 
         # market fields type + mask discipline
-        for k in market_fields:
+        for k in MARKET_FIELDS:
             if k in rec:
                 present_cnt[k] += 1
             v = rec.get(k)
@@ -237,11 +242,15 @@ def _verify_market_snapshot(
             if _bad_unknown_value(v):
                 errors.append(f"market_snapshot.{k} violates mask discipline (bad unknown value={v!r}) at line {line_no}")
 
-    # coverage summary
-    if seen == 0:
-        errors.append("market_snapshot.jsonl is empty (no records)")
-        return errors, warnings, {}
+    return _SnapshotSlice(seen, errors, present_cnt, null_cnt, not_measurable_cnt, reason_counts, unreplayable)
+
 
+def _field_coverage(
+    seen: int, present_cnt: Dict[str, int], not_measurable_cnt: Dict[str, int], reason_counts: Dict[str, int]
+) -> Dict[str, Dict[str, Any]]:
+    required_fields = REQUIRED_FIELDS
+    market_fields = MARKET_FIELDS
+    coverage: Dict[str, Dict[str, Any]] = {}
     for k in market_fields:
         coverage[k] = {
             "present_ratio": (present_cnt.get(k, 0) / seen),
@@ -259,75 +268,216 @@ def _verify_market_snapshot(
 
     # NOT_MEASURABLE verdict suggestion: if quality.overall is not_measurable for all records.
     # We don't parse per-record overall here into ratios; it will be inferred by caller via warnings if needed.
-    return errors, warnings, coverage
+    return coverage
 
 
-def verify(run_dir: Path) -> CheckResult:
-    errors: List[str] = []
-    warnings: List[str] = []
-    counts: Dict[str, int] = {}
-    coverage: Dict[str, Dict[str, Any]] = {}
+class ScannerESchemaGate(Gate):
+    """
+    E-schema checks as a gate_engine_v0 gate. One read per file: okx_api_calls.jsonl
+    (count + endpoint set), errors.jsonl (count), market_snapshot.jsonl (count +
+    per-record rules, streamed after okx_api_calls so source_endpoints can be checked).
+    """
 
-    # strict JSON / JSONL
-    manifest: Dict[str, Any] = {}
-    try:
-        manifest = _read_json(run_dir / "run_manifest.json")
-    except Exception as e:
-        errors.append(f"run_manifest.json invalid json: {e}")
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
-
-    # Required files depend on run_kind:
-    # - modeling_tool (scanner): requires scanner_report.json
-    # - production (tick loop): does NOT require scanner_report.json
-    run_kind = manifest.get("run_kind")
-    required = [
-        "run_manifest.json",
-        "okx_api_calls.jsonl",
-        "errors.jsonl",
-        "market_snapshot.jsonl",
-    ]
-    if run_kind == "modeling_tool":
-        required.append("scanner_report.json")
-
-    missing = _check_required_files(run_dir, required)
-    if missing:
-        errors.extend([f"missing required file: {name}" for name in missing])
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
-
-    for name in ["okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl"]:
+    tool = "verify_scanner_e_schema_v0"
+    not_measurable_warning = "evidence is valid but key field coverage is 0"
+    inputs = ("run_manifest.json", "okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl", "scanner_report.json")
+    resumable = True
+
+    def __init__(self, run_dir: Path) -> None:
+        super().__init__()
+        self.run_dir = run_dir
+        self._early: Optional[CheckResult] = None
+        self._counts: Dict[str, int] = {}
+        self._strict_errors: List[str] = []
+        self._okx_error: Optional[Exception] = None
+        self._okx_endpoints: Set[str] = set()
+
+        # coverage counters
+        self._seen = 0
+        self._errors: List[str] = []
+        self._present_cnt = {k: 0 for k in REQUIRED_FIELDS + MARKET_FIELDS}
+        self._null_cnt = {k: 0 for k in MARKET_FIELDS}
+        self._not_measurable_cnt = {k: 0 for k in MARKET_FIELDS}
+        self._reason_counts: Dict[str, int] = {}
+        self._unreplayable = 0
+
+        # strict JSON / JSONL
         try:
-            counts[name] = _count_jsonl_records(run_dir / name)
+            manifest = _read_json(run_dir / "run_manifest.json")
         except Exception as e:
-            errors.append(f"{name} strict-jsonl failed: {e}")
-
-    if counts.get("market_snapshot.jsonl", 0) <= 0:
-        errors.append("market_snapshot.jsonl must be non-empty")
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
-
-    # schema rules
-    e2, w2, cov = _verify_market_snapshot(run_dir / "market_snapshot.jsonl", run_dir / "okx_api_calls.jsonl")
-    errors.extend(e2)
-    warnings.extend(w2)
-    coverage = cov
-
-    if errors:
-        return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
-
-    # If coverage indicates pervasive not_measurable (e.g., all key px null), we can downgrade to NOT_MEASURABLE.
-    # v0 conservative heuristic: if last_px is always null, mark NOT_MEASURABLE.
-    last_cov = coverage.get("last_px", {})
-    if isinstance(last_cov, dict) and last_cov.get("not_measurable_ratio") == 1.0:
-        return CheckResult(
-            verdict="NOT_MEASURABLE", errors=errors, warnings=["last_px always null"], counts=counts, field_coverage=coverage
-        )
+            self._early = CheckResult(
+                verdict="FAIL", errors=[f"run_manifest.json invalid json: {e}"], warnings=[], counts={}, field_coverage={}
+            )
+            return
+
+        # Required files depend on run_kind:
+        # - modeling_tool (scanner): requires scanner_report.json
+        # - production (tick loop): does NOT require scanner_report.json
+        run_kind = manifest.get("run_kind")
+        required = [
+            "run_manifest.json",
+            "okx_api_calls.jsonl",
+            "errors.jsonl",
+            "market_snapshot.jsonl",
+        ]
+        if run_kind == "modeling_tool":
+            required.append("scanner_report.json")
+
+        missing = _check_required_files(run_dir, required)
+        if missing:
+            self._early = CheckResult(
+                verdict="FAIL",
+                errors=[f"missing required file: {name}" for name in missing],
+                warnings=[],
+                counts={},
+                field_coverage={},
+            )
+            return
+        self.files = ("okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl")
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        if name == "okx_api_calls.jsonl":
+            return _api_calls_slice
+        if name == "market_snapshot.jsonl" and self._okx_error is None:
+            return partial(_check_snapshot_slice, self._okx_endpoints)
+        return count_rows
+
+    def update(self, name: str, part: Any) -> None:
+        if name == "okx_api_calls.jsonl":
+            n, eps = part
+            self._okx_endpoints |= eps
+        elif isinstance(part, _SnapshotSlice):
+            n = part.seen
+            self._seen += part.seen
+            self._errors.extend(part.errors)
+            for k, c in part.present_cnt.items():
+                self._present_cnt[k] += c
+            for k in MARKET_FIELDS:
+                self._null_cnt[k] += part.null_cnt[k]
+                self._not_measurable_cnt[k] += part.not_measurable_cnt[k]
+            for rc, c in part.reason_counts.items():
+                self._reason_counts[rc] = self._reason_counts.get(rc, 0) + c
+            self._unreplayable += part.unreplayable
+        else:
+            n = part
+        self._counts[name] = self._counts.get(name, 0) + n
+
+    def fail(self, name: str, exc: Exception) -> None:
+        self._counts.pop(name, None)
+        self._strict_errors.append(f"{name} strict-jsonl failed: {exc}")
+        if name == "okx_api_calls.jsonl":
+            self._okx_error = exc
+
+    def checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        # records checked against a smaller endpoint set must not be frozen as unreplayable
+        if self._early is not None or self._okx_error is not None or self._unreplayable:
+            return None
+        return {
+            "counts": self._counts,
+            "strict_errors": self._strict_errors,
+            "okx_endpoints": sorted(self._okx_endpoints),
+            "seen": self._seen,
+            "errors": self._errors,
+            "present_cnt": self._present_cnt,
+            "null_cnt": self._null_cnt,
+            "not_measurable_cnt": self._not_measurable_cnt,
+            "reason_counts": self._reason_counts,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self._counts = dict(state["counts"])
+        self._strict_errors = list(state["strict_errors"])
+        self._okx_endpoints = set(state["okx_endpoints"])
+        self._seen = state["seen"]
+        self._errors = list(state["errors"])
+        self._present_cnt = dict(state["present_cnt"])
+        self._null_cnt = dict(state["null_cnt"])
+        self._not_measurable_cnt = dict(state["not_measurable_cnt"])
+        self._reason_counts = dict(state["reason_counts"])
+
+    def finalize(self) -> CheckResult:
+        if self._early is not None:
+            return self._early
+        warnings: List[str] = []
+        counts = {name: self._counts[name] for name in self.files if name in self._counts}
+        errors = list(self._strict_errors)
+
+        if counts.get("market_snapshot.jsonl", 0) <= 0:
+            errors.append("market_snapshot.jsonl must be non-empty")
+            return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage={})
+        if self._okx_error is not None:
+            # source_endpoints cannot be checked without the endpoint set: the verifier errors out (exit 1)
+            raise self._okx_error
+
+        # schema rules
+        errors.extend(self._errors)
+        coverage = _field_coverage(self._seen, self._present_cnt, self._not_measurable_cnt, self._reason_counts)
+
+        if errors:
+            return CheckResult(verdict="FAIL", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
+
+        # If coverage indicates pervasive not_measurable (e.g., all key px null), we can downgrade to NOT_MEASURABLE.
+        # v0 conservative heuristic: if last_px is always null, mark NOT_MEASURABLE.
+        last_cov = coverage.get("last_px", {})
+        if isinstance(last_cov, dict) and last_cov.get("not_measurable_ratio") == 1.0:
+            return CheckResult(
+                verdict="NOT_MEASURABLE", errors=errors, warnings=["last_px always null"], counts=counts, field_coverage=coverage
+            )
+
+        return CheckResult(verdict="PASS", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
+
+    def report(self, result: CheckResult) -> Dict[str, Any]:
+        run_dir = self.run_dir
+        manifest = _read_json(run_dir / "run_manifest.json") if (run_dir / "run_manifest.json").exists() else {}
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "run_dir": str(run_dir),
+            "manifest": {
+                "run_id": manifest.get("run_id"),
+                "run_kind": manifest.get("run_kind"),
+                "mode": manifest.get("mode"),
+                "inst_id": manifest.get("inst_id") or manifest.get("world_parameters", {}).get("inst_id"),
+                "schema_contract": manifest.get("schema_contract"),
+            },
+            "verdict": result.verdict,
+            "counts": result.counts,
+            "errors": result.errors,
+            "warnings": result.warnings,
+            "field_coverage": result.field_coverage,
+        }
+
 
-    return CheckResult(verdict="PASS", errors=errors, warnings=warnings, counts=counts, field_coverage=coverage)
+def verify(run_dir: Path, workers: int = 1) -> CheckResult:
+    gate = ScannerESchemaGate(run_dir)
+    run_gates(run_dir, [gate], workers)
+    return gate.finalize()
+
+
+def verify_report(
+    run_dir: Path,
+    workers: int = 1,
+    use_cache: Optional[bool] = None,
+    refresh_cache: bool = False,
+    resume: bool = False,
+) -> Tuple[Dict[str, Any], int]:
+    return gate_report(run_dir, ScannerESchemaGate(run_dir), workers, use_cache, refresh_cache, resume)
 
 
 def main() -> int:
     ap = argparse.ArgumentParser()
     ap.add_argument("--run_dir", required=True, help="Scanner run_dir to verify")
     ap.add_argument("--output", default="", help="Optional output JSON report path")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
+    ap.add_argument(
+        "--resume",
+        action="store_true",
+        help="Verify only what was appended since the last --resume checkpoint (fails closed if the prefix changed)",
+    )
     args = ap.parse_args()
 
     run_dir = Path(args.run_dir).expanduser().resolve()
@@ -337,43 +487,31 @@ def main() -> int:
         print(f"ERROR: run_dir not found: {run_dir}", file=sys.stderr)
         return 1
 
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
+
     try:
-        manifest = _read_json(run_dir / "run_manifest.json") if (run_dir / "run_manifest.json").exists() else {}
-        result = verify(run_dir)
+        report, code = verify_report(
+            run_dir,
+            args.workers,
+            use_cache=(False if args.no_report_cache else None),
+            refresh_cache=args.refresh_report_cache,
+            resume=args.resume,
+        )
     except Exception as e:
         print(f"ERROR: verifier crashed: {e}", file=sys.stderr)
         return 1
 
-    report: Dict[str, Any] = {
-        "tool": "verify_scanner_e_schema_v0",
-        "generated_at_utc": _ts_utc(),
-        "run_dir": str(run_dir),
-        "manifest": {
-            "run_id": manifest.get("run_id"),
-            "run_kind": manifest.get("run_kind"),
-            "mode": manifest.get("mode"),
-            "inst_id": manifest.get("inst_id") or manifest.get("world_parameters", {}).get("inst_id"),
-            "schema_contract": manifest.get("schema_contract"),
-        },
-        "verdict": result.verdict,
-        "counts": result.counts,
-        "errors": result.errors,
-        "warnings": result.warnings,
-        "field_coverage": result.field_coverage,
-    }
-
     if out_path is not None:
         out_path.parent.mkdir(parents=True, exist_ok=True)
         out_path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
 
     print(json.dumps(report, ensure_ascii=False))
 
-    if result.verdict == "FAIL":
-        return 2
-    if result.verdict == "NOT_MEASURABLE":
+    if report["verdict"] == "NOT_MEASURABLE":
         print("WARNING: verdict=NOT_MEASURABLE (evidence is valid but key field coverage is 0)", file=sys.stderr)
-        return 0
-    return 0
+    return code
 
 
 if __name__ == "__main__":
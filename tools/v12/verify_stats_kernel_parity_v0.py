@@ -0,0 +1,183 @@
+#!/usr/bin/env python3
+"""
+V12 stats kernel backend parity verifier v0 (Research repo; needs NumPy to measure).
+
+Checks that stats_kernel_v0's NumPy fast path reproduces the pure-Python
+reference on seeded random inputs, so calibration reports do not depend on
+which backend ran:
+  - rankdata: bit-identical
+  - spearman: bit-identical up to SPEARMAN_EXACT_N samples, else within 1e-11
+  - pearson: None / NaN exactly where the reference has them, else within 1e-12
+Input families: small-int ties, continuous, sparse 0/1, constant (dyadic and
+non-dyadic), offset (|mean| / std up to 1e3), signed zeros, NaN, +-inf, and
+lengths 0..3; plus one SPEARMAN_EXACT_N-sample spearman case.
+
+Usage:
+  python3 tools/v12/verify_stats_kernel_parity_v0.py [--seed 0] [--cases 300] [--max_n 5000]
+
+Exit codes:
+  0: PASS, or NOT_MEASURABLE (NumPy not installed)
+  2: FAIL (any parity check fails)
+  1: ERROR (tool crash)
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import math
+import random
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from stats_kernel_v0 import (
+    numpy_available,
+    pearson_np,
+    pearson_py,
+    rankdata_np,
+    rankdata_py,
+    spearman_np,
+    spearman_py,
+)
+
+
+SPEARMAN_EXACT_N = 300_000
+SPEARMAN_TOL = 1e-11
+PEARSON_TOL = 1e-12
+
+
+def _ts_utc() -> str:
+    return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
+
+
+def _family(rng: random.Random, name: str, n: int) -> List[float]:
+    if name == "ties":
+        return [float(rng.randint(0, 5)) for _ in range(n)]
+    if name == "continuous":
+        return [rng.gauss(0.0, 1.0) for _ in range(n)]
+    if name == "sparse01":
+        return [1.0 if rng.random() < 0.01 else 0.0 for _ in range(n)]
+    if name == "const_dyadic":
+        return [0.5] * n
+    if name == "const_non_dyadic":
+        return [0.1] * n
+    if name == "offset":
+        return [1e3 + rng.gauss(0.0, 1.0) for _ in range(n)]
+    if name == "signed_zero":
+        return [rng.choice([0.0, -0.0, 1.0]) for _ in range(n)]
+    if name == "nan":
+        return [math.nan if rng.random() < 0.05 else rng.gauss(0.0, 1.0) for _ in range(n)]
+    if name == "inf":
+        return [rng.choice([math.inf, -math.inf]) if rng.random() < 0.05 else rng.gauss(0.0, 1.0) for _ in range(n)]
+    raise ValueError(f"unknown family: {name}")
+
+
+FAMILIES = (
+    "ties",
+    "continuous",
+    "sparse01",
+    "const_dyadic",
+    "const_non_dyadic",
+    "offset",
+    "signed_zero",
+    "nan",
+    "inf",
+)
+
+
+def _same(a: Optional[float], b: Optional[float]) -> bool:
+    if a is None or b is None:
+        return a is b
+    if math.isnan(a) or math.isnan(b):
+        return math.isnan(a) and math.isnan(b)
+    return a == b
+
+
+def _within(a: Optional[float], b: Optional[float], tol: float) -> bool:
+    if a is None or b is None or math.isnan(a) or math.isnan(b) or math.isinf(a) or math.isinf(b):
+        return _same(a, b)
+    return abs(a - b) <= tol
+
+
+def _spearman_within(a: Optional[float], b: Optional[float]) -> bool:
+    return _within(a, b, SPEARMAN_TOL)
+
+
+def _check_case(
+    x: List[float], y: List[float], spearman_ok: Callable[[Optional[float], Optional[float]], bool]
+) -> List[str]:
+    failed: List[str] = []
+    if not all(_same(a, b) for a, b in zip(rankdata_py(x), rankdata_np(x))):
+        failed.append("rankdata")
+    if not spearman_ok(spearman_py(x, y), spearman_np(x, y)):
+        failed.append("spearman")
+    if not _within(pearson_py(x, y), pearson_np(x, y), PEARSON_TOL):
+        failed.append("pearson")
+    return failed
+
+
+def verify(seed: int, cases: int, max_n: int) -> Dict[str, Any]:
+    rng = random.Random(seed)
+    failures: List[Dict[str, Any]] = []
+    checked = 0
+    for i in range(cases):
+        n = rng.choice([0, 1, 2, 3, rng.randint(4, max(4, max_n))])
+        fx, fy = rng.choice(FAMILIES), rng.choice(FAMILIES)
+        x, y = _family(rng, fx, n), _family(rng, fy, n)
+        failed = _check_case(x, y, _same if n <= SPEARMAN_EXACT_N else _spearman_within)
+        checked += 1
+        if failed:
+            failures.append({"case": i, "n": n, "x": fx, "y": fy, "failed": failed})
+
+    # large-n spearman: exact at the documented limit (rank moment sums still exact)
+    x = _family(rng, "continuous", SPEARMAN_EXACT_N)
+    y = [a + b for a, b in zip(x, _family(rng, "ties", SPEARMAN_EXACT_N))]
+    if not _same(spearman_py(x, y), spearman_np(x, y)):
+        failures.append({"case": "spearman_exact_n", "n": SPEARMAN_EXACT_N, "failed": ["spearman"]})
+    checked += 1
+
+    return {"checked": checked, "failures": failures}
+
+
+def main() -> int:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--seed", type=int, default=0)
+    ap.add_argument("--cases", type=int, default=300, help="Random input pairs to compare")
+    ap.add_argument("--max_n", type=int, default=5000, help="Largest random input length")
+    ap.add_argument("--output_json", default="", help="Also write the report here")
+    args = ap.parse_args()
+
+    report: Dict[str, Any] = {
+        "tool": "verify_stats_kernel_parity_v0",
+        "generated_at_utc": _ts_utc(),
+        "seed": args.seed,
+        "cases": args.cases,
+        "max_n": args.max_n,
+        "tolerances": {"spearman_exact_n": SPEARMAN_EXACT_N, "spearman": SPEARMAN_TOL, "pearson": PEARSON_TOL},
+    }
+    if not numpy_available():
+        report.update({"verdict": "NOT_MEASURABLE", "reason_codes": ["not_measurable:numpy_unavailable"]})
+    else:
+        import numpy
+
+        res = verify(args.seed, args.cases, args.max_n)
+        report.update(
+            {
+                "numpy_version": numpy.__version__,
+                "checked": res["checked"],
+                "failure_count": len(res["failures"]),
+                "failures": res["failures"][:20],
+                "verdict": "FAIL" if res["failures"] else "PASS",
+            }
+        )
+
+    s = json.dumps(report, ensure_ascii=False)
+    if args.output_json:
+        Path(args.output_json).write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n", encoding="utf-8")
+    print(s)
+    return 2 if report["verdict"] == "FAIL" else 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
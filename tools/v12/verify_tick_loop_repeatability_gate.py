@@ -10,6 +10,14 @@ this tool verifies:
 
 NOT_MEASURABLE is allowed as long as verifiers exit 0 (evidence valid but degraded).
 
+Both verifiers run in-process through their Python API (verify_report: the
+report + exit code their CLI would produce; a crash counts as exit 1 with no
+report), one run_dir per task, over --jobs worker processes. Results keep
+run_ids order and the per-run schema of the former subprocess version.
+Reports come from the gate_engine_v0 report cache while a run_dir is unchanged
+(--no_report_cache / --refresh_report_cache to bypass / re-verify), so
+re-checking a frozen batch costs a few stats per run_dir.
+
 Exit codes:
   0: PASS (FAIL=0)
   2: FAIL (FAIL>0 or invalid inputs)
@@ -22,13 +30,14 @@ import argparse
 import json
 import sys
 from datetime import datetime, timezone
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Any, Dict, List, Optional
-
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-REPO_ROOT = Path(__file__).parent.parent.parent
-E_VERIFIER = REPO_ROOT / "tools" / "v12" / "verify_scanner_e_schema_v0.py"
-TICK_VERIFIER = REPO_ROOT / "tools" / "v12" / "verify_tick_loop_v0.py"
+from evidence_io_v0 import resolve_workers
+from verify_scanner_e_schema_v0 import verify_report as verify_e_report
+from verify_tick_loop_v0 import verify_report as verify_tick_report
 
 
 def _ts_utc() -> str:
@@ -39,6 +48,47 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return json.loads(path.read_text(encoding="utf-8"))
 
 
+def _run_verifier(fn: Callable[..., Tuple[Dict[str, Any], int]], run_dir: Path, *args: Any) -> Tuple[int, Optional[Dict[str, Any]]]:
+    # CLI semantics: missing run_dir / crash -> exit 1 without a report
+    if not run_dir.exists():
+        return 1, None
+    try:
+        report, code = fn(run_dir, *args)
+    except Exception:
+        return 1, None
+    return code, report
+
+
+def _verify_run(
+    runs_root: Path, min_ticks: int, max_backward_ms: int, cache: Dict[str, Any], rid: str
+) -> Dict[str, Any]:
+    run_dir = runs_root / rid
+    r: Dict[str, Any] = {"run_id": rid, "run_dir": str(run_dir)}
+
+    # E schema
+    e_exit, e_rep = _run_verifier(partial(verify_e_report, **cache), run_dir.expanduser().resolve())
+    r["e_exit"] = e_exit
+    r["e_verdict"] = "ERROR"
+    if e_rep is not None:
+        r["e_verdict"] = e_rep.get("verdict", "ERROR")
+        r["e_errors_head"] = e_rep.get("errors", [])[:5]
+
+    # Tick loop
+    t_exit, t_rep = _run_verifier(
+        partial(verify_tick_report, **cache), run_dir.expanduser().resolve(), min_ticks, max_backward_ms
+    )
+    r["tick_exit"] = t_exit
+    r["tick_verdict"] = "ERROR"
+    if t_rep is not None:
+        r["tick_verdict"] = t_rep.get("verdict", "ERROR")
+        r["tick_errors_head"] = t_rep.get("errors", [])[:5]
+        r["tick_warnings_head"] = t_rep.get("warnings", [])[:5]
+        r["tick_stats"] = t_rep.get("stats", {})
+
+    r["ok"] = (e_exit == 0) and (t_exit == 0)
+    return r
+
+
 def _load_run_ids(args: argparse.Namespace) -> List[str]:
     if args.run_ids:
         return [x.strip() for x in args.run_ids.split(",") if x.strip()]
@@ -57,6 +107,9 @@ def main() -> int:
     ap.add_argument("--min_ticks", type=int, default=120, help="Minimum tick count required")
     ap.add_argument("--max_backward_ms", type=int, default=0, help="Allowed backward drift (ms)")
     ap.add_argument("--output", default="", help="Optional output json path")
+    ap.add_argument("--jobs", type=int, default=1, help="Verify N run_dirs concurrently in worker processes (1 = serial, 0 = all CPUs)")
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore cached reports; verify and overwrite them")
     args = ap.parse_args()
 
     runs_root = Path(args.runs_root).expanduser().resolve()
@@ -65,11 +118,8 @@ def main() -> int:
     if not runs_root.exists():
         print(f"ERROR: runs_root not found: {runs_root}", file=sys.stderr)
         return 2
-    if not E_VERIFIER.exists():
-        print(f"ERROR: E verifier not found: {E_VERIFIER}", file=sys.stderr)
-        return 2
-    if not TICK_VERIFIER.exists():
-        print(f"ERROR: tick verifier not found: {TICK_VERIFIER}", file=sys.stderr)
+    if args.jobs < 0:
+        print(f"ERROR: --jobs must be >= 0, got {args.jobs}", file=sys.stderr)
         return 2
 
     try:
@@ -82,57 +132,15 @@ def main() -> int:
         print("ERROR: empty run_ids", file=sys.stderr)
         return 2
 
-    import subprocess
-
-    results: List[Dict[str, Any]] = []
-    fail = 0
-
-    for rid in run_ids:
-        run_dir = runs_root / rid
-        r: Dict[str, Any] = {"run_id": rid, "run_dir": str(run_dir)}
-
-        # E schema
-        e_cmd = [sys.executable, str(E_VERIFIER), "--run_dir", str(run_dir)]
-        e_p = subprocess.run(e_cmd, capture_output=True, text=True)
-        r["e_exit"] = e_p.returncode
-        r["e_verdict"] = "ERROR"
-        try:
-            if e_p.stdout.strip():
-                e_rep = json.loads(e_p.stdout.strip())
-                r["e_verdict"] = e_rep.get("verdict", "ERROR")
-                r["e_errors_head"] = e_rep.get("errors", [])[:5]
-        except Exception:
-            r["e_errors_head"] = ["e_verifier_output_unparseable"]
-
-        # Tick loop
-        t_cmd = [
-            sys.executable,
-            str(TICK_VERIFIER),
-            "--run_dir",
-            str(run_dir),
-            "--min_ticks",
-            str(args.min_ticks),
-            "--max_backward_ms",
-            str(args.max_backward_ms),
-        ]
-        t_p = subprocess.run(t_cmd, capture_output=True, text=True)
-        r["tick_exit"] = t_p.returncode
-        r["tick_verdict"] = "ERROR"
-        try:
-            if t_p.stdout.strip():
-                t_rep = json.loads(t_p.stdout.strip())
-                r["tick_verdict"] = t_rep.get("verdict", "ERROR")
-                r["tick_errors_head"] = t_rep.get("errors", [])[:5]
-                r["tick_warnings_head"] = t_rep.get("warnings", [])[:5]
-                r["tick_stats"] = t_rep.get("stats", {})
-        except Exception:
-            r["tick_errors_head"] = ["tick_verifier_output_unparseable"]
-
-        ok = (e_p.returncode == 0) and (t_p.returncode == 0)
-        r["ok"] = ok
-        if not ok:
-            fail += 1
-        results.append(r)
+    cache = {"use_cache": (False if args.no_report_cache else None), "refresh_cache": args.refresh_report_cache}
+    check = partial(_verify_run, runs_root, args.min_ticks, args.max_backward_ms, cache)
+    jobs = min(resolve_workers(args.jobs), len(run_ids))
+    if jobs <= 1:
+        results: List[Dict[str, Any]] = [check(rid) for rid in run_ids]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check, run_ids))
+    fail = sum(1 for r in results if not r["ok"])
 
     report = {
         "tool": "verify_tick_loop_repeatability_gate",
@@ -16,16 +16,49 @@ Exit codes (frozen):
   - 0: PASS or NOT_MEASURABLE (prints WARNING when NOT_MEASURABLE)
   - 2: FAIL
   - 1: ERROR
+
+Python API (stable; import as a sibling module, no subprocess needed):
+  - verify(run_dir, min_ticks, max_backward_ms, workers=1) -> (verdict, errors, warnings, stats)
+  - verify_report(run_dir, min_ticks=60, max_backward_ms=0, workers=1, use_cache=None, refresh_cache=False,
+    resume=False) -> (report, exit_code): exactly what the CLI prints / returns for an existing run_dir;
+    raises where the CLI exits 1. Served from the gate_engine_v0 report cache while the
+    run_dir's inputs are unchanged; resume=True continues from the last checkpoint.
+  - follow_report(run_dir, min_ticks=60, max_backward_ms=0, interval=5.0, idle_timeout=0.0, emit=None)
+    -> (report, exit_code): --follow; emit receives each rolling report.
+
+Incremental verification (--resume, for a run_dir that is still being appended to):
+  the gate_engine_v0 checkpoint keeps each file's verified byte offset + prefix
+  sha256 and the sequence state (last ts_utc, snapshot_id set, counters); the
+  next run re-hashes the prefix, fails closed if it changed, and parses only
+  the appended records. Same report as a full pass over the same bytes.
+
+Live follow (--follow, during a capture window):
+  tails market_snapshot.jsonl / okx_api_calls.jsonl / errors.jsonl as they
+  grow (gate_engine_v0.follow_gate), checking each completed record once
+  (constant cost per record; a partial trailing line waits for its newline).
+  Every --interval seconds stdout gets a rolling report: the report a full
+  pass over the lines read so far would give, plus
+  "follow": {"final": false, "elapsed_s", "lines": {file: lines read}}.
+  Stops after --idle_timeout seconds without growth (0 = until SIGINT/SIGTERM)
+  and prints the final report, exactly as without --follow; exit code as usual.
+  Required files that do not exist yet are waited for.
 """
 
 from __future__ import annotations
 
 import argparse
+import copy
 import json
 import sys
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from error_sink_v0 import ErrorSink
+from evidence_io_v0 import check_ts_tz, delta_ms, evidence_exists, ts_epoch_us_list
+from gate_engine_v0 import Gate, count_rows, exit_code_for, follow_gate, gate_report, run_gates
+from id_set_v0 import IdSet
 
 
 def _ts_utc() -> str:
@@ -40,132 +73,273 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return obj
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
-def _count_jsonl(path: Path) -> int:
-    n = 0
-    for _ln, _rec in _iter_jsonl(path):
-        n += 1
-    return n
-
-
-def _parse_iso_utc(ts: str) -> datetime:
-    # Accept both 'Z' and '+00:00'
-    s = ts.strip()
-    if s.endswith("Z"):
-        s = s[:-1] + "+00:00"
-    return datetime.fromisoformat(s)
+def _snapshot_facts(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> List[Tuple[int, Any, Any, Any, Optional[int], bool]]:
+    # runs per slice (possibly in a worker process): keep only what the sequence checks read;
+    # ts_utc is parsed here too, so the merge loop only does integer arithmetic
+    facts = [(line_no, rec.get("snapshot_id"), rec.get("inst_id"), rec.get("ts_utc")) for line_no, rec in rows]
+    epoch_us, aware = ts_epoch_us_list([f[3] for f in facts])
+    return [(*f, us, a) for f, us, a in zip(facts, epoch_us, aware)]
 
 
 def _check_required_files(run_dir: Path, required: List[str]) -> List[str]:
-    return [name for name in required if not (run_dir / name).exists()]
-
-
-def verify(run_dir: Path, min_ticks: int, max_backward_ms: int) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
-    errors: List[str] = []
-    warnings: List[str] = []
-    stats: Dict[str, Any] = {}
-
-    required = ["run_manifest.json", "okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl"]
-    missing = _check_required_files(run_dir, required)
-    if missing:
-        errors.extend([f"missing required file: {x}" for x in missing])
-        return "FAIL", errors, warnings, stats
-
-    try:
-        manifest = _read_json(run_dir / "run_manifest.json")
-    except Exception as e:
-        return "FAIL", [f"run_manifest.json invalid: {e}"], warnings, stats
-
-    rk = manifest.get("run_kind")
-    if rk != "production":
-        errors.append(f"run_manifest.run_kind must be 'production' for tick loop, got {rk!r}")
-
-    # strict jsonl for api_calls/errors (we only count here)
-    try:
-        stats["okx_api_calls_count"] = _count_jsonl(run_dir / "okx_api_calls.jsonl")
-    except Exception as e:
-        errors.append(f"okx_api_calls.jsonl strict-jsonl failed: {e}")
-    try:
-        stats["errors_count"] = _count_jsonl(run_dir / "errors.jsonl")
-    except Exception as e:
-        errors.append(f"errors.jsonl strict-jsonl failed: {e}")
-
-    # snapshot sequence checks
-    snapshot_ids = set()
-    tick = 0
-    prev_ts: Optional[datetime] = None
-    backward_count = 0
-    inst_id_bad = 0
-
-    try:
-        for line_no, rec in _iter_jsonl(run_dir / "market_snapshot.jsonl"):
-            tick += 1
-            sid = rec.get("snapshot_id")
+    return [name for name in required if not evidence_exists(run_dir / name)]
+
+
+class TickLoopGate(Gate):
+    """Tick-loop sequence checks as a gate_engine_v0 gate (market_snapshot: snapshot_id / inst_id / ts_utc)."""
+
+    tool = "verify_tick_loop_v0"
+    not_measurable_warning = "evidence valid but degraded"
+    inputs = ("run_manifest.json", "okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl")
+    resumable = True
+
+    def __init__(self, run_dir: Path, min_ticks: int, max_backward_ms: int) -> None:
+        super().__init__()
+        self.run_dir = run_dir
+        self.min_ticks = min_ticks
+        self.max_backward_ms = max_backward_ms
+        # run_dir-level errors (manifest, strict failures of the auxiliary files) come first in the
+        # report, then the market_snapshot ones -- also when a resumed pass meets an auxiliary
+        # failure after restoring earlier snapshot errors
+        self.errors = ErrorSink()
+        self._line_errors = ErrorSink()
+        self.warnings: List[str] = []
+        self.stats: Dict[str, Any] = {}
+        self._early: Optional[str] = None
+
+        self._snapshot_ids = IdSet()  # compact and exact: every id of the run, however long
+        self._tick = 0
+        self._prev_us: Optional[int] = None
+        self._prev_aware = True
+        self._snapshot_failed = False  # a naive/aware ts_utc mix stops the stream, like a strict failure
+        self._backward_count = 0
+        self._inst_id_bad = 0
+
+        required = ["run_manifest.json", "okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl"]
+        missing = _check_required_files(run_dir, required)
+        if missing:
+            for x in missing:
+                self.errors.add("missing_file", f"missing required file: {x}")
+            self._early = "FAIL"
+            return
+
+        try:
+            manifest = _read_json(run_dir / "run_manifest.json")
+        except Exception as e:
+            self.errors.add("run_manifest", f"run_manifest.json invalid: {e}")
+            self._early = "FAIL"
+            return
+
+        rk = manifest.get("run_kind")
+        if rk != "production":
+            self.errors.add("run_manifest", f"run_manifest.run_kind must be 'production' for tick loop, got {rk!r}")
+        # strict jsonl for api_calls/errors (we only count here)
+        self.files = ("okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl")
+
+    def params(self) -> Dict[str, Any]:
+        return {"min_ticks": self.min_ticks, "max_backward_ms": self.max_backward_ms}
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        return _snapshot_facts if name == "market_snapshot.jsonl" else count_rows
+
+    def update(self, name: str, part: Any) -> None:
+        if name == "okx_api_calls.jsonl":
+            self.stats["okx_api_calls_count"] = self.stats.get("okx_api_calls_count", 0) + part
+            return
+        if name == "errors.jsonl":
+            self.stats["errors_count"] = self.stats.get("errors_count", 0) + part
+            return
+
+        # snapshot sequence checks
+        if self._snapshot_failed:
+            return
+        errors = self._line_errors
+        snapshot_ids = self._snapshot_ids
+        max_backward_ms = self.max_backward_ms
+        for line_no, sid, inst, ts, cur_us, cur_aware in part:
+            self._tick += 1
             if not isinstance(sid, str) or not sid:
-                errors.append(f"market_snapshot.snapshot_id missing/invalid at line {line_no}")
+                errors.add("invalid_snapshot_id", f"market_snapshot.snapshot_id missing/invalid at line {line_no}", line_no)
             else:
-                if sid in snapshot_ids:
-                    errors.append(f"duplicate snapshot_id at line {line_no}: {sid}")
-                snapshot_ids.add(sid)
+                if not snapshot_ids.add(sid):
+                    errors.add("duplicate_snapshot_id", f"duplicate snapshot_id at line {line_no}: {sid}", line_no)
 
-            inst = rec.get("inst_id")
             if inst != "BTC-USDT-SWAP":
-                inst_id_bad += 1
+                self._inst_id_bad += 1
 
-            ts = rec.get("ts_utc")
             if not isinstance(ts, str) or not ts:
-                errors.append(f"market_snapshot.ts_utc missing/invalid at line {line_no}")
+                errors.add("invalid_ts_utc", f"market_snapshot.ts_utc missing/invalid at line {line_no}", line_no)
                 continue
-            try:
-                cur_ts = _parse_iso_utc(ts)
-            except Exception:
-                errors.append(f"market_snapshot.ts_utc not isoformat at line {line_no}: {ts!r}")
+            if cur_us is None:
+                errors.add("unparseable_ts_utc", f"market_snapshot.ts_utc not isoformat at line {line_no}: {ts!r}", line_no)
                 continue
 
-            if prev_ts is not None:
-                delta_ms = int((cur_ts - prev_ts).total_seconds() * 1000)
-                if delta_ms < -max_backward_ms:
-                    backward_count += 1
-                    errors.append(f"ts_utc went backward by {delta_ms}ms at line {line_no}")
-            prev_ts = cur_ts
-    except Exception as e:
-        errors.append(f"market_snapshot.jsonl strict-jsonl failed: {e}")
-
-    stats["tick_count"] = tick
-    stats["unique_snapshot_id_count"] = len(snapshot_ids)
-    stats["inst_id_bad_count"] = inst_id_bad
-    stats["ts_backward_count"] = backward_count
-
-    if tick < min_ticks:
-        errors.append(f"tick_count < min_ticks: {tick} < {min_ticks}")
-
-    if inst_id_bad > 0:
-        errors.append(f"inst_id not BTC-USDT-SWAP for {inst_id_bad} record(s)")
+            if self._prev_us is not None:
+                try:
+                    check_ts_tz(cur_aware, self._prev_aware)
+                except TypeError as e:
+                    self._snapshot_failed = True
+                    self.fail(name, e)
+                    return
+                d_ms = delta_ms(cur_us, self._prev_us)
+                if d_ms < -max_backward_ms:
+                    self._backward_count += 1
+                    errors.add("ts_backward", f"ts_utc went backward by {d_ms}ms at line {line_no}", line_no)
+            self._prev_us = cur_us
+            self._prev_aware = cur_aware
+
+    def fail(self, name: str, exc: Exception) -> None:
+        msg = f"{name} strict-jsonl failed: {exc}"
+        if name == "market_snapshot.jsonl":
+            self._line_errors.add("strict_jsonl", msg)
+            return
+        if name == "okx_api_calls.jsonl":
+            self.stats.pop("okx_api_calls_count", None)
+        elif name == "errors.jsonl":
+            self.stats.pop("errors_count", None)
+        self.errors.add("strict_jsonl", msg)
+
+    def checkpoint_state(self) -> Optional[Dict[str, Any]]:
+        if self._early is not None:
+            return None
+        return {
+            "errors": self.errors.to_state(),
+            "line_errors": self._line_errors.to_state(),
+            "warnings": self.warnings,
+            "stats": self.stats,
+            "snapshot_ids": self._snapshot_ids.to_state(),
+            "tick": self._tick,
+            "prev_us": self._prev_us,
+            "prev_aware": self._prev_aware,
+            "snapshot_failed": self._snapshot_failed,
+            "backward_count": self._backward_count,
+            "inst_id_bad": self._inst_id_bad,
+        }
+
+    def restore_state(self, state: Dict[str, Any]) -> None:
+        self.errors = ErrorSink.from_state(state["errors"])
+        self._line_errors = ErrorSink.from_state(state["line_errors"])
+        self.warnings = list(state["warnings"])
+        self.stats = dict(state["stats"])
+        self._snapshot_ids = IdSet.from_state(state["snapshot_ids"])
+        self._tick = state["tick"]
+        self._prev_us = state["prev_us"]
+        self._prev_aware = state["prev_aware"]
+        self._snapshot_failed = state["snapshot_failed"]
+        self._backward_count = state["backward_count"]
+        self._inst_id_bad = state["inst_id_bad"]
+
+    def rolling_result(self) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+        """finalize() as of now, leaving the gate free to keep reading (follow mode)."""
+        probe = copy.copy(self)
+        probe.errors, probe._line_errors = copy.deepcopy(self.errors), copy.deepcopy(self._line_errors)
+        probe.warnings, probe.stats = list(self.warnings), dict(self.stats)
+        return probe.finalize()
+
+    def finalize(self) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+        warnings, stats = self.warnings, self.stats
+        if self._early is not None:
+            return self._early, self.errors.messages(), warnings, stats
+        errors = ErrorSink()
+        errors.merge(self.errors)
+        errors.merge(self._line_errors)
+
+        tick = self._tick
+        stats["tick_count"] = tick
+        stats["unique_snapshot_id_count"] = len(self._snapshot_ids)
+        stats["inst_id_bad_count"] = self._inst_id_bad
+        stats["ts_backward_count"] = self._backward_count
+
+        if tick < self.min_ticks:
+            errors.add("min_ticks", f"tick_count < min_ticks: {tick} < {self.min_ticks}")
+
+        if self._inst_id_bad > 0:
+            errors.add("inst_id", f"inst_id not BTC-USDT-SWAP for {self._inst_id_bad} record(s)")
+
+        if errors:
+            stats.update(errors.summary())
+            return "FAIL", errors.messages(), warnings, stats
+
+        # Optional: if many errors.jsonl records exist, we can downgrade to NOT_MEASURABLE
+        # v0 conservative: errors_count > 0 -> NOT_MEASURABLE (evidence valid but degraded)
+        if stats.get("errors_count", 0) > 0:
+            warnings.append("errors.jsonl non-empty: degraded run (NOT_MEASURABLE)")
+            return "NOT_MEASURABLE", [], warnings, stats
+
+        return "PASS", [], warnings, stats
+
+    def report(self, result: Tuple[str, List[str], List[str], Dict[str, Any]]) -> Dict[str, Any]:
+        verdict, errors, warnings, stats = result
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "run_dir": str(self.run_dir),
+            "verdict": verdict,
+            "min_ticks": self.min_ticks,
+            "max_backward_ms": self.max_backward_ms,
+            "stats": stats,
+            "errors": errors,
+            "warnings": warnings,
+        }
+
+
+def verify(
+    run_dir: Path, min_ticks: int, max_backward_ms: int, workers: int = 1
+) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+    gate = TickLoopGate(run_dir, min_ticks, max_backward_ms)
+    run_gates(run_dir, [gate], workers)
+    return gate.finalize()
+
+
+def verify_report(
+    run_dir: Path,
+    min_ticks: int = 60,
+    max_backward_ms: int = 0,
+    workers: int = 1,
+    use_cache: Optional[bool] = None,
+    refresh_cache: bool = False,
+    resume: bool = False,
+) -> Tuple[Dict[str, Any], int]:
+    gate = TickLoopGate(run_dir, min_ticks, max_backward_ms)
+    return gate_report(run_dir, gate, workers, use_cache, refresh_cache, resume)
+
+
+def follow_report(
+    run_dir: Path,
+    min_ticks: int = 60,
+    max_backward_ms: int = 0,
+    interval: float = 5.0,
+    idle_timeout: float = 0.0,
+    emit: Optional[Callable[[Dict[str, Any]], None]] = None,
+    poll: float = 0.5,
+) -> Tuple[Dict[str, Any], int]:
+    """
+    --follow: verify run_dir while it is being written; emit(rolling report) every
+    `interval` seconds, then (final report, exit_code) once it stops (see module docstring).
+    """
+    started = time.monotonic()
+    required = ["run_manifest.json", "okx_api_calls.jsonl", "errors.jsonl", "market_snapshot.jsonl"]
+    try:
+        while _check_required_files(run_dir, required):
+            if idle_timeout > 0 and time.monotonic() - started >= idle_timeout:
+                break
+            time.sleep(poll)
+    except KeyboardInterrupt:
+        pass  # report the missing files
 
-    if errors:
-        return "FAIL", errors, warnings, stats
+    gate = TickLoopGate(run_dir, min_ticks, max_backward_ms)
 
-    # Optional: if many errors.jsonl records exist, we can downgrade to NOT_MEASURABLE
-    # v0 conservative: errors_count > 0 -> NOT_MEASURABLE (evidence valid but degraded)
-    if stats.get("errors_count", 0) > 0:
-        warnings.append("errors.jsonl non-empty: degraded run (NOT_MEASURABLE)")
-        return "NOT_MEASURABLE", errors, warnings, stats
+    def _rolling(g: Gate, lines: Dict[str, int]) -> None:
+        if emit is None:
+            return
+        report = g.report(g.rolling_result())
+        report["follow"] = {"final": False, "elapsed_s": round(time.monotonic() - started, 3), "lines": lines}
+        emit(report)
 
-    return "PASS", errors, warnings, stats
+    if gate.files:
+        follow_gate(run_dir, gate, _rolling, interval, idle_timeout, poll)
+    report = gate.report(gate.finalize())
+    return report, exit_code_for(report["verdict"])
 
 
 def main() -> int:
@@ -174,6 +348,25 @@ def main() -> int:
     ap.add_argument("--min_ticks", type=int, default=60, help="Minimum tick count required for PASS")
     ap.add_argument("--max_backward_ms", type=int, default=0, help="Allowed backward time drift (ms)")
     ap.add_argument("--output", default="", help="Optional report output path")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
+    ap.add_argument(
+        "--resume",
+        action="store_true",
+        help="Verify only what was appended since the last --resume checkpoint (fails closed if the prefix changed)",
+    )
+    ap.add_argument(
+        "--follow",
+        action="store_true",
+        help="Tail the run_dir while it is written; rolling report every --interval s (no workers / cache / resume)",
+    )
+    ap.add_argument("--interval", type=float, default=5.0, help="--follow: seconds between rolling reports")
+    ap.add_argument(
+        "--idle_timeout", type=float, default=0.0, help="--follow: stop after N s without new data (0 = until SIGINT)"
+    )
     args = ap.parse_args()
 
     run_dir = Path(args.run_dir).expanduser().resolve()
@@ -183,19 +376,32 @@ def main() -> int:
         print(f"ERROR: run_dir not found: {run_dir}", file=sys.stderr)
         return 1
 
-    verdict, errors, warnings, stats = verify(run_dir, args.min_ticks, args.max_backward_ms)
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
 
-    report = {
-        "tool": "verify_tick_loop_v0",
-        "generated_at_utc": _ts_utc(),
-        "run_dir": str(run_dir),
-        "verdict": verdict,
-        "min_ticks": args.min_ticks,
-        "max_backward_ms": args.max_backward_ms,
-        "stats": stats,
-        "errors": errors,
-        "warnings": warnings,
-    }
+    if args.follow:
+        if args.interval <= 0 or args.idle_timeout < 0:
+            print(f"ERROR: need --interval > 0 and --idle_timeout >= 0, got {args.interval}, {args.idle_timeout}", file=sys.stderr)
+            return 1
+        report, code = follow_report(
+            run_dir,
+            args.min_ticks,
+            args.max_backward_ms,
+            args.interval,
+            args.idle_timeout,
+            emit=lambda r: print(json.dumps(r, ensure_ascii=False), flush=True),
+        )
+    else:
+        report, code = verify_report(
+            run_dir,
+            args.min_ticks,
+            args.max_backward_ms,
+            args.workers,
+            use_cache=(False if args.no_report_cache else None),
+            refresh_cache=args.refresh_report_cache,
+            resume=args.resume,
+        )
 
     if out_path is not None:
         out_path.parent.mkdir(parents=True, exist_ok=True)
@@ -203,12 +409,9 @@ def main() -> int:
 
     print(json.dumps(report, ensure_ascii=False))
 
-    if verdict == "FAIL":
-        return 2
-    if verdict == "NOT_MEASURABLE":
+    if report["verdict"] == "NOT_MEASURABLE":
         print("WARNING: verdict=NOT_MEASURABLE (evidence valid but degraded)", file=sys.stderr)
-        return 0
-    return 0
+    return code
 
 
 if __name__ == "__main__":
@@ -15,7 +15,9 @@ import json
 import sys
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
+
+from evidence_io_v0 import count_jsonl, evidence_exists, iter_jsonl
 
 
 def _ts_utc() -> str:
@@ -30,42 +32,20 @@ def _read_json(path: Path) -> Dict[str, Any]:
     return obj
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
-def _count_jsonl(path: Path) -> int:
-    n = 0
-    for _ln, _rec in _iter_jsonl(path):
-        n += 1
-    return n
-
-
 def verify(run_dir: Path, steps_target: int) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
     errors: List[str] = []
     warnings: List[str] = []
     stats: Dict[str, Any] = {}
 
     required = ["run_manifest.json", "errors.jsonl", "life_tick_summary.jsonl", "life_run_summary.json"]
-    missing = [x for x in required if not (run_dir / x).exists()]
+    missing = [x for x in required if not evidence_exists(run_dir / x)]
     if missing:
         errors.extend([f"missing required file: {x}" for x in missing])
         return "FAIL", errors, warnings, stats
 
     # strict jsonl for errors
     try:
-        stats["errors_count"] = _count_jsonl(run_dir / "errors.jsonl")
+        stats["errors_count"] = count_jsonl(run_dir / "errors.jsonl")
     except Exception as e:
         errors.append(f"errors.jsonl strict-jsonl failed: {e}")
 
@@ -94,7 +74,7 @@ def verify(run_dir: Path, steps_target: int) -> Tuple[str, List[str], List[str],
     extinction_tick_first: Optional[int] = None
 
     try:
-        for line_no, rec in _iter_jsonl(run_dir / "life_tick_summary.jsonl"):
+        for line_no, rec in iter_jsonl(run_dir / "life_tick_summary.jsonl"):
             tick_count += 1
             tid = rec.get("tick_id")
             alive = rec.get("alive_count")
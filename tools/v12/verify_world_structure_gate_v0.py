@@ -22,28 +22,16 @@ import sys
 from datetime import datetime, timezone
 from pathlib import Path
 from statistics import mean, pstdev
-from typing import Any, Dict, Iterable, List, Optional, Tuple
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from evidence_io_v0 import evidence_exists
+from gate_engine_v0 import Gate, gate_report, run_gates
 
 
 def _ts_utc() -> str:
     return datetime.now(timezone.utc).isoformat().replace("+00:00", "Z")
 
 
-def _iter_jsonl(path: Path) -> Iterable[Tuple[int, Dict[str, Any]]]:
-    with path.open("r", encoding="utf-8") as f:
-        for line_no, raw in enumerate(f, 1):
-            s = raw.strip()
-            if not s:
-                continue
-            try:
-                obj = json.loads(s)
-            except json.JSONDecodeError as e:
-                raise ValueError(f"Invalid JSONL at {path} line {line_no}: {e}") from e
-            if not isinstance(obj, dict):
-                raise ValueError(f"JSONL record must be an object at {path} line {line_no}")
-            yield line_no, obj
-
-
 def _read_json(path: Path) -> Dict[str, Any]:
     with path.open("r", encoding="utf-8") as f:
         obj = json.load(f)
@@ -116,76 +104,147 @@ def _stats(values: List[float]) -> Dict[str, Any]:
     }
 
 
+def _last_px_slice(rows: Iterable[Tuple[int, Dict[str, Any]]]) -> Tuple[int, int, List[float]]:
+    px: List[float] = []
+    bad_px = 0
+    total = 0
+    for _ln, rec in rows:
+        total += 1
+        v = _safe_float(rec.get("last_px"))
+        if v is None or v <= 0:
+            bad_px += 1
+            continue
+        px.append(v)
+    return total, bad_px, px
+
+
+class WorldStructureGate(Gate):
+    """W0 checks as a gate_engine_v0 gate (market_snapshot: last_px)."""
+
+    tool = "verify_world_structure_gate_v0"
+    not_measurable_warning = "world structure too flat / not enough samples"
+
+    def __init__(
+        self,
+        market_snapshot_jsonl: Path,
+        k_windows: List[int],
+        p99_threshold: float,
+        min_samples: int,
+    ) -> None:
+        super().__init__()
+        self.market_snapshot_jsonl = market_snapshot_jsonl
+        self.k_windows = k_windows
+        self.p99_threshold = p99_threshold
+        self.min_samples = min_samples
+        self._px: List[float] = []
+        self._bad_px = 0
+        self._total = 0
+        self._error: Optional[Exception] = None
+        self.inputs = (market_snapshot_jsonl.name,)
+        if evidence_exists(market_snapshot_jsonl):
+            self.files = (market_snapshot_jsonl.name,)
+
+    def params(self) -> Dict[str, Any]:
+        return {"k_windows": self.k_windows, "p99_threshold": self.p99_threshold, "min_samples": self.min_samples}
+
+    def reader(self, name: str) -> Optional[Callable[[Iterable[Any]], Any]]:
+        return _last_px_slice
+
+    def update(self, name: str, part: Tuple[int, int, List[float]]) -> None:
+        total, bad_px, px = part
+        self._total += total
+        self._bad_px += bad_px
+        self._px.extend(px)
+
+    def fail(self, name: str, exc: Exception) -> None:
+        self._error = exc
+
+    def finalize(self) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
+        k_windows = self.k_windows
+        p99_threshold = self.p99_threshold
+        min_samples = self.min_samples
+        errors: List[str] = []
+        warnings: List[str] = []
+        stats: Dict[str, Any] = {}
+
+        if not self.files:
+            return "FAIL", [f"missing required file: {self.market_snapshot_jsonl}"], warnings, stats
+        if self._error is not None:
+            return "FAIL", [f"market_snapshot.jsonl strict-jsonl failed: {self._error}"], warnings, stats
+
+        px = self._px
+        stats["input"] = {
+            "record_count": self._total,
+            "last_px_valid_count": len(px),
+            "last_px_invalid_count": self._bad_px,
+        }
+
+        if len(px) < max(k_windows) + 2:
+            errors.append(f"insufficient valid last_px samples: {len(px)} for k_max={max(k_windows)}")
+            return "FAIL", errors, warnings, stats
+
+        per_k: Dict[str, Any] = {}
+        primary_k = max(k_windows)
+        primary_p99: Optional[float] = None
+
+        for k in sorted(set(k_windows)):
+            vals = _compute_abs_log_returns(px, k)
+            per_k[str(k)] = _stats(vals)
+            if k == primary_k:
+                primary_p99 = per_k[str(k)].get("p99")
+
+        stats["abs_log_return_by_k"] = per_k
+        stats["primary_k"] = primary_k
+        stats["primary_p99_threshold"] = p99_threshold
+        stats["min_samples"] = min_samples
+
+        # sample gate: ensure primary stats have enough samples
+        primary_count = int(per_k[str(primary_k)].get("count", 0))
+        if primary_count < min_samples:
+            warnings.append(f"primary_k sample_count < min_samples: {primary_count} < {min_samples}")
+            return "NOT_MEASURABLE", errors, warnings, stats
+
+        if primary_p99 is None:
+            warnings.append("primary_k p99 missing")
+            return "NOT_MEASURABLE", errors, warnings, stats
+
+        if float(primary_p99) < p99_threshold:
+            warnings.append(
+                f"world_structure_too_flat:last_px_abs_log_return_p99_lt_threshold "
+                f"(p99={float(primary_p99):.10f} < {p99_threshold})"
+            )
+            return "NOT_MEASURABLE", errors, warnings, stats
+
+        return "PASS", errors, warnings, stats
+
+    def report(self, result: Tuple[str, List[str], List[str], Dict[str, Any]]) -> Dict[str, Any]:
+        verdict, errors, warnings, stats = result
+        return {
+            "tool": self.tool,
+            "generated_at_utc": _ts_utc(),
+            "input_path": str(self.market_snapshot_jsonl.parent),
+            "market_snapshot_jsonl": str(self.market_snapshot_jsonl),
+            "verdict": verdict,
+            "k_windows": self.k_windows,
+            "primary_k": stats.get("primary_k"),
+            "p99_threshold": self.p99_threshold,
+            "min_samples": self.min_samples,
+            "stats": stats,
+            "errors": errors,
+            "warnings": warnings,
+        }
+
+
 def verify(
     market_snapshot_jsonl: Path,
     k_windows: List[int],
     p99_threshold: float,
     min_samples: int,
+    workers: int = 1,
 ) -> Tuple[str, List[str], List[str], Dict[str, Any]]:
-    errors: List[str] = []
-    warnings: List[str] = []
-    stats: Dict[str, Any] = {}
-
-    if not market_snapshot_jsonl.exists():
-        return "FAIL", [f"missing required file: {market_snapshot_jsonl}"], warnings, stats
-
-    px: List[float] = []
-    bad_px = 0
-    total = 0
-    try:
-        for _ln, rec in _iter_jsonl(market_snapshot_jsonl):
-            total += 1
-            v = _safe_float(rec.get("last_px"))
-            if v is None or v <= 0:
-                bad_px += 1
-                continue
-            px.append(v)
-    except Exception as e:
-        return "FAIL", [f"market_snapshot.jsonl strict-jsonl failed: {e}"], warnings, stats
-
-    stats["input"] = {
-        "record_count": total,
-        "last_px_valid_count": len(px),
-        "last_px_invalid_count": bad_px,
-    }
-
-    if len(px) < max(k_windows) + 2:
-        errors.append(f"insufficient valid last_px samples: {len(px)} for k_max={max(k_windows)}")
-        return "FAIL", errors, warnings, stats
-
-    per_k: Dict[str, Any] = {}
-    primary_k = max(k_windows)
-    primary_p99: Optional[float] = None
-
-    for k in sorted(set(k_windows)):
-        vals = _compute_abs_log_returns(px, k)
-        per_k[str(k)] = _stats(vals)
-        if k == primary_k:
-            primary_p99 = per_k[str(k)].get("p99")
-
-    stats["abs_log_return_by_k"] = per_k
-    stats["primary_k"] = primary_k
-    stats["primary_p99_threshold"] = p99_threshold
-    stats["min_samples"] = min_samples
-
-    # sample gate: ensure primary stats have enough samples
-    primary_count = int(per_k[str(primary_k)].get("count", 0))
-    if primary_count < min_samples:
-        warnings.append(f"primary_k sample_count < min_samples: {primary_count} < {min_samples}")
-        return "NOT_MEASURABLE", errors, warnings, stats
-
-    if primary_p99 is None:
-        warnings.append("primary_k p99 missing")
-        return "NOT_MEASURABLE", errors, warnings, stats
-
-    if float(primary_p99) < p99_threshold:
-        warnings.append(
-            f"world_structure_too_flat:last_px_abs_log_return_p99_lt_threshold "
-            f"(p99={float(primary_p99):.10f} < {p99_threshold})"
-        )
-        return "NOT_MEASURABLE", errors, warnings, stats
-
-    return "PASS", errors, warnings, stats
+    gate = WorldStructureGate(market_snapshot_jsonl, k_windows, p99_threshold, min_samples)
+    run_gates(market_snapshot_jsonl.parent, [gate], workers)
+    return gate.finalize()
 
 
 def main() -> int:
@@ -202,6 +261,11 @@ def main() -> int:
     )
     ap.add_argument("--min_samples", type=int, default=1000, help="Minimum primary-k samples required (default 1000)")
     ap.add_argument("--output", default="", help="Optional report output path")
+    ap.add_argument(
+        "--workers", type=int, default=1, help="Parse large JSONL files in N processes (1 = serial, 0 = all CPUs)"
+    )
+    ap.add_argument("--no_report_cache", action="store_true", help="Neither read nor write the verifier report cache")
+    ap.add_argument("--refresh_report_cache", action="store_true", help="Ignore a cached report; verify and overwrite it")
     args = ap.parse_args()
 
     k_windows: List[int] = []
@@ -213,6 +277,9 @@ def main() -> int:
     if not k_windows:
         print("ERROR: k_windows is empty", file=sys.stderr)
         return 1
+    if args.workers < 0:
+        print(f"ERROR: --workers must be >= 0, got {args.workers}", file=sys.stderr)
+        return 1
 
     base_dir = Path(args.dataset_dir or args.run_dir).expanduser().resolve()
     if not base_dir.exists():
@@ -220,27 +287,9 @@ def main() -> int:
         return 1
 
     market_snapshot_jsonl = base_dir / "market_snapshot.jsonl"
-    verdict, errors, warnings, stats = verify(
-        market_snapshot_jsonl=market_snapshot_jsonl,
-        k_windows=k_windows,
-        p99_threshold=args.p99_threshold,
-        min_samples=args.min_samples,
-    )
-
-    report = {
-        "tool": "verify_world_structure_gate_v0",
-        "generated_at_utc": _ts_utc(),
-        "input_path": str(base_dir),
-        "market_snapshot_jsonl": str(market_snapshot_jsonl),
-        "verdict": verdict,
-        "k_windows": k_windows,
-        "primary_k": stats.get("primary_k"),
-        "p99_threshold": args.p99_threshold,
-        "min_samples": args.min_samples,
-        "stats": stats,
-        "errors": errors,
-        "warnings": warnings,
-    }
+    gate = WorldStructureGate(market_snapshot_jsonl, k_windows, args.p99_threshold, args.min_samples)
+    report, code = gate_report(base_dir, gate, args.workers, use_cache=(False if args.no_report_cache else None), refresh_cache=args.refresh_report_cache)
+    verdict = report["verdict"]
 
     out_path = Path(args.output).expanduser().resolve() if args.output else None
     if out_path is not None:
@@ -249,12 +298,9 @@ def main() -> int:
 
     print(json.dumps(report, ensure_ascii=False))
 
-    if verdict == "FAIL":
-        return 2
     if verdict == "NOT_MEASURABLE":
         print("WARNING: verdict=NOT_MEASURABLE (world structure too flat / not enough samples)", file=sys.stderr)
-        return 0
-    return 0
+    return code
 
 
 if __name__ == "__main__":
@@ -15,16 +15,28 @@ Gate order (cannot change):
   4) Join Closure
   5) Channel Availability
   6) Reason Consistency
+
+The spec is compiled once (compile_spec) into field tuples, per-field type-check
+callables and a frozenset reason-code enum; every run_dir is verified against the
+compiled spec. evidence.json is parsed incrementally, one array element at a time,
+and gates 3-6 run as streaming per-record checks (constant memory in the capture
+size; a syntax error stops the read where it is found). Batch mode (--batch_run_dirs /
+--batch_run_dirs_file) verifies many run_dirs against one loaded spec over --jobs
+worker processes and writes one verdict JSON per run_dir plus summary.json to
+--batch_output_dir.
 """
 
 from __future__ import annotations
 
 import argparse
 import json
+import os
+from concurrent.futures import ProcessPoolExecutor
 from dataclasses import dataclass
+from functools import partial
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, FrozenSet, Iterator, List, Set, Tuple
 
 
 def _utc_now() -> str:
@@ -62,44 +74,215 @@ def _load_spec(spec_path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def _fail(verdict: str, reason_code: str, allowed: List[str]) -> Tuple[str, List[str]]:
-    # Reason codes must always be enum-valid (fail-closed).
-    if reason_code not in allowed:
-        return "FAIL", ["fail:invalid_reason_code"]
-    return verdict, [reason_code]
+def _is_str(value: Any) -> bool:
+    return isinstance(value, str)
 
 
-def _type_ok(value: Any, t: str) -> bool:
-    if t == "str":
-        return isinstance(value, str)
-    if t == "list":
-        return isinstance(value, list)
+def _is_list(value: Any) -> bool:
+    return isinstance(value, list)
+
+
+def _never(value: Any) -> bool:
     return False
 
 
-def main() -> None:
-    ap = argparse.ArgumentParser()
-    ap.add_argument("--run_dir", required=True, help="Directory containing evidence.json")
-    ap.add_argument(
-        "--spec_json",
-        required=False,
-        default="/Users/liugang/Cursor_Store/Prometheus-Research/docs/v13/spec/world_contract_v0_2_spec.json",
-    )
-    ap.add_argument("--output_json", required=False, default="")
-    args = ap.parse_args()
+# Spec type name -> check (module-level so a CompiledSpec pickles to batch workers);
+# unknown type names never match (fail-closed).
+_TYPE_CHECKS: Dict[str, Callable[[Any], bool]] = {"str": _is_str, "list": _is_list}
 
-    run_dir = Path(args.run_dir)
-    spec_path = Path(args.spec_json)
-    spec = _load_spec(spec_path)
 
-    allowed_reason_codes: List[str] = list(spec["reason_codes_enum"])
-    required_files: List[str] = list(spec["required_files"])
+def _type_check(t: Any) -> Callable[[Any], bool]:
+    return _TYPE_CHECKS.get(t, _never) if isinstance(t, str) else _never
+
+
+@dataclass(frozen=True)
+class CompiledSpec:
+    spec_path: str
+    contract_version: str
+    allowed_reason_codes: FrozenSet[str]
+    required_files: Tuple[str, ...]
+    required_fields: FrozenSet[str]
+    typed_fields: Tuple[Tuple[str, Callable[[Any], bool]], ...]
+    join_key: str
+    required_channels: Tuple[str, ...]
+
+
+def compile_spec(spec: Dict[str, Any], spec_path: Path) -> CompiledSpec:
     required_fields: List[str] = list(spec["canonical_schema"]["required_fields"])
     types: Dict[str, str] = dict(spec["canonical_schema"]["types"])
     required_join_keys: List[str] = list(spec["required_join_keys"])
-    required_channels: List[str] = list(spec["required_channels"])
+    return CompiledSpec(
+        spec_path=str(spec_path),
+        contract_version=str(spec["contract_version"]),
+        allowed_reason_codes=frozenset(spec["reason_codes_enum"]),
+        required_files=tuple(spec["required_files"]),
+        required_fields=frozenset(required_fields),
+        typed_fields=tuple((k, _type_check(types[k])) for k in required_fields if k in types),
+        join_key=required_join_keys[0] if required_join_keys else "strategy_id",
+        required_channels=tuple(spec["required_channels"]),
+    )
+
+
+def _fail(verdict: str, reason_code: str, allowed: FrozenSet[str]) -> Tuple[str, List[str]]:
+    # Reason codes must always be enum-valid (fail-closed).
+    if reason_code not in allowed:
+        return "FAIL", ["fail:invalid_reason_code"]
+    return verdict, [reason_code]
+
+
+# JSON insignificant whitespace (json.loads skips exactly these, not str.isspace()).
+_WS = " \t\n\r"
+_CHUNK_CHARS = 1 << 20
+# A JSONDecodeError or element end this close to the end of a not-yet-complete buffer may
+# be truncation (literal, \uXXXX escape, number cut by the chunk boundary): read more, retry.
+_TRUNCATION_MARGIN = 16
+
+
+class _NotAnArray(Exception):
+    """evidence.json is valid JSON but its top level is not an array."""
+
+
+def _iter_json_array(path: Path, chunk_chars: int = _CHUNK_CHARS) -> Iterator[Any]:
+    """
+    Yield the elements of the top-level JSON array in `path` one at a time, keeping only
+    the current element's text in memory. Accepts / rejects exactly what json.loads on
+    the whole file would: syntax and decode errors raise (ValueError / UnicodeDecodeError /
+    RecursionError), a valid non-array document raises _NotAnArray. Elements are yielded
+    before the rest of the file is checked, so a parse error can follow yielded elements.
+    """
+    decoder = json.JSONDecoder()
+    with path.open("r", encoding="utf-8") as f:
+        buf = ""
+        pos = 0
+        eof = False
+
+        def _fill(min_chars: int) -> None:
+            nonlocal buf, pos, eof
+            if pos:
+                buf = buf[pos:]
+                pos = 0
+            more = f.read(max(chunk_chars, min_chars))
+            if more:
+                buf += more
+            else:
+                eof = True
+
+        def _skip_ws() -> bool:
+            # advance past whitespace; False at end of file
+            nonlocal pos
+            while True:
+                while pos < len(buf) and buf[pos] in _WS:
+                    pos += 1
+                if pos < len(buf):
+                    return True
+                if eof:
+                    return False
+                _fill(0)
+
+        if not _skip_ws() or buf[pos] != "[":
+            # not an array (or not JSON): json.loads the whole document decides which
+            json.loads(buf + f.read())
+            raise _NotAnArray()
+        pos += 1
+        if not _skip_ws():
+            raise json.JSONDecodeError("Expecting value", buf, pos)
+        if buf[pos] == "]":
+            pos += 1
+        else:
+            while True:
+                try:
+                    obj, end = decoder.raw_decode(buf, pos)
+                except json.JSONDecodeError as e:
+                    if eof or (e.pos < len(buf) - _TRUNCATION_MARGIN and not e.msg.startswith("Unterminated string")):
+                        raise
+                    _fill(len(buf))  # grow geometrically so a huge element is re-scanned O(log n) times
+                    continue
+                if end > len(buf) - _TRUNCATION_MARGIN and not eof:
+                    _fill(len(buf))  # a number cut by the chunk boundary ("1.", "2e-") decodes short
+                    continue
+                pos = end
+                yield obj
+                if not _skip_ws():
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos)
+                c = buf[pos]
+                pos += 1
+                if c == "]":
+                    break
+                if c != ",":
+                    raise json.JSONDecodeError("Expecting ',' delimiter", buf, pos - 1)
+                if not _skip_ws():
+                    raise json.JSONDecodeError("Expecting value", buf, pos)
+        if _skip_ws():
+            raise json.JSONDecodeError("Extra data", buf, pos)
+
+
+class _GateChecks:
+    """
+    Gates 3-6 as per-record checks over the evidence stream. Each gate keeps its first
+    failure; a record only runs the gates ranked before the lowest failed gate so far,
+    since a later gate's result can no longer decide the verdict.
+    """
+
+    def __init__(self, cs: CompiledSpec) -> None:
+        self.cs = cs
+        self.failed = 7  # lowest failed gate number (7 = none)
+        self.failure: Tuple[str, List[str]] = ("PASS", [])
+        self.strategy_ids: Set[str] = set()
+        self.missing_counts: Dict[str, int] = {c: 0 for c in cs.required_channels}
+
+    def _fail_gate(self, gate: int, verdict: str, reason_code: str) -> None:
+        self.failed = gate
+        self.failure = _fail(verdict, reason_code, self.cs.allowed_reason_codes)
+
+    def feed(self, obj: Any) -> None:
+        cs = self.cs
+        # Gate 3) Schema Verification
+        if not isinstance(obj, dict):
+            self._fail_gate(3, "FAIL", "fail:schema_type_mismatch")
+            return
+        if not cs.required_fields <= obj.keys():
+            self._fail_gate(3, "FAIL", "fail:schema_field_missing")
+            return
+        for k, ok in cs.typed_fields:
+            if not ok(obj[k]):
+                self._fail_gate(3, "FAIL", "fail:schema_type_mismatch")
+                return
+        if self.failed <= 4:
+            return
+        # Gate 4) Join Closure
+        sid = obj.get(cs.join_key)
+        if not isinstance(sid, str) or not sid.strip():
+            self._fail_gate(4, "FAIL", "fail:join_key_missing")
+            return
+        self.strategy_ids.add(sid)
+        if self.failed <= 5:
+            return
+        # Gate 5) Channel Availability
+        channels = obj.get("channels", [])
+        if not isinstance(channels, list):
+            # schema gate should have caught, but keep fail-closed
+            self._fail_gate(5, "FAIL", "fail:schema_type_mismatch")
+            return
+        ch_set = {str(x) for x in channels}
+        for c in cs.required_channels:
+            if c not in ch_set:
+                self.missing_counts[c] += 1
+        if self.failed <= 6:
+            return
+        # Gate 6) Reason Consistency
+        # Rule: if all gates passed but evidence carries any reason codes, FAIL.
+        rcs = obj.get("contract_reason_codes", [])
+        if not isinstance(rcs, list):
+            self._fail_gate(6, "FAIL", "fail:schema_type_mismatch")
+        elif rcs:
+            # enum-checked or not, any carried code is an invalid_reason_code
+            self._fail_gate(6, "FAIL", "fail:invalid_reason_code")
 
+
+def verify_run(run_dir: Path, cs: CompiledSpec) -> Verdict:
+    """Run the frozen gates on one run_dir; the first failing gate produces the verdict."""
     evidence_path = run_dir / "evidence.json"
+    allowed = cs.allowed_reason_codes
 
     stats: Dict[str, Any] = {
         "gate": None,
@@ -108,240 +291,168 @@ def main() -> None:
         "missing_channels_counts": {},
     }
 
-    # Gate 1) Required Files
-    stats["gate"] = "Required Files"
-    for rf in required_files:
-        p = run_dir / rf
-        if not p.exists():
-            v, rc = _fail("FAIL", "fail:evidence_file_missing", allowed_reason_codes)
-            out = Verdict(
-                tool="verify_world_contract_v0_2",
-                generated_at_utc=_utc_now(),
-                spec_path=str(spec_path),
-                contract_version=str(spec["contract_version"]),
-                run_dir=str(run_dir),
-                evidence_path=str(evidence_path),
-                verdict=v,
-                reason_codes=rc,
-                stats=stats,
-            )
-            s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-            if args.output_json:
-                Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-            else:
-                print(s)
-            return
-
-    # Gate 2) Evidence Parse
-    stats["gate"] = "Evidence Parse"
-    try:
-        raw = evidence_path.read_text(encoding="utf-8")
-        evidence = json.loads(raw)
-    except Exception:
-        v, rc = _fail("FAIL", "fail:evidence_parse_error", allowed_reason_codes)
-        out = Verdict(
+    def _verdict(v: str, rc: List[str]) -> Verdict:
+        return Verdict(
             tool="verify_world_contract_v0_2",
             generated_at_utc=_utc_now(),
-            spec_path=str(spec_path),
-            contract_version=str(spec["contract_version"]),
+            spec_path=cs.spec_path,
+            contract_version=cs.contract_version,
             run_dir=str(run_dir),
             evidence_path=str(evidence_path),
             verdict=v,
             reason_codes=rc,
             stats=stats,
         )
-        s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-        if args.output_json:
-            Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-        else:
-            print(s)
-        return
 
-    if not isinstance(evidence, list):
-        v, rc = _fail("FAIL", "fail:schema_type_mismatch", allowed_reason_codes)
-        out = Verdict(
-            tool="verify_world_contract_v0_2",
-            generated_at_utc=_utc_now(),
-            spec_path=str(spec_path),
-            contract_version=str(spec["contract_version"]),
-            run_dir=str(run_dir),
-            evidence_path=str(evidence_path),
-            verdict=v,
-            reason_codes=rc,
-            stats=stats,
-        )
-        s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-        if args.output_json:
-            Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-        else:
-            print(s)
-        return
+    # Gate 1) Required Files
+    stats["gate"] = "Required Files"
+    for rf in cs.required_files:
+        if not (run_dir / rf).exists():
+            return _verdict(*_fail("FAIL", "fail:evidence_file_missing", allowed))
 
-    stats["records"] = len(evidence)
+    # Gate 2) Evidence Parse
+    # evidence.json is streamed element by element into gates 3-6; a parse error anywhere
+    # still outranks them, and stats.records counts the whole array, so once a gate has
+    # failed the remaining elements are only parsed and counted.
+    stats["gate"] = "Evidence Parse"
+    checks = _GateChecks(cs)
+    records = 0
+    elements = _iter_json_array(evidence_path)
+    while True:
+        try:
+            obj = next(elements)
+        except StopIteration:
+            break
+        except _NotAnArray:
+            return _verdict(*_fail("FAIL", "fail:schema_type_mismatch", allowed))
+        except Exception:
+            return _verdict(*_fail("FAIL", "fail:evidence_parse_error", allowed))
+        records += 1
+        if checks.failed > 3:
+            checks.feed(obj)
+
+    stats["records"] = records
 
     # Gate 3) Schema Verification
     stats["gate"] = "Schema Verification"
-    for obj in evidence:
-        if not isinstance(obj, dict):
-            v, rc = _fail("FAIL", "fail:schema_type_mismatch", allowed_reason_codes)
-            break
-        missing = [k for k in required_fields if k not in obj]
-        if missing:
-            v, rc = _fail("FAIL", "fail:schema_field_missing", allowed_reason_codes)
-            break
-        bad_types = []
-        for k in required_fields:
-            if k in types and not _type_ok(obj.get(k), types[k]):
-                bad_types.append(k)
-        if bad_types:
-            v, rc = _fail("FAIL", "fail:schema_type_mismatch", allowed_reason_codes)
-            break
-    else:
-        v, rc = "PASS", []
-
-    if v != "PASS":
-        out = Verdict(
-            tool="verify_world_contract_v0_2",
-            generated_at_utc=_utc_now(),
-            spec_path=str(spec_path),
-            contract_version=str(spec["contract_version"]),
-            run_dir=str(run_dir),
-            evidence_path=str(evidence_path),
-            verdict=v,
-            reason_codes=rc,
-            stats=stats,
-        )
-        s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-        if args.output_json:
-            Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-        else:
-            print(s)
-        return
+    if checks.failed == 3:
+        return _verdict(*checks.failure)
 
     # Gate 4) Join Closure
     stats["gate"] = "Join Closure"
-    join_key = required_join_keys[0] if required_join_keys else "strategy_id"
-    strategy_ids: List[str] = []
-    for obj in evidence:
-        sid = obj.get(join_key)
-        if not isinstance(sid, str) or not sid.strip():
-            v, rc = _fail("FAIL", "fail:join_key_missing", allowed_reason_codes)
-            out = Verdict(
-                tool="verify_world_contract_v0_2",
-                generated_at_utc=_utc_now(),
-                spec_path=str(spec_path),
-                contract_version=str(spec["contract_version"]),
-                run_dir=str(run_dir),
-                evidence_path=str(evidence_path),
-                verdict=v,
-                reason_codes=rc,
-                stats=stats,
-            )
-            s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-            if args.output_json:
-                Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-            else:
-                print(s)
-            return
-        strategy_ids.append(sid)
-    stats["unique_strategy_id_count"] = len(set(strategy_ids))
+    if checks.failed == 4:
+        return _verdict(*checks.failure)
+    stats["unique_strategy_id_count"] = len(checks.strategy_ids)
 
     # Gate 5) Channel Availability
     stats["gate"] = "Channel Availability"
-    missing_counts: Dict[str, int] = {c: 0 for c in required_channels}
-    for obj in evidence:
-        channels = obj.get("channels", [])
-        if not isinstance(channels, list):
-            # schema gate should have caught, but keep fail-closed
-            v, rc = _fail("FAIL", "fail:schema_type_mismatch", allowed_reason_codes)
-            out = Verdict(
-                tool="verify_world_contract_v0_2",
-                generated_at_utc=_utc_now(),
-                spec_path=str(spec_path),
-                contract_version=str(spec["contract_version"]),
-                run_dir=str(run_dir),
-                evidence_path=str(evidence_path),
-                verdict=v,
-                reason_codes=rc,
-                stats=stats,
-            )
-            s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-            if args.output_json:
-                Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-            else:
-                print(s)
-            return
-
-        ch_set = {str(x) for x in channels}
-        for c in required_channels:
-            if c not in ch_set:
-                missing_counts[c] += 1
-
+    if checks.failed == 5:
+        return _verdict(*checks.failure)
+    missing_counts = checks.missing_counts
     stats["missing_channels_counts"] = missing_counts
-    for c in required_channels:
+    for c in cs.required_channels:
         if missing_counts[c] > 0:
             # NOT_MEASURABLE is world refusal/silence channel missing.
-            rc_code = f"not_measurable:channel_missing:{c}"
-            v, rc = _fail("NOT_MEASURABLE", rc_code, allowed_reason_codes)
-            out = Verdict(
-                tool="verify_world_contract_v0_2",
-                generated_at_utc=_utc_now(),
-                spec_path=str(spec_path),
-                contract_version=str(spec["contract_version"]),
-                run_dir=str(run_dir),
-                evidence_path=str(evidence_path),
-                verdict=v,
-                reason_codes=rc,
-                stats=stats,
-            )
-            s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-            if args.output_json:
-                Path(args.output_json).write_text(s + "\n", encoding="utf-8")
-            else:
-                print(s)
-            return
+            return _verdict(*_fail("NOT_MEASURABLE", f"not_measurable:channel_missing:{c}", allowed))
 
     # Gate 6) Reason Consistency
     stats["gate"] = "Reason Consistency"
-    # Rule: if all gates passed but evidence carries any reason codes, FAIL.
-    for obj in evidence:
-        rcs = obj.get("contract_reason_codes", [])
-        if not isinstance(rcs, list):
-            v, rc = _fail("FAIL", "fail:schema_type_mismatch", allowed_reason_codes)
-            break
-        # enum-check any provided codes
-        for code in rcs:
-            if str(code) not in allowed_reason_codes:
-                v, rc = _fail("FAIL", "fail:invalid_reason_code", allowed_reason_codes)
-                break
-        else:
-            # enum ok, now consistency check
-            if len(rcs) > 0:
-                v, rc = _fail("FAIL", "fail:invalid_reason_code", allowed_reason_codes)
-                break
-            continue
-        break
-    else:
-        v, rc = "PASS", []
+    return _verdict(*checks.failure)
 
-    out = Verdict(
-        tool="verify_world_contract_v0_2",
-        generated_at_utc=_utc_now(),
-        spec_path=str(spec_path),
-        contract_version=str(spec["contract_version"]),
-        run_dir=str(run_dir),
-        evidence_path=str(evidence_path),
-        verdict=v,
-        reason_codes=rc,
-        stats=stats,
-    )
+
+def _write_verdict(out: Verdict, output_json: str) -> None:
     s = json.dumps(out.to_json(), ensure_ascii=False, sort_keys=True)
-    if args.output_json:
-        Path(args.output_json).write_text(s + "\n", encoding="utf-8")
+    if output_json:
+        Path(output_json).write_text(s + "\n", encoding="utf-8")
     else:
         print(s)
 
 
+def _verify_batch_item(cs: CompiledSpec, item: Tuple[str, str]) -> Dict[str, Any]:
+    run_dir, output_json = item
+    out = verify_run(Path(run_dir), cs)
+    _write_verdict(out, output_json)
+    return {
+        "run_dir": out.run_dir,
+        "verdict": out.verdict,
+        "reason_codes": out.reason_codes,
+        "verdict_json": output_json,
+    }
+
+
+def _load_batch_run_dirs(args: argparse.Namespace) -> List[str]:
+    run_dirs = [x.strip() for x in args.batch_run_dirs.split(",") if x.strip()]
+    if args.batch_run_dirs_file:
+        lines = Path(args.batch_run_dirs_file).read_text(encoding="utf-8").splitlines()
+        run_dirs += [x.strip() for x in lines if x.strip() and not x.strip().startswith("#")]
+    return run_dirs
+
+
+def _run_batch(args: argparse.Namespace, cs: CompiledSpec, run_dirs: List[str]) -> None:
+    out_dir = Path(args.batch_output_dir)
+    out_dir.mkdir(parents=True, exist_ok=True)
+    # index prefix keeps verdict files distinct when run_dirs share a basename
+    items = [(rd, str(out_dir / f"{i:04d}_{Path(rd).name}.verdict.json")) for i, rd in enumerate(run_dirs)]
+    check = partial(_verify_batch_item, cs)
+    jobs = min(args.jobs if args.jobs > 0 else (os.cpu_count() or 1), len(items))
+    if jobs <= 1:
+        results = [check(item) for item in items]
+    else:
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            results = list(pool.map(check, items))
+
+    counts = {v: 0 for v in ("PASS", "NOT_MEASURABLE", "FAIL")}
+    for r in results:
+        counts[r["verdict"]] += 1
+    summary = {
+        "tool": "verify_world_contract_v0_2",
+        "generated_at_utc": _utc_now(),
+        "spec_path": cs.spec_path,
+        "contract_version": cs.contract_version,
+        "run_count": len(results),
+        "verdict_counts": counts,
+        "results": results,
+    }
+    s = json.dumps(summary, ensure_ascii=False, sort_keys=True)
+    (out_dir / "summary.json").write_text(s + "\n", encoding="utf-8")
+    print(s)
+
+
+def main() -> None:
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--run_dir", required=False, default="", help="Directory containing evidence.json")
+    ap.add_argument(
+        "--spec_json",
+        required=False,
+        default="/Users/liugang/Cursor_Store/Prometheus-Research/docs/v13/spec/world_contract_v0_2_spec.json",
+    )
+    ap.add_argument("--output_json", required=False, default="")
+    ap.add_argument("--batch_run_dirs", default="", help="Batch mode: comma-separated run_dirs")
+    ap.add_argument("--batch_run_dirs_file", default="", help="Batch mode: file with one run_dir per line")
+    ap.add_argument("--batch_output_dir", default="", help="Batch mode: directory for per-run verdict JSONs + summary.json")
+    ap.add_argument("--jobs", type=int, default=1, help="Batch mode: verify N run_dirs concurrently (1 = serial, 0 = all CPUs)")
+    args = ap.parse_args()
+
+    batch = bool(args.batch_run_dirs or args.batch_run_dirs_file)
+    if batch == bool(args.run_dir):
+        ap.error("provide exactly one of --run_dir or --batch_run_dirs/--batch_run_dirs_file")
+    if batch and not args.batch_output_dir:
+        ap.error("batch mode requires --batch_output_dir")
+    if args.jobs < 0:
+        ap.error(f"--jobs must be >= 0, got {args.jobs}")
+
+    spec_path = Path(args.spec_json)
+    cs = compile_spec(_load_spec(spec_path), spec_path)
+
+    if batch:
+        run_dirs = _load_batch_run_dirs(args)
+        if not run_dirs:
+            ap.error("empty batch run_dir list")
+        _run_batch(args, cs, run_dirs)
+        return
+
+    _write_verdict(verify_run(Path(args.run_dir), cs), args.output_json)
+
+
 if __name__ == "__main__":
     main()
-
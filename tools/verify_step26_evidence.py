@@ -20,6 +20,9 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
+sys.path.insert(0, str(Path(__file__).resolve().parent / "v12"))
+from evidence_io_v0 import LineIndex, open_line_index  # noqa: E402
+
 
 REQUIRED_FILES = [
     "run_manifest.json",
@@ -43,14 +46,11 @@ def _read_json(path: Path) -> Dict[str, Any]:
         return json.load(f)
 
 
-def _read_jsonl_line(path: Path, line_1based: int) -> Dict[str, Any]:
+def _read_jsonl_line(index: LineIndex, line_1based: int) -> Dict[str, Any]:
     if line_1based <= 0:
         raise ValueError(f"line must be 1-based positive int, got {line_1based}")
-    with path.open("r", encoding="utf-8") as f:
-        for i, raw in enumerate(f, start=1):
-            if i == line_1based:
-                return json.loads(raw)
-    raise IndexError(f"line out of range: {path.name}:{line_1based}")
+    # one seek via the persisted byte-offset index (no rescan per ref)
+    return json.loads(index.line(line_1based))
 
 
 def _filelist_contains(filelist_path: Path, required: List[str]) -> List[str]:
@@ -158,6 +158,22 @@ def verify(run_dir: Path) -> Tuple[bool, List[str]]:
     needed_ref_files = {"e_probes.jsonl", "mf_stats_ticks.jsonl", "comfort_ticks.jsonl"}
 
     # parse decision_trace line-by-line (lightweight)
+    ref_indexes: Dict[str, LineIndex] = {}
+    try:
+        for base in sorted(needed_ref_files):
+            ref_indexes[base] = open_line_index(run_dir / base)
+        _verify_decision_trace_refs(dt_path, needed_ref_files, ref_indexes, errors)
+    finally:
+        for ix in ref_indexes.values():
+            ix.close()
+
+    ok = len(errors) == 0
+    return ok, errors
+
+
+def _verify_decision_trace_refs(
+    dt_path: Path, needed_ref_files: set, ref_indexes: Dict[str, LineIndex], errors: List[str]
+) -> None:
     with dt_path.open("r", encoding="utf-8") as f:
         for idx, raw in enumerate(f, start=1):
             raw = raw.strip()
@@ -202,13 +218,10 @@ def verify(run_dir: Path) -> Tuple[bool, List[str]]:
                 if base not in needed_ref_files:
                     continue
                 try:
-                    _ = _read_jsonl_line(run_dir / base, r.line)
+                    _ = _read_jsonl_line(ref_indexes[base], r.line)
                 except Exception as e:
                     errors.append(f"tick={rec.get('tick')}: broken ref {base}:{r.line} ({e})")
 
-    ok = len(errors) == 0
-    return ok, errors
-
 
 def main() -> int:
     ap = argparse.ArgumentParser()